@@ -3,12 +3,56 @@ from __future__ import annotations
 import argparse
 import os
 import atexit
+import signal
 import time
 
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--dev", action="store_true")
+    storage = parser.add_mutually_exclusive_group()
+    storage.add_argument(
+        "--journal",
+        action="store_true",
+        help="append per-command changes to a journal instead of rewriting the save",
+    )
+    storage.add_argument(
+        "--sharded",
+        action="store_true",
+        help="store each century in its own file, loaded on first visit",
+    )
+    storage.add_argument(
+        "--sqlite",
+        action="store_true",
+        help="keep the save in an SQLite database (save.db)",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="only store tiles that differ from the generated world (JSON saves)",
+    )
+    parser.add_argument(
+        "--save-codec",
+        choices=("json", "binary"),
+        default="json",
+        help="snapshot encoding; existing saves in either format still load",
+    )
+    parser.add_argument(
+        "--durability",
+        choices=("always", "turn-batch", "exit-only"),
+        default="always",
+        help="write every turn, every few turns/seconds, or only on exit",
+    )
+    parser.add_argument(
+        "--map-size",
+        metavar="WxH",
+        help="map size for a new save (default 30x30); existing saves keep theirs",
+    )
+    parser.add_argument(
+        "--eras",
+        type=int,
+        help="number of centuries for a new save (default 11)",
+    )
     args = parser.parse_args()
 
     dev = args.dev or os.environ.get("MUTANTS2_DEV") == "1"
@@ -37,7 +81,27 @@ def main() -> None:
     from mutants2.engine.gen import daily_topup_if_needed, seed_for_cli
     from mutants2.engine import loop
 
+    persistence.JOURNAL_MODE = args.journal
+    persistence.SAVE_CODEC = args.save_codec
+    persistence.SHARD_MODE = args.sharded
+    persistence.SQLITE_MODE = args.sqlite
+    persistence.DELTA_MODE = args.delta
+    persistence.DURABILITY = args.durability
+    if args.map_size or args.eras:
+        default = world_mod.WorldConfig()
+        try:
+            width, height = default.width, default.height
+            if args.map_size:
+                w_raw, _, h_raw = args.map_size.lower().partition("x")
+                width, height = int(w_raw), int(h_raw or w_raw)
+            persistence.NEW_WORLD = world_mod.WorldConfig(
+                width, height, args.eras or default.eras
+            )
+        except ValueError as exc:
+            parser.error(f"invalid world configuration: {exc}")
     p, ground, monsters, seeded, save = persistence.load()
+    persistence.start_writer()
+    atexit.register(persistence.stop_writer)
     ground_map: dict[TileKey, list[ItemInstance]] = ground
     monsters_map: dict[TileKey, list[MonsterRec]] = monsters
     w = world_mod.World(
@@ -46,8 +110,12 @@ def main() -> None:
         monsters_map,
         seed_monsters=False,
         global_seed=save.global_seed,
+        normalized=True,
+        config=save.world,
     )
+    persistence.attach_world(w, save)
     seed_for_cli(w)
+    w.year(p.year)
 
     if p.clazz is None:
         w.reset_all_aggro()
@@ -70,6 +138,16 @@ def main() -> None:
     save.next_upkeep_tick = time.monotonic() + loop.TICK_SECONDS
     ctx = make_context(p, w, save, dev=dev)
     ctx.tick_handle = loop.start_realtime_tick(p, w, save, ctx)
+
+    # Unwind through the ``finally`` below so deferred saves are written.
+    def _on_signal(signum: int, _frame: object) -> None:
+        raise SystemExit(128 + signum)
+
+    stop_signals = [signal.SIGTERM]
+    if hasattr(signal, "SIGHUP"):  # pragma: no cover - not on Windows
+        stop_signals.append(signal.SIGHUP)
+    for sig in stop_signals:
+        signal.signal(sig, _on_signal)
     try:
         while True:
             try:
@@ -80,7 +158,11 @@ def main() -> None:
             if ctx.dispatch_line(line):
                 break
     finally:
+        for sig in stop_signals:
+            signal.signal(sig, signal.SIG_IGN)
         loop.stop_realtime_tick(getattr(ctx, "tick_handle", None))
+        persistence.checkpoint(p, w, save)
+        persistence.stop_writer()
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -8,6 +8,7 @@ from typing import Mapping, cast
 from ..engine import persistence, items, monsters, combat
 from ..engine.items_resolver import (
     resolve_key_prefix,
+    keys_with_prefix,
     get_item_def_by_key,
     resolve_key,
     resolve_item,
@@ -37,6 +38,7 @@ from ..engine.state import (
     CharacterProfile,
     apply_profile,
     profile_from_raw,
+    summarize_profile,
     ensure_first_time_ion_grant,
 )
 from ..engine.types import ItemInstance
@@ -47,7 +49,7 @@ from ..engine.gen import (
 )
 from ..engine.macros import MacroStore
 from ..engine.types import Direction
-from ..engine.world import ALLOWED_CENTURIES, LOWEST_CENTURY, HIGHEST_CENTURY
+from ..engine.world import ALLOWED_CENTURIES, LOWEST_CENTURY
 from ..ui.help import MACROS_HELP, ABBREVIATIONS_NOTE, COMMANDS_HELP, USAGE
 from ..ui.strings import (
     GET_WHAT,
@@ -177,14 +179,11 @@ def class_menu(p, w, save, context=None, *, in_game: bool) -> bool:
     print("Choose your class:")
     for i, name in enumerate(CLASS_LIST, 1):
         key = class_key(name)
-        prof = save.profiles.get(key)
-        if isinstance(prof, dict):
-            prof = profile_from_raw(prof)
-            save.profiles[key] = prof
-        if isinstance(prof, CharacterProfile):
-            level = getattr(prof, "level", 1)
-            year = prof.year
-            x, y = prof.positions.get(year, (0, 0))
+        summary = save.profile_index.get(key)
+        if summary is None and key in save.profiles:
+            summary = summarize_profile(save.profiles[key])
+        if summary is not None:
+            level, year, x, y = summary.level, summary.year, summary.x, summary.y
         else:
             level = 1
             year = ALLOWED_CENTURIES[0]
@@ -205,7 +204,7 @@ def class_menu(p, w, save, context=None, *, in_game: bool) -> bool:
             p.ready_to_combat_id = None
             p.ready_to_combat_name = None
             w.reset_all_aggro()
-            persistence.save(p, w, save)
+            persistence.checkpoint(p, w, save)
             print("Goodbye.")
             raise SystemExit
         if s == "?":
@@ -246,7 +245,7 @@ def class_menu(p, w, save, context=None, *, in_game: bool) -> bool:
         w.year(p.year)
         p.clazz = k
         ensure_first_time_ion_grant(p, save)
-        persistence.save(p, w, save)
+        persistence.checkpoint(p, w, save)
         if context is not None:
             context.in_game = True
         return True
@@ -343,14 +342,17 @@ def make_context(p, w, save, *, dev: bool = False):
             print(generic_fb("Invalid year."))
             context._suppress_room_render = True
             return False
-        if year_input < LOWEST_CENTURY or year_input > HIGHEST_CENTURY:
+        last = w.config.last_century
+        if year_input < LOWEST_CENTURY or year_input > last:
             print(
-                generic_fb(f"You can only travel from year 2000 to {HIGHEST_CENTURY}!")
+                generic_fb(
+                    f"You can only travel from year {LOWEST_CENTURY} to {last}!"
+                )
             )
             context._needs_render = False
             context._suppress_room_render = True
             return False
-        target = max(c for c in ALLOWED_CENTURIES if c <= year_input)
+        target = year_input - (year_input - LOWEST_CENTURY) % 100
         steps = abs(target - p.year) // 100
         cost = ION_TRAVEL_COST * steps
         if p.ions < cost:
@@ -503,10 +505,8 @@ def make_context(p, w, save, *, dev: bool = False):
         key = resolve_key(inst["key"])
         idef = get_item_def_by_key(key)
         p.wielded_weapon = inst
-        mon = w.monster_here(p.year, p.x, p.y)
-        ready = (
-            p.ready_to_combat_id and mon and str(mon.get("id")) == p.ready_to_combat_id
-        )
+        target = w.monster_by_id(p.ready_to_combat_id or "")
+        ready = target is not None and target[0] == (p.year, p.x, p.y)
         if not ready:
             print(generic_fb("***"))
             print(generic_fb("You're not ready to combat anyone."))
@@ -731,7 +731,7 @@ def make_context(p, w, save, *, dev: bool = False):
                 turn = True
         elif cmd == "class":
             macro_store.save_profile(class_key(p.clazz or "default"))
-            persistence.save(p, w, save)
+            persistence.checkpoint(p, w, save)
             stop_realtime_tick(context.tick_handle)
             context.tick_handle = None
             context.in_game = False
@@ -809,6 +809,7 @@ def make_context(p, w, save, *, dev: bool = False):
   debug item list                     Show raw ground items here.
   debug item count                    Count ground items in current year.
   debug item topup                    Run item top-up for current year.
+  debug find item <prefix>            List matching ground items by walking distance.
   debug mon here                      Toggle a Mutant on this tile.
   debug mon clear                     Remove all monsters in this room.
   debug mon clear year                Remove all monsters in this year.
@@ -820,6 +821,7 @@ def make_context(p, w, save, *, dev: bool = False):
   debug topup                         Run daily item top-up now.
   debug reset                         Delete save file.
   debug wipe                          Clear world and profiles in memory.
+  debug durability [LEVEL]            Show or set always|turn-batch|exit-only.
   macro keys debug on|off             Toggle macro key debug (if available).
 """
                 )
@@ -839,17 +841,27 @@ def make_context(p, w, save, *, dev: bool = False):
                 print("Debug commands are available only in dev mode.")
             else:
                 if args and args[0] == "reset":
-                    try:
-                        persistence.SAVE_PATH.unlink()
+                    if persistence.reset(save):
                         print("OK: save reset.")
-                    except FileNotFoundError:
+                    else:
                         print("Save file not found.")
                 elif args and args[0] == "wipe":
-                    w.ground.clear()
-                    w.seeded_years.clear()
-                    w._monsters.clear()
+                    w.wipe()
                     save.profiles.clear()
+                    save.profile_index.clear()
                     print("OK: world wiped.")
+                elif args and args[0] == "durability":
+                    if len(args) == 1:
+                        print(f"Durability: {persistence.DURABILITY}.")
+                    elif args[1] in persistence.DURABILITY_LEVELS:
+                        persistence.DURABILITY = args[1]
+                        persistence.checkpoint(p, w, save)
+                        print(f"OK: durability set to {args[1]}.")
+                    else:
+                        print(
+                            "Usage: debug durability "
+                            + "|".join(persistence.DURABILITY_LEVELS)
+                        )
                 elif args[:2] == ["item", "add"] and len(args) >= 3:
                     name_or_key = args[2]
                     extra = args[3:]
@@ -878,7 +890,7 @@ def make_context(p, w, save, *, dev: bool = False):
                         w.add_ground_item(p.year, p.x, p.y, inst)
                     print(f"OK: added {count} x {idef.name}.")
                 elif args[:2] == ["item", "clear"]:
-                    w.ground.pop((p.year, p.x, p.y), None)
+                    w.clear_ground(p.year, p.x, p.y)
                     print("OK: cleared ground.")
                 elif args[:2] == ["item", "list"]:
                     names = [it.name for it in w.items_on_ground(p.year, p.x, p.y)]
@@ -893,6 +905,16 @@ def make_context(p, w, save, *, dev: bool = False):
                     print(
                         f"Item top-up complete for {p.year}: {before} → {after} (target: {target})."
                     )
+                elif args[:2] == ["find", "item"] and len(args) >= 3:
+                    prefix = " ".join(args[2:])
+                    keys = keys_with_prefix(prefix, w.ground.item_keys(p.year))
+                    hits = w.nearest_items(p.year, p.x, p.y, keys)
+                    if not hits:
+                        print(f"No {prefix} on the ground in year {p.year}.")
+                        return False
+                    for x, y, dist, key in hits:
+                        name = get_item_def_by_key(key).name
+                        print(f"{name} at ({x}, {y}), {dist} away.")
                 elif args[:3] == ["mon", "clear", "year"]:
                     total = 0
                     coords = {(x, y) for x, y, _m in w.monster_positions(p.year)}
@@ -928,7 +950,7 @@ def make_context(p, w, save, *, dev: bool = False):
                     and len(args) >= 3
                     and args[2].isdigit()
                 ):
-                    import random
+                    from ..engine.rng import hrand
 
                     n = int(args[2])
                     radius = 4
@@ -942,9 +964,7 @@ def make_context(p, w, save, *, dev: bool = False):
                             if w.has_monster(p.year, nx, ny):
                                 continue
                             coords.append((nx, ny))
-                    rng = random.Random(
-                        hash((save.global_seed, p.year, p.x, p.y, "spawn_near"))
-                    )
+                    rng = hrand(save.global_seed, p.year, p.x, p.y, "spawn_near")
                     rng.shuffle(coords)
                     placed = 0
                     for x, y in coords:
@@ -1058,7 +1078,10 @@ def make_context(p, w, save, *, dev: bool = False):
         context._needs_render = render
         context._suppress_room_render = not render
         context._last_turn_consumed = turn
-        persistence.save(p, w, save)
+        if context.running:
+            persistence.save(p, w, save)
+        else:
+            persistence.checkpoint(p, w, save)
         return True
 
     def dispatch_macro(cmd_raw: str) -> bool:
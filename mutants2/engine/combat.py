@@ -61,7 +61,7 @@ def handle_monster_death(ctx: SimpleNamespace, mon) -> None:
 
 
 def player_attack(ctx: SimpleNamespace, weapon_key: str):
-    """Perform a single attack against the first monster here.
+    """Attack the monster the player is ready to combat, or the first one here.
 
     Returns ``(damage, killed, name)`` where ``name`` is the monster's name.
     """
@@ -69,7 +69,14 @@ def player_attack(ctx: SimpleNamespace, weapon_key: str):
     p = ctx.player
     w = ctx.world
 
-    mon = w.monster_here(p.year, p.x, p.y)
+    mid = None
+    mon = None
+    if p.ready_to_combat_id:
+        hit = w.monster_by_id(p.ready_to_combat_id)
+        if hit is not None and hit[0] == (p.year, p.x, p.y):
+            mid, mon = hit[1].id, hit[1]
+    if mon is None:
+        mon = w.monster_here(p.year, p.x, p.y)
     if not mon:
         return 0, False, ""
     item = items_mod.REGISTRY.get(weapon_key)
@@ -80,7 +87,7 @@ def player_attack(ctx: SimpleNamespace, weapon_key: str):
     raw = base + str_bonus - ac_red
     dmg = max(1, raw)
     name = str(mon.get("name", ""))
-    killed = w.damage_monster(p.year, p.x, p.y, dmg, p)
+    killed = w.damage_monster(p.year, p.x, p.y, dmg, p, mid=mid)
     if killed:
         handle_monster_death(ctx, mon)
     return dmg, killed, name
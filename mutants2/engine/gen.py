@@ -1,14 +1,30 @@
-import random
 import datetime
-from typing import Tuple
-
-from .world import Grid, World, GRID_MIN, GRID_MAX, ALLOWED_CENTURIES
+import functools
+from collections.abc import Callable
+from typing import cast
+
+from .world import (
+    DIR,
+    EXIT_BITS,
+    OPPOSITE,
+    ORDER,
+    Grid,
+    World,
+    WorldConfig,
+    GRID_MIN,
+    GRID_MAX,
+    grid_bounds,
+)
 from .items import SPAWNABLE_KEYS
 from .monsters import SPAWN_KEYS
+from .rng import KeyedRandom, fast_random, hrand, stable_seed
 
 WIDTH = GRID_MAX - GRID_MIN
 HEIGHT = GRID_MAX - GRID_MIN
 SEED = 42
+# Bump whenever a change alters what a given seed generates; delta saves made
+# against an older baseline cannot be rebuilt and are discarded.
+GEN_VERSION = 7
 
 # ---------------------------------------------------------------------------
 # Item seeding / density helpers
@@ -23,20 +39,65 @@ def _item_target(global_seed: int, year: int) -> int:
 
     The target is sampled once per year using a RNG derived from the world's
     global seed and the year number.  This ensures that both seeding and debug
-    top-ups converge on the same per-year target.
+    top-ups converge on the same per-year target.  It does not grow with the
+    map, so larger maps are sparser rather than costlier.
     """
 
-    rng = random.Random(hash((global_seed, year, "item_target_v1")))
+    rng = hrand(global_seed, year, "item_target_v1")
     lo = int(ITEM_TARGET_MEAN * (1 - ITEM_TARGET_SPREAD))
     hi = int(ITEM_TARGET_MEAN * (1 + ITEM_TARGET_SPREAD))
     return rng.randint(lo, hi)
 
 
-def _rng_for_year(global_seed: int, year: int, tag: str) -> random.Random:
-    return random.Random(hash((global_seed, year, tag)))
-
+def _sample_tiles(
+    world: World,
+    year: int,
+    need: int,
+    rng: KeyedRandom,
+    free: Callable[[int, int], bool],
+) -> list[tuple[int, int]]:
+    """Pick up to ``need`` distinct random tiles of ``year`` where ``free`` holds.
+
+    Tiles are drawn at random and kept when free, so the cost follows ``need``
+    rather than the size of the map.  When a bounded number of draws is not
+    enough, the rest come from a scan of the tiles without ground items, which
+    every ``free`` here implies.  Fewer than ``need`` come back only when the
+    map runs out of free tiles.
+    """
 
-def _topup_to_target(world: World, year: int, target: int, rng: random.Random) -> int:
+    width = world.config.width
+    x_min, y_min, _x_max, _y_max = grid_bounds(width, world.config.height)
+    cells = world.walkable_count(year)
+    picked: dict[tuple[int, int], None] = {}
+    for _ in range(8 * need + 64):
+        if len(picked) >= need:
+            return list(picked)
+        row, col = divmod(rng.randrange(cells), width)
+        tile = (col + x_min, row + y_min)
+        if tile not in picked and free(*tile):
+            picked[tile] = None
+    if len(picked) < need:
+        # Row-major, like ``walkable_coords``, so the pick does not depend on
+        # the order of the empty-tile index.
+        rest = sorted(
+            (t for t in world.empty_walkables(year) if t not in picked and free(*t)),
+            key=lambda t: (t[1], t[0]),
+        )
+        picked.update(
+            dict.fromkeys(rng.sample(rest, min(need - len(picked), len(rest))))
+        )
+    return list(picked)
+
+
+def _item_free(world: World, year: int) -> Callable[[int, int], bool]:
+    return lambda x, y: world.item_at(year, x, y) is None
+
+
+def _rng_for_year(global_seed: int, year: int, tag: str) -> KeyedRandom:
+    return hrand(global_seed, year, tag)
+
+
+def _topup_to_target(world: World, year: int, target: int, rng: KeyedRandom) -> int:
     """Ensure ``year`` contains exactly ``target`` items.
 
     Returns the number of items placed.  Item placement prefers empty walkable
@@ -48,22 +109,10 @@ def _topup_to_target(world: World, year: int, target: int, rng: random.Random) -
     if need <= 0:
         return 0
 
-    walkables = [
-        (x, y)
-        for (x, y) in world.walkable_coords(year)
-        if world.item_at(year, x, y) is None
-    ]
-    if not walkables:
-        return 0
-    rng.shuffle(walkables)
-    placed = 0
-    for x, y in walkables:
-        item_key = rng.choice(SPAWNABLE_KEYS)
-        world.place_item(year, x, y, item_key)
-        placed += 1
-        if placed >= need:
-            break
-    return placed
+    tiles = _sample_tiles(world, year, need, rng, _item_free(world, year))
+    for x, y in tiles:
+        world.place_item(year, x, y, rng.choice(SPAWNABLE_KEYS))
+    return len(tiles)
 
 
 def debug_item_topup(world: World, year: int, global_seed: int) -> tuple[int, int, int]:
@@ -81,9 +130,195 @@ def debug_item_topup(world: World, year: int, global_seed: int) -> tuple[int, in
     return before, after, target
 
 
+# ---------------------------------------------------------------------------
+# Maze generation
+# ---------------------------------------------------------------------------
+
+# Chance that a wall left standing by the spanning tree is knocked down anyway,
+# giving the maze loops instead of a single path between any two rooms.
+MAZE_LOOP_CHANCE = 0.15
+# Rooms within this distance of the origin are left fully open.
+PLAZA_RADIUS = 4
+
+
+# Maps above this many cells get no whole-map tables: the maze is carved in
+# MAZE_CHUNK-sized chunks on first access (see :class:`_ChunkedExits`), room
+# headers are worked out per tile and placements scan the map only when random
+# draws come up short (see :func:`_sample_tiles`).
+TABLE_MAX_CELLS = 1 << 16
+MAZE_CHUNK = 32
+
+_Step = tuple[int, int, int]
+_Wall = tuple[int, int, int, int, bool]
+
+
+def _cell_steps(i: int, width: int, height: int) -> list[_Step]:
+    """``(neighbour, bit, back_bit)`` for each in-bounds step from cell ``i``."""
+
+    row, col = divmod(i, width)
+    out: list[_Step] = []
+    for d in ORDER:
+        dx, dy = DIR[d]
+        if 0 <= col + dx < width and 0 <= row + dy < height:
+            out.append((i + dy * width + dx, EXIT_BITS[d], EXIT_BITS[OPPOSITE[d]]))
+    return out
+
+
+@functools.lru_cache(maxsize=8)
+def _maze_edges(width: int, height: int) -> tuple[list[list[_Step]], list[_Wall]]:
+    """Per-cell steps and every inner wall of a maze, built once per size.
+
+    Walls are ``(cell, neighbour, bit, back_bit, in_plaza)`` tuples.
+    """
+
+    steps = [_cell_steps(i, width, height) for i in range(width * height)]
+    x_min, y_min, _x_max, _y_max = grid_bounds(width, height)
+    walls: list[_Wall] = []
+    for i, cell_steps in enumerate(steps):
+        row, col = divmod(i, width)
+        for j, bit, back in cell_steps:
+            if bit in (EXIT_BITS["east"], EXIT_BITS["north"]):
+                jrow, jcol = divmod(j, width)
+                plaza = max(
+                    abs(col + x_min),
+                    abs(row + y_min),
+                    abs(jcol + x_min),
+                    abs(jrow + y_min),
+                )
+                walls.append((i, j, bit, back, plaza <= PLAZA_RADIUS))
+    return steps, walls
+
+
+def _carve(
+    width: int, height: int, rnd: Callable[[], float], start: int, plaza: bool
+) -> bytearray:
+    """Exit masks of a ``width`` x ``height`` maze grown from cell ``start``.
+
+    With ``plaza`` set, the walls around the grid's centre are all opened.
+    """
+
+    steps, walls = _maze_edges(width, height)
+    exits = bytearray(width * height)
+    visited = bytearray(width * height)
+    visited[start] = 1
+    stack = [start]
+    while stack:
+        i = stack[-1]
+        options = [s for s in steps[i] if not visited[s[0]]]
+        if not options:
+            stack.pop()
+            continue
+        j, bit, back = options[int(rnd() * len(options))]
+        exits[i] |= bit
+        exits[j] |= back
+        visited[j] = 1
+        stack.append(j)
+    for i, j, bit, back, in_plaza in walls:
+        if (plaza and in_plaza) or rnd() < MAZE_LOOP_CHANCE:
+            exits[i] |= bit
+            exits[j] |= back
+    return exits
+
+
+class _ChunkedExits:
+    """Exit masks of a large maze, carved one chunk at a time on first access.
+
+    Each chunk is its own maze seeded from the maze seed and the chunk's
+    position.  Every border between two chunks gets one guaranteed door plus
+    :data:`MAZE_LOOP_CHANCE` of the others, chosen from the pair's own seed so
+    either side can work them out, which keeps the whole map connected.  Only
+    chunks that are looked at take memory.
+    """
+
+    def __init__(self, width: int, height: int, seed: int) -> None:
+        self.width, self.height, self.seed = width, height, seed
+        self._chunks: dict[tuple[int, int], bytearray] = {}
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def _locate(self, i: int) -> tuple[bytearray, int]:
+        row, col = divmod(i, self.width)
+        key = (row // MAZE_CHUNK, col // MAZE_CHUNK)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = self._chunks[key] = self._carve_chunk(*key)
+        cw = min(MAZE_CHUNK, self.width - key[1] * MAZE_CHUNK)
+        return chunk, (row % MAZE_CHUNK) * cw + col % MAZE_CHUNK
+
+    def __getitem__(self, i: int) -> int:
+        chunk, k = self._locate(i)
+        return chunk[k]
+
+    def __setitem__(self, i: int, mask: int) -> None:
+        chunk, k = self._locate(i)
+        chunk[k] = mask
+
+    def _doors(self, cr: int, cc: int, side: str, length: int) -> list[int]:
+        """Offsets of the openings in the ``side`` border of chunk ``(cr, cc)``."""
+
+        rng = hrand(self.seed, cr, cc, side, "maze_door_v1")
+        door = rng.randrange(length)
+        return [
+            k for k in range(length) if k == door or rng.random() < MAZE_LOOP_CHANCE
+        ]
+
+    def _carve_chunk(self, cr: int, cc: int) -> bytearray:
+        r0, c0 = cr * MAZE_CHUNK, cc * MAZE_CHUNK
+        ch = min(MAZE_CHUNK, self.height - r0)
+        cw = min(MAZE_CHUNK, self.width - c0)
+        rnd = fast_random(stable_seed(self.seed, cr, cc, "maze_chunk_v2"))
+        exits = _carve(cw, ch, rnd, 0, plaza=False)
+        east, west = EXIT_BITS["east"], EXIT_BITS["west"]
+        north, south = EXIT_BITS["north"], EXIT_BITS["south"]
+        if c0 + cw < self.width:
+            for k in self._doors(cr, cc, "east", ch):
+                exits[k * cw + cw - 1] |= east
+        if cc > 0:
+            for k in self._doors(cr, cc - 1, "east", ch):
+                exits[k * cw] |= west
+        if r0 + ch < self.height:
+            for k in self._doors(cr, cc, "north", cw):
+                exits[(ch - 1) * cw + k] |= north
+        if cr > 0:
+            for k in self._doors(cr - 1, cc, "north", cw):
+                exits[k] |= south
+
+        # Open the plaza; each side of a wall opens its own half.
+        x_min, y_min, x_max, y_max = grid_bounds(self.width, self.height)
+        for y in range(
+            max(-PLAZA_RADIUS, y_min + r0), min(PLAZA_RADIUS, y_min + r0 + ch - 1) + 1
+        ):
+            for x in range(
+                max(-PLAZA_RADIUS, x_min + c0),
+                min(PLAZA_RADIUS, x_min + c0 + cw - 1) + 1,
+            ):
+                k = (y - y_min - r0) * cw + (x - x_min - c0)
+                for d in ORDER:
+                    nx, ny = x + DIR[d][0], y + DIR[d][1]
+                    if (
+                        max(abs(nx), abs(ny)) <= PLAZA_RADIUS
+                        and x_min <= nx < x_max
+                        and y_min <= ny < y_max
+                    ):
+                        exits[k] |= EXIT_BITS[d]
+        return exits
+
+
 def generate(width: int = WIDTH, height: int = HEIGHT, seed: int = SEED) -> Grid:
-    """Return a fully open grid with the canonical bounds."""
-    return Grid(width, height)
+    """Return the maze for ``seed``.
+
+    A randomized depth-first search carves a spanning tree, so every room is
+    reachable, then :data:`MAZE_LOOP_CHANCE` of the remaining inner walls and
+    every wall of the plaza around the origin are removed.  Mazes above
+    :data:`TABLE_MAX_CELLS` are carved lazily in chunks instead.
+    """
+
+    if width * height > TABLE_MAX_CELLS:
+        return Grid(width, height, cast(bytearray, _ChunkedExits(width, height, seed)))
+    x_min, y_min, _x_max, _y_max = grid_bounds(width, height)
+    start = -y_min * width - x_min
+    return Grid(width, height, _carve(width, height, fast_random(seed), start, True))
 
 
 def seed_items(world: World, year: int, grid: Grid) -> None:
@@ -97,29 +332,26 @@ def seed_items(world: World, year: int, grid: Grid) -> None:
 
 
 def seed_monsters_for_year(world: World, year: int, global_seed: int) -> None:
-    walkables = list(world.walkable_coords(year))
-    if not walkables:
-        return
-    import random
-
-    rng = random.Random(hash((global_seed, year, "monsters_v1")))
+    rng = _rng_for_year(global_seed, year, "monsters_v1")
     target = _monster_target(world, year)
-    rng.shuffle(walkables)
-    placed = 0
-    for x, y in walkables:
-        if world.item_at(year, x, y) is None:
-            world.place_monster(year, x, y, SPAWN_KEYS[0])
-            placed += 1
-            if placed >= target:
-                break
+    tiles = _sample_tiles(world, year, target, rng, _item_free(world, year))
+    for slot, (x, y) in enumerate(tiles):
+        world.place_monster(year, x, y, SPAWN_KEYS[0], slot=slot)
 
 
 def _monster_target(world: World, year: int) -> int:
-    walkables = list(world.walkable_coords(year))
-    if not walkables:
-        return 0
+    return monster_quota(world.config)
+
+
+def monster_quota(config: WorldConfig) -> int:
+    """Monsters seeded into each century of a world with ``config``.
+
+    Sized for the default map, like the item target.
+    """
+
+    cells = min(config.width * config.height, WIDTH * HEIGHT)
     rate = 0.06 * 0.5
-    return min(round(0.35 * len(walkables)), max(0, round(rate * len(walkables))))
+    return min(round(0.35 * cells), max(0, round(rate * cells)))
 
 
 def debug_monster_topup(
@@ -135,29 +367,44 @@ def debug_monster_topup(
     need = max(0, target - before)
     if need <= 0:
         return before, before, target
-    walkables = [
-        (x, y)
-        for (x, y) in world.walkable_coords(year)
-        if world.item_at(year, x, y) is None and not world.has_monster(year, x, y)
-    ]
     rng = _rng_for_year(global_seed, year, "debug_mon_topup_v1")
-    rng.shuffle(walkables)
-    placed = 0
-    for x, y in walkables:
+    tiles = _sample_tiles(
+        world,
+        year,
+        need,
+        rng,
+        lambda x, y: world.item_at(year, x, y) is None
+        and not world.has_monster(year, x, y),
+    )
+    for x, y in tiles:
         world.place_monster(year, x, y, SPAWN_KEYS[0])
-        placed += 1
-        if placed >= need:
-            break
     after = world.monster_count(year)
     return before, after, target
 
 
+@functools.lru_cache(maxsize=2)
+def baseline_world(global_seed: int, config: WorldConfig | None = None) -> World:
+    """Return the world a new game with ``global_seed`` starts with.
+
+    The result is shared and must not be modified, other than by generating
+    its centuries with :meth:`World.year`.
+    """
+
+    world = World(global_seed=global_seed, config=config)
+    seed_for_cli(world)
+    return world
+
+
 def seed_for_cli(world: World) -> None:
-    was = world._seed_monsters
-    world._seed_monsters = True
-    for year in ALLOWED_CENTURIES:
-        world.year(year)
-    world._seed_monsters = was
+    """Have every century seeded with monsters when it is first generated.
+
+    Centuries are generated by :meth:`World.year` the first time anything
+    touches them, so startup only pays for the one the player stands in.
+    Seeding does not depend on the order centuries are generated in, so this
+    gives the same world as generating them all up front.
+    """
+
+    world._seed_on_load.update(world.config.centuries)
 
 
 # Daily top-up ----------------------------------------------------------------
@@ -169,25 +416,20 @@ def _today_from_env_or_system(fake_today: str | None) -> datetime.date:
     return datetime.date.today()
 
 
-def _rng_for_day(global_seed: int, year: int, day: datetime.date) -> random.Random:
-    seed = hash((global_seed, year, int(day.strftime("%Y%m%d")), "topup"))
-    return random.Random(seed)
+def _rng_for_day(global_seed: int, year: int, day: datetime.date) -> KeyedRandom:
+    return hrand(global_seed, year, int(day.strftime("%Y%m%d")), "topup")
 
 
 def count_walkable(world: World, year: int) -> int:
-    return sum(1 for _ in world.walkable_coords(year))
+    return world.walkable_count(year)
 
 
 def ground_count(world: World, year: int) -> int:
     return world.ground_items_count(year)
 
 
-def _empty_walkables(world: World, year: int) -> list[Tuple[int, int]]:
-    return [
-        (x, y)
-        for (x, y) in world.walkable_coords(year)
-        if world.item_at(year, x, y) is None
-    ]
+def _empty_walkables(world: World, year: int) -> list[tuple[int, int]]:
+    return list(world.empty_walkables(year))
 
 
 def daily_topup_year(
@@ -210,6 +452,8 @@ def daily_topup_if_needed(
 
     total = 0
     for yr in world.known_years():
+        if not world.is_loaded(yr):
+            continue  # caught up when the century is loaded
         total += daily_topup_year(world, yr, save.global_seed, today)
 
     save.last_topup_date = today.isoformat()
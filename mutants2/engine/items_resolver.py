@@ -23,16 +23,19 @@ def get_item_def_by_key(raw_key: str):
     return items_mod.REGISTRY.get(key)
 
 
-def resolve_key_prefix(
-    query: str, candidates: Iterable[str] | None = None
-) -> str | None:
+def keys_with_prefix(query: str, candidates: Iterable[str] | None = None) -> list[str]:
+    """Item keys among ``candidates`` whose key or name starts with ``query``.
+
+    An exact key match is returned on its own.
+    """
+
     t = normalize_token(query)
     if not t:
-        return None
+        return []
     canon = t.replace(" ", "_")
     search = candidates if candidates is not None else items_mod.REGISTRY.keys()
     if canon in search and canon in items_mod.REGISTRY:
-        return canon
+        return [canon]
     matches = []
     for key in search:
         item = items_mod.REGISTRY.get(key)
@@ -41,6 +44,13 @@ def resolve_key_prefix(
         name_token = normalize_token(item.name).replace(" ", "_")
         if key.startswith(canon) or name_token.startswith(canon):
             matches.append(key)
+    return matches
+
+
+def resolve_key_prefix(
+    query: str, candidates: Iterable[str] | None = None
+) -> str | None:
+    matches = keys_with_prefix(query, candidates)
     if matches:
         if len(matches) == 1 or candidates is not None:
             return matches[0]
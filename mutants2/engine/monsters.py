@@ -1,4 +1,7 @@
+import math
+from collections.abc import Iterator, Mapping, MutableMapping
 from dataclasses import dataclass
+from typing import Any
 
 from .items import norm_name
 
@@ -28,42 +31,310 @@ REGISTRY = {
 SPAWN_KEYS = tuple(REGISTRY.keys())
 
 
+class MonsterRecord(MutableMapping[str, Any]):
+    """A monster's state, held in typed slots.
+
+    ``name`` is derived from the key and id unless one is set explicitly.  The
+    record also reads and writes like the dicts monsters used to be, for code
+    that indexes it by field name; only the names in :attr:`FIELDS` exist and
+    ``"id"`` is missing until an id is assigned.
+
+    While the monster is placed in a world, ``pos`` is its ``(year, x, y)``
+    tile and ``aggro_index`` that year's ``{id(record): record}`` map of
+    aggro monsters, which the record joins and leaves as ``aggro`` changes.
+    """
+
+    FIELDS = (
+        "key",
+        "name",
+        "aggro",
+        "seen",
+        "yelled_once",
+        "id",
+        "hp",
+        "loot_ions",
+        "loot_riblets",
+    )
+    _FIELD_SET = frozenset(FIELDS)
+
+    __slots__ = (
+        "_aggro",
+        "_name",
+        "aggro_index",
+        "hp",
+        "id",
+        "key",
+        "loot_ions",
+        "loot_riblets",
+        "pos",
+        "seen",
+        "yelled_once",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        id: int | None = None,
+        hp: int | None = None,
+        aggro: bool = False,
+        seen: bool = False,
+        yelled_once: bool = False,
+        loot_ions: int = 0,
+        loot_riblets: int = 0,
+        name: str | None = None,
+    ) -> None:
+        self.key = key
+        self.id = id
+        self.hp = REGISTRY[key].base_hp if hp is None else hp
+        self.seen = seen
+        self.yelled_once = yelled_once
+        self.loot_ions = loot_ions
+        self.loot_riblets = loot_riblets
+        self._aggro = aggro
+        self._name = name
+        self.pos: tuple[int, int, int] | None = None
+        self.aggro_index: dict[int, MonsterRecord] | None = None
+
+    @classmethod
+    def from_mapping(cls, m: Mapping[str, Any]) -> "MonsterRecord":
+        """Copy a record or record-shaped mapping into a new, unplaced record."""
+
+        if isinstance(m, MonsterRecord):
+            return m.copy()
+        fields = {k: v for k, v in m.items() if k in cls._FIELD_SET and k != "key"}
+        return cls(str(m["key"]), **fields)
+
+    def copy(self) -> "MonsterRecord":
+        return MonsterRecord(
+            self.key,
+            id=self.id,
+            hp=self.hp,
+            aggro=self._aggro,
+            seen=self.seen,
+            yelled_once=self.yelled_once,
+            loot_ions=self.loot_ions,
+            loot_riblets=self.loot_riblets,
+            name=self._name,
+        )
+
+    @property
+    def aggro(self) -> bool:
+        return self._aggro
+
+    @aggro.setter
+    def aggro(self, value: bool) -> None:
+        self._aggro = value
+        if self.aggro_index is not None:
+            if value:
+                self.aggro_index[id(self)] = self
+            else:
+                self.aggro_index.pop(id(self), None)
+
+    @property
+    def name(self) -> str:
+        if self._name is not None:
+            return self._name
+        base = REGISTRY[self.key].name
+        return base if self.id is None else f"{base}-{self.id:04d}"
+
+    @name.setter
+    def name(self, value: str | None) -> None:
+        self._name = value
+
+    # Mapping view ---------------------------------------------------------
+
+    def __getitem__(self, field: str) -> Any:
+        if field not in self._FIELD_SET or (field == "id" and self.id is None):
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        if field not in self._FIELD_SET or (field == "id" and self.id is None):
+            return default
+        return getattr(self, field)
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        if field not in self._FIELD_SET:
+            raise KeyError(field)
+        setattr(self, field, value)
+
+    def __delitem__(self, field: str) -> None:
+        if field != "id" or self.id is None:
+            raise KeyError(field)
+        self.id = None
+
+    def __contains__(self, field: object) -> bool:
+        return field in self._FIELD_SET and (field != "id" or self.id is not None)
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self.FIELDS:
+            if field != "id" or self.id is not None:
+                yield field
+
+    def __len__(self) -> int:
+        return len(self.FIELDS) - (self.id is None)
+
+    def _values(self) -> tuple[Any, ...]:
+        return (
+            self.key,
+            self.name,
+            self._aggro,
+            self.seen,
+            self.yelled_once,
+            self.id,
+            self.hp,
+            self.loot_ions,
+            self.loot_riblets,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MonsterRecord):
+            return self._values() == other._values()
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"MonsterRecord({dict(self)!r})"
+
+
+MAX_ID_DIGITS = 4
+"""Default widest monster id; once every id of one width is taken the next is
+used.  Worlds with more monsters than fit get wider ids from :func:`id_digits`."""
+
+
+def id_digits(count: int) -> int:
+    """Id width that leaves room for ``count`` ids, at least :data:`MAX_ID_DIGITS`."""
+
+    digits = MAX_ID_DIGITS
+    room = 9 * 10 ** (digits - 1)
+    while room < count:
+        digits += 1
+        room += 9 * 10 ** (digits - 1)
+    return digits
+
+
 class MonsterIdAllocator:
-    """Allocate unique 4-digit monster ids."""
+    """Allocate unique monster ids, four digits wide to begin with.
+
+    Fresh ids walk a seeded permutation of each width's range in turn, so
+    nothing is built up front and every operation is O(1).  The first
+    ``reserved`` steps of the walk are kept for :meth:`claim`, which hands out
+    the id at a given step whenever it is asked.  Released ids are handed out
+    again last-in first-out before any fresh one.  ``_taken`` holds every id in
+    use; ids noted as taken are skipped when the walk or the released stack
+    reaches them.
+    """
 
-    def __init__(self, rng):
-        self._free = list(range(1000, 10000))
-        rng.shuffle(self._free)
+    def __init__(self, rng, max_digits: int | None = None, *, reserved: int = 0):
+        self._rng = rng
+        self._max_digits = MAX_ID_DIGITS if max_digits is None else max_digits
+        self._taken: set[int] = set()
+        self._released: list[int] = []
+        # ``(low, span, step, offset)`` of each width, drawn on first use.
+        self._widths: list[tuple[int, int, int, int]] = []
+        self._reserved = reserved
+        self._cursor = reserved
+
+    def _width(self, n: int) -> tuple[int, int, int, int]:
+        while len(self._widths) <= n:
+            digits = 4 + len(self._widths)
+            if digits > self._max_digits:
+                raise RuntimeError("monster ids exhausted")
+            low = 10 ** (digits - 1)
+            span = 9 * low
+            # ``i -> (step * i + offset) % span`` visits every id exactly once.
+            step = self._rng.randrange(1, span)
+            while math.gcd(step, span) != 1:
+                step += 1
+            self._widths.append((low, span, step, self._rng.randrange(span)))
+        return self._widths[n]
+
+    def _at(self, pos: int) -> int:
+        n = 0
+        while True:
+            low, span, step, offset = self._width(n)
+            if pos < span:
+                return low + (step * pos + offset) % span
+            pos -= span
+            n += 1
 
     def allocate(self) -> int:
-        return self._free.pop()
+        while self._released:
+            mid = self._released.pop()
+            if mid not in self._taken:
+                self._taken.add(mid)
+                return mid
+        while True:
+            try:
+                mid = self._at(self._cursor)
+            except RuntimeError:
+                return self._unclaimed()
+            self._cursor += 1
+            if mid not in self._taken:
+                self._taken.add(mid)
+                return mid
+
+    def _unclaimed(self) -> int:
+        # Every fresh id is gone; fall back to reserved ones nobody claimed.
+        for pos in range(self._reserved):
+            mid = self._at(pos)
+            if mid not in self._taken:
+                self._taken.add(mid)
+                return mid
+        raise RuntimeError("monster ids exhausted")
+
+    def claim(self, pos: int) -> int:
+        """Take the id at reserved step ``pos``, or a fresh one if it is in use."""
+
+        mid = self._at(pos)
+        if mid in self._taken:
+            return self.allocate()
+        self._taken.add(mid)
+        return mid
 
     def release(self, mid: int) -> None:
-        if 1000 <= mid <= 9999 and mid not in self._free:
-            self._free.append(mid)
+        if mid in self._taken:
+            self._taken.discard(mid)
+            self._released.append(mid)
 
     def note_existing(self, mid: int) -> None:
-        try:
-            self._free.remove(mid)
-        except ValueError:
-            pass
+        self._taken.add(mid)
 
 
-def spawn(key: str, mid: int) -> dict:
+def spawn(key: str, mid: int) -> MonsterRecord:
     """Return default data for a newly spawned monster."""
 
-    name = f"{REGISTRY[key].name}-{mid:04d}"
-    return {
-        "key": key,
-        "name": name,
-        "aggro": False,
-        "seen": False,
-        "yelled_once": False,
-        "id": mid,
-        "hp": REGISTRY[key].base_hp,
-        "loot_ions": 0,
-        "loot_riblets": 0,
-    }
+    return MonsterRecord(key, id=mid)
+
+
+def normalize(entry: Mapping[str, object]) -> MonsterRecord | None:
+    """Return the in-memory record for a stored monster ``entry``.
+
+    Entries without a key yield ``None``.  The name is derived from the id, so
+    stored names are dropped; entries without an id get one from the world's
+    allocator.
+    """
+
+    key = entry.get("key")
+    if key is None:
+        return None
+    hp = entry.get("hp")
+    seen = bool(entry.get("seen", False))
+    aggro = seen and bool(entry.get("aggro", False))
+    yelled = entry.get("yelled_once") or entry.get("has_yelled_this_aggro", False)
+    mid = entry.get("id")
+    return MonsterRecord(
+        str(key),
+        id=int(mid) if mid is not None else None,  # type: ignore[arg-type]
+        hp=int(hp) if hp is not None else None,  # type: ignore[arg-type]
+        aggro=aggro,
+        seen=seen,
+        yelled_once=aggro and bool(yelled),
+        loot_ions=int(entry.get("loot_ions", 0)),  # type: ignore[arg-type]
+        loot_riblets=int(entry.get("loot_riblets", 0)),  # type: ignore[arg-type]
+    )
 
 
 def resolve_prefix(query: str, names: list[str]) -> str | None:
@@ -1,32 +1,67 @@
 from __future__ import annotations
 
+import datetime
 import json
+import logging
 import os
+import sqlite3
+import threading
 import time
-from dataclasses import dataclass, field
+import weakref
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import astuple, dataclass, field, replace
+from functools import partial
 from pathlib import Path
-from typing import Dict, Set, Tuple, Any
+from typing import Any, cast
 
 from .player import Player, class_key
-from .world import World
+from .world import World, WorldConfig
 from . import monsters as monsters_mod
 from .types import ItemInstance, ItemListMut, MonsterRec, TileKey
 from .state import (
     CharacterProfile,
+    ProfileSummary,
     apply_profile,
     profile_from_player,
     profile_from_raw,
     profile_to_raw,
+    summarize_profile,
 )
 from .items_util import coerce_item
 from .macros import MacroStore
 
-from . import gen
+from . import gen, save_codec, save_sqlite
+from .items_resolver import resolve_key
 
 # Bump this when the save format changes in a breaking way. Older saves are
 # discarded rather than migrated.
 SAVE_SCHEMA = 6
 
+# Saves stamped with this version hold canonical item keys, so loading them
+# skips ``resolve_key`` for ground items.  Bump it when item keys are renamed.
+ITEM_KEYS_VERSION = 1
+
+
+@dataclass
+class _WriteCache:
+    """Encoded pieces of the last document written for a :class:`Save`.
+
+    Unchanged tiles and profiles are spliced back in verbatim so a save only
+    re-encodes what changed since the previous write.
+    """
+
+    path: Path
+    world: weakref.ReferenceType[World]
+    epoch: int
+    head: dict[str, Any]
+    upkeep_tick: float
+    profiles: dict[str, Any] = field(default_factory=dict)
+    profile_json: dict[str, str] = field(default_factory=dict)
+    ground_json: dict[str, str] = field(default_factory=dict)
+    monster_json: dict[str, str] = field(default_factory=dict)
+    journal_records: int = 0
+    shards_json: str = ""
+
 
 @dataclass
 class Save:
@@ -35,17 +70,39 @@ class Save:
     global_seed: int = gen.SEED
     last_topup_date: str | None = None
     last_class: str | None = None
-    profiles: Dict[str, CharacterProfile] = field(default_factory=dict)
+    # Profiles other than the loaded one stay raw until their class is picked.
+    profiles: dict[str, CharacterProfile | dict[str, Any]] = field(default_factory=dict)
+    # Level, year and position per profile, for the class menu.
+    profile_index: dict[str, ProfileSummary] = field(default_factory=dict)
     # ``fake_today_override`` is session-only and not persisted
     fake_today_override: str | None = None
     last_upkeep_tick: float = field(default_factory=lambda: time.monotonic())
     next_upkeep_tick: float | None = None  # monotonic deadline for next 10s tick
     max_catchup_ticks: int = 6
     schema: int = SAVE_SCHEMA
+    # Snapshot generation; journal records for other generations are ignored.
+    journal_base: int = 0
+    # Per-century index of a sharded save: monster ids stored in each century
+    # file and the top-up date it was last brought up to.
+    shards: dict[int, dict[str, Any]] = field(default_factory=dict)
+    # Map size and centuries, fixed when the save is created.
+    world: WorldConfig = field(default_factory=lambda: NEW_WORLD)
+    # Session-only cache of the last write; see :func:`save`.
+    _written: _WriteCache | None = field(default=None, repr=False, compare=False)
+    # Session-only count of saves deferred by :data:`DURABILITY` and the
+    # monotonic time of the last save that reached the writer.
+    _deferred: int = field(default=0, repr=False, compare=False)
+    _last_write: float = field(
+        default_factory=time.monotonic, repr=False, compare=False
+    )
 
 
 SAVE_PATH = Path(os.path.expanduser("~/.mutants2/save.json"))
 
+# World configuration for saves created from scratch; existing saves keep the
+# one stored in them.
+NEW_WORLD = WorldConfig()
+
 
 def _serialize_item(val: ItemInstance | str) -> dict[str, Any]:
     inst = coerce_item(val)
@@ -56,32 +113,105 @@ def _deserialize_item(val: Any) -> ItemInstance:
     return coerce_item(val)
 
 
+def _tile_key(name: str) -> TileKey:
+    parts = [int(n) for n in name.split(",")]
+    return (parts[0], parts[1], parts[2])
+
+
+def _parse_ground_tile(val: Any, migrate: bool = True) -> ItemListMut:
+    out: ItemListMut = []
+    for v in val if isinstance(val, list) else [val]:
+        inst = _deserialize_item(v)
+        if migrate:
+            inst["key"] = resolve_key(inst["key"])
+        out.append(inst)
+    return out
+
+
+def _parse_monster_tile(val: Any) -> list[MonsterRec]:
+    entries = val if isinstance(val, list) else [val]
+    return [m for m in map(monsters_mod.normalize, entries) if m is not None]
+
+
+def _read_snapshot() -> (
+    tuple[dict[str, Any], dict[TileKey, ItemListMut], dict[TileKey, list[MonsterRec]]]
+):
+    """Read ``SAVE_PATH`` with whichever codec its header names.
+
+    Journal records are replayed on top before returning.
+    """
+
+    if db_path().exists():
+        data, raw_ground, raw_monsters = save_sqlite.read(db_path())
+        migrate = data.get("item_keys") != ITEM_KEYS_VERSION
+        ground = {k: _parse_ground_tile(v, migrate) for k, v in raw_ground.items()}
+        monsters = {k: _parse_monster_tile(v) for k, v in raw_monsters.items()}
+        return data, ground, monsters
+    with open(SAVE_PATH, "rb") as fh:
+        blob = fh.read()
+    if save_codec.is_binary(blob):
+        try:
+            data, ground, monsters = save_codec.decode(blob)
+        except ValueError:
+            return {}, {}, {}  # an older binary format: an incompatible save
+    else:
+        data = json.loads(blob)
+        migrate = data.get("item_keys") != ITEM_KEYS_VERSION
+        ground = {
+            _tile_key(k): _parse_ground_tile(v, migrate)
+            for k, v in data.get("ground", {}).items()
+        }
+        monsters = {
+            _tile_key(k): _parse_monster_tile(v)
+            for k, v in data.get("monsters", {}).items()
+        }
+    _replay_journal(data, ground, monsters)
+    if data.get("baseline") == gen.GEN_VERSION:
+        _apply_baseline(data, ground, monsters)
+    # Empty tiles only matter as overrides of the baseline.
+    for tiles in (ground, monsters):
+        if not all(tiles.values()):
+            for key in [k for k, v in tiles.items() if not v]:
+                del tiles[key]
+    return data, ground, monsters
+
+
 def load() -> tuple[
     Player,
     dict[TileKey, ItemListMut],
     dict[TileKey, list[MonsterRec]],
-    Set[int],
+    set[int],
     Save,
 ]:
+    if _writer is not None:
+        _writer.flush()
     try:
-        with open(SAVE_PATH) as fh:
-            data = json.load(fh)
+        data, ground, monsters_data = _read_snapshot()
         data.pop("walls", None)
         data.pop("blocked", None)
-        if data.get("schema") != SAVE_SCHEMA:
+        if (
+            data.get("schema") != SAVE_SCHEMA
+            or data.get("baseline", gen.GEN_VERSION) != gen.GEN_VERSION
+        ):
             print("Incompatible save schema; deleting old save and starting fresh.")
-            try:
-                SAVE_PATH.unlink()
-            except FileNotFoundError:
-                pass
+            SAVE_PATH.unlink(missing_ok=True)
+            db_path().unlink(missing_ok=True)
             raise FileNotFoundError
 
-        profiles: Dict[str, CharacterProfile] = {}
+        profiles: dict[str, CharacterProfile | dict[str, Any]] = {}
         profiles_raw = data.get("profiles", {})
         if isinstance(profiles_raw, dict):
             for k, v in profiles_raw.items():
-                prof = profile_from_raw(v)
-                profiles[class_key(k)] = prof
+                profiles[class_key(k)] = v
+        index_raw = data.get("profile_index", {})
+        profile_index = {
+            k: (
+                ProfileSummary(*index_raw[k])
+                if k in index_raw
+                else summarize_profile(cast(dict, v))
+            )
+            for k, v in profiles.items()
+        }
 
         last_class_raw = data.get("last_class")
         last_class = (
@@ -97,12 +227,13 @@ def load() -> tuple[
             active_class = next(iter(profiles))
 
         if active_class:
-            prof = profiles[active_class]
+            prof = profile_from_raw(cast(dict, profiles[active_class]))
+            profiles[active_class] = prof
             player = Player(year=prof.year, clazz=active_class)
             apply_profile(player, prof)
         else:
             year = int(data.get("year", 2000))
-            positions: Dict[int, Tuple[int, int]] = {
+            positions: dict[int, tuple[int, int]] = {
                 int(k): (v.get("x", 0), v.get("y", 0))
                 for k, v in data.get("positions", {}).items()
             }
@@ -133,6 +264,7 @@ def load() -> tuple[
             prof = profile_from_player(player)
             apply_profile(player, prof)
             profiles[clazz] = prof
+            profile_index[clazz] = summarize_profile(prof)
             last_class = clazz
 
             macro_dir = MacroStore.MACRO_DIR
@@ -150,54 +282,6 @@ def load() -> tuple[
                     except Exception:
                         pass
 
-        ground: dict[TileKey, ItemListMut] = {}
-        for key, val in data.get("ground", {}).items():
-            parts = [int(n) for n in key.split(",")]
-            coord: TileKey = (parts[0], parts[1], parts[2])
-            if isinstance(val, list):
-                ground[coord] = [_deserialize_item(v) for v in val]
-            else:
-                ground[coord] = [_deserialize_item(val)]
-        monsters_data: dict[TileKey, list[MonsterRec]] = {}
-        for key, val in data.get("monsters", {}).items():
-            parts = [int(n) for n in key.split(",")]
-            coord: TileKey = (parts[0], parts[1], parts[2])
-            entries = val if isinstance(val, list) else [val]
-            lst: list[MonsterRec] = []
-            for entry in entries:
-                m_key = entry.get("key")
-                if m_key is None:
-                    continue
-                hp = entry.get("hp")
-                name = entry.get("name")
-                aggro = entry.get("aggro", False)
-                seen = entry.get("seen", False)
-                has_yelled = entry.get("yelled_once") or entry.get(
-                    "has_yelled_this_aggro", False
-                )
-                mid = entry.get("id")
-                loot_i = entry.get("loot_ions", 0)
-                loot_r = entry.get("loot_riblets", 0)
-                base = monsters_mod.REGISTRY[m_key].base_hp
-                m: dict[str, object] = {
-                    "key": m_key,
-                    "hp": int(hp) if hp is not None else base,
-                    "name": name or monsters_mod.REGISTRY[m_key].name,
-                    "aggro": bool(aggro),
-                    "seen": bool(seen),
-                    "yelled_once": bool(has_yelled),
-                    "loot_ions": int(loot_i),
-                    "loot_riblets": int(loot_r),
-                }
-                if mid is not None:
-                    m["id"] = int(mid)
-                if m.get("aggro") and not m.get("seen"):
-                    m["aggro"] = False
-                if not m.get("aggro"):
-                    m["yelled_once"] = False
-                lst.append(m)
-            if lst:
-                monsters_data[coord] = lst
         seeded = {int(y) for y in data.get("seeded_years", [])}
         last_wall = float(
             data.get("last_upkeep_tick", data.get("last_ion_tick", time.time()))
@@ -208,13 +292,15 @@ def load() -> tuple[
             last_topup_date=data.get("last_topup_date"),
             last_class=last_class,
             profiles=profiles,
+            profile_index=profile_index,
             last_upkeep_tick=time.monotonic() - max(0.0, now_wall - last_wall),
             max_catchup_ticks=int(data.get("max_catchup_ticks", 6)),
             schema=int(data.get("schema", 1)),
+            journal_base=int(data.get("journal_base", 0)),
+            shards={int(k): v for k, v in data.get("shards", {}).items()},
+            world=WorldConfig.from_raw(data.get("world")),
         )
 
-        from .items_resolver import resolve_key
-
         def _migrate_list(lst):
             out = []
             for it in lst:
@@ -227,15 +313,13 @@ def load() -> tuple[
         if player.worn_armor is not None:
             player.worn_armor = coerce_item(player.worn_armor)
             player.worn_armor["key"] = resolve_key(player.worn_armor["key"])
-        for k, items in ground.items():
-            ground[k] = _migrate_list(items)
 
         return player, ground, monsters_data, seeded, save_meta
     except FileNotFoundError:
         player = Player()
         ground: dict[TileKey, ItemListMut] = {}
         monsters_data: dict[TileKey, list[MonsterRec]] = {}
-        seeded: Set[int] = set()
+        seeded: set[int] = set()
         save_meta = Save()
         save(
             player,
@@ -245,83 +329,878 @@ def load() -> tuple[
                 monsters_data,
                 seed_monsters=False,
                 global_seed=save_meta.global_seed,
+                config=save_meta.world,
             ),
             save_meta,
         )
         return player, ground, monsters_data, seeded, save_meta
 
 
-def save(player: Player, world: World, save_meta: Save) -> None:
-    SAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
+def _tile_str(key: TileKey) -> str:
+    y, x, yy = key
+    return f"{y},{x},{yy}"
+
+
+def _encode_ground_tile(items: ItemListMut) -> str:
+    return json.dumps(
+        _serialize_item(items[0])
+        if len(items) == 1
+        else [_serialize_item(i) for i in items]
+    )
+
+
+def _monster_to_raw(m: MonsterRec) -> dict[str, Any]:
+    return {
+        "key": m["key"],
+        "hp": m["hp"],
+        "name": m.get("name"),
+        "aggro": m.get("aggro", False),
+        "seen": m.get("seen", False),
+        "yelled_once": m.get("yelled_once", False),
+        "id": m.get("id"),
+        "loot_ions": m.get("loot_ions", 0),
+        "loot_riblets": m.get("loot_riblets", 0),
+    }
+
+
+def _encode_monster_tile(lst: list[MonsterRec]) -> str:
+    processed = [_monster_to_raw(m) for m in lst]
+    return json.dumps(processed[0] if len(processed) == 1 else processed)
+
+
+def _encode_head(player: Player, world: World, save_meta: Save) -> dict[str, Any]:
+    """Return the small, always re-encoded part of the save document."""
+
+    return {
+        "year": player.year,
+        "positions": {
+            str(y): {"x": x, "y": yy} for y, (x, yy) in player.positions.items()
+        },
+        "class": player.clazz,
+        "hp": player.hp,
+        "max_hp": player.max_hp,
+        "level": player.level,
+        "exp": player.exp,
+        "inventory": [_serialize_item(i) for i in player.inventory],
+        "ions": player.ions,
+        "riblets": getattr(player, "riblets", 0),
+        "strength": player.strength,
+        "intelligence": player.intelligence,
+        "wisdom": player.wisdom,
+        "dexterity": player.dexterity,
+        "constitution": player.constitution,
+        "charisma": player.charisma,
+        "ready_to_combat_id": player.ready_to_combat_id,
+        "ready_to_combat_name": player.ready_to_combat_name,
+        "last_class": save_meta.last_class,
+        "profile_index": {
+            k: list(astuple(v)) for k, v in sorted(save_meta.profile_index.items())
+        },
+        "max_catchup_ticks": save_meta.max_catchup_ticks,
+        "seeded_years": sorted(world.seeded_years),
+        "global_seed": save_meta.global_seed,
+        "world": save_meta.world.to_raw(),
+        "last_topup_date": save_meta.last_topup_date,
+        "schema": save_meta.schema,
+        "item_keys": ITEM_KEYS_VERSION,
+        # no senses data; cues are never persisted
+    }
+
+
+def _update_tiles(
+    fragments: dict[str, str],
+    tiles: Mapping[TileKey, Any],
+    dirty: Iterable[TileKey],
+    encode: Callable[[Any], str],
+    baseline: Mapping[TileKey, Any] | None = None,
+) -> dict[str, str | None]:
+    """Re-encode ``dirty`` tiles into ``fragments``.
+
+    Returns the tiles whose encoding changed, mapped to their new fragment or
+    ``None`` when the tile no longer needs storing: it became empty or, with a
+    ``baseline``, matches the generated tile again.
+    """
+
+    changes: dict[str, str | None] = {}
+    for key in dirty:
+        name = _tile_str(key)
+        val = tiles.get(key)
+        if baseline is not None:
+            val = None if (val or []) == baseline.get(key, []) else (val or [])
+        if val is None:
+            if fragments.pop(name, None) is not None:
+                changes[name] = None
+            continue
+        text = encode(val)
+        if fragments.get(name) != text:
+            fragments[name] = text
+            changes[name] = text
+    return changes
+
+
+def _encode_tiles(
+    tiles: Mapping[TileKey, Any],
+    encode: Callable[[Any], str],
+    baseline: Mapping[TileKey, Any] | None = None,
+    years: set[int] = frozenset(),
+) -> dict[str, str]:
+    """Encode every tile; with a ``baseline``, only its tiles in ``years`` count."""
+
+    if baseline is None:
+        return {_tile_str(k): encode(v) for k, v in tiles.items()}
+    keys = set(tiles)
+    keys.update(k for k in baseline if k[0] in years)
+    fragments: dict[str, str] = {}
+    _update_tiles(fragments, tiles, sorted(keys), encode, baseline)
+    return fragments
+
+
+def _update_profiles(
+    cache: _WriteCache, profiles: dict[str, Any]
+) -> dict[str, str | None]:
+    changes: dict[str, str | None] = {}
+    for k in list(cache.profiles):
+        if k not in profiles:
+            del cache.profiles[k]
+            del cache.profile_json[k]
+            changes[k] = None
+    for k, raw in profiles.items():
+        if cache.profiles.get(k) != raw:
+            cache.profiles[k] = raw
+            cache.profile_json[k] = json.dumps(raw)
+            changes[k] = cache.profile_json[k]
+    return changes
+
+
+def _join_object(
+    fragments: Mapping[str, str | None], *, quote_keys: bool = False
+) -> str:
+    def val(v: str | None) -> str:
+        return "null" if v is None else v
+
+    if quote_keys:
+        body = ", ".join(f"{json.dumps(k)}: {val(v)}" for k, v in fragments.items())
+    else:
+        body = ", ".join(f'"{k}": {val(v)}' for k, v in fragments.items())
+    return "{" + body + "}"
+
+
+def _wall_upkeep_tick(cache: _WriteCache) -> float:
+    return time.time() - (time.monotonic() - cache.upkeep_tick)
+
+
+def _document_text(cache: _WriteCache, journal_base: int) -> str:
+    head = dict(cache.head)
+    head["last_upkeep_tick"] = _wall_upkeep_tick(cache)
+    head["journal_base"] = journal_base
+    return (
+        json.dumps(head)[:-1]
+        + ', "profiles": '
+        + _join_object(cache.profile_json, quote_keys=True)
+        + ', "ground": '
+        + _join_object(cache.ground_json)
+        + ', "monsters": '
+        + _join_object(cache.monster_json)
+        + "}"
+    )
+
+
+# Journal ---------------------------------------------------------------------
+
+# When enabled, each save appends a one-line record of what changed to the
+# journal next to ``SAVE_PATH`` instead of rewriting the whole document.  The
+# journal is folded back into the snapshot every ``JOURNAL_COMPACT_EVERY``
+# records and by :func:`checkpoint`.
+JOURNAL_MODE = False
+
+# Snapshot encoding: ``"json"`` (the default) or ``"binary"`` (see
+# :mod:`save_codec`).  Loading sniffs the file header, so either can be read
+# regardless of this setting.  A binary snapshot is encoded from the whole
+# world, so binary saves are always journalled and only compaction writes one.
+SAVE_CODEC = "json"
+JOURNAL_COMPACT_EVERY = 200
+
+
+def _journalled() -> bool:
+    return JOURNAL_MODE or SAVE_CODEC == "binary"
+
+
+def journal_path() -> Path:
+    return SAVE_PATH.with_name(SAVE_PATH.name + ".journal")
+
+
+def _atomic_write(path: Path, data: str | bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb" if isinstance(data, bytes) else "w") as fh:
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+# Delta-from-seed saves ---------------------------------------------------------
+
+# When enabled, tiles whose items or monsters still match what generation
+# produces for the save's ``global_seed`` (see :func:`gen.baseline_world`) are
+# left out of the document; tiles that differ are stored whole, with ``[]``
+# marking a generated tile that is now empty.  Only single-file JSON saves
+# (optionally journalled) are written this way.
+DELTA_MODE = False
+
+
+def _delta_active() -> bool:
+    return DELTA_MODE and SAVE_CODEC == "json" and not (SHARD_MODE or SQLITE_MODE)
+
+
+def _apply_baseline(
+    data: dict[str, Any],
+    ground: dict[TileKey, ItemListMut],
+    monsters: dict[TileKey, list[MonsterRec]],
+) -> None:
+    """Fill in the generated tiles a delta save left out."""
+
+    years = {int(y) for y in data.get("seeded_years", [])}
+    base = _baseline(
+        int(data.get("global_seed", gen.SEED)),
+        WorldConfig.from_raw(data.get("world")),
+        years,
+    )
+    for key, items in base.ground.items():
+        if key[0] in years and key not in ground:
+            ground[key] = [dict(i) for i in items]  # type: ignore[misc]
+    for key, lst in base.monsters.items():
+        if key[0] in years and key not in monsters:
+            monsters[key] = [monsters_mod.MonsterRecord.from_mapping(m) for m in lst]
+
+
+def _baseline(global_seed: int, config: WorldConfig, years: Iterable[int]) -> World:
+    """:func:`gen.baseline_world` with at least ``years`` generated."""
+
+    base = gen.baseline_world(global_seed, config)
+    for year in sorted(years):
+        base.year(year)
+    return base
+
+
+# Century shards ----------------------------------------------------------------
+
+# When enabled, ground items and monsters are stored in one file per century
+# next to ``SAVE_PATH``, which keeps only the player, profiles and an index of
+# the shards.  Centuries are read when first visited and only centuries with
+# changed tiles are written back.
+SHARD_MODE = False
+
+
+def shard_path(year: int) -> Path:
+    return SAVE_PATH.with_name(f"{SAVE_PATH.stem}.{year}{SAVE_PATH.suffix}")
+
+
+def _shard_files() -> list[Path]:
+    """Century files next to ``SAVE_PATH``, including ones no index lists."""
+
+    stem, suffix = SAVE_PATH.stem + ".", SAVE_PATH.suffix
+    if not SAVE_PATH.parent.is_dir():
+        return []
+    return [
+        path
+        for path in SAVE_PATH.parent.glob(f"{stem}*{suffix}")
+        if path.name[len(stem) : len(path.name) - len(suffix)].lstrip("-").isdigit()
+    ]
+
+
+def _shard_text(cache: _WriteCache, year: int) -> str:
+    prefix = f"{year},"
+    ground = {k: v for k, v in cache.ground_json.items() if k.startswith(prefix)}
+    monsters = {k: v for k, v in cache.monster_json.items() if k.startswith(prefix)}
+    return (
+        '{"ground": '
+        + _join_object(ground)
+        + ', "monsters": '
+        + _join_object(monsters)
+        + "}"
+    )
+
+
+def _index_text(cache: _WriteCache, journal_base: int) -> str:
+    head = dict(cache.head)
+    head["last_upkeep_tick"] = _wall_upkeep_tick(cache)
+    head["journal_base"] = journal_base
+    return (
+        json.dumps(head)[:-1]
+        + ', "profiles": '
+        + _join_object(cache.profile_json, quote_keys=True)
+        + ', "shards": '
+        + cache.shards_json
+        + "}"
+    )
+
+
+def _write_shards(
+    cache: _WriteCache,
+    patch: dict[str, dict[str, str | None]] | None,
+    world: World,
+    save_meta: Save,
+) -> None:
+    if patch is None:
+        years = {y for y in world.config.centuries if world.is_loaded(y)}
+    else:
+        years = {
+            _tile_key(name)[0]
+            for section in ("ground", "monsters")
+            for name in patch.get(section, {})
+        }
+    for year in sorted(years):
+        _submit(_WriteOp("snapshot", shard_path(year), _shard_text(cache, year)))
+        ids = sorted(
+            int(m["id"]) for _x, _y, m in world.monster_positions(year) if "id" in m
+        )
+        save_meta.shards[year] = {"ids": ids}
+    for year, entry in save_meta.shards.items():
+        if world.is_loaded(year):
+            entry["topup"] = save_meta.last_topup_date
+    shards_json = json.dumps(
+        {str(y): save_meta.shards[y] for y in sorted(save_meta.shards)}
+    )
+    if (
+        patch is None
+        or patch.keys() & {"head", "profiles"}
+        or shards_json != cache.shards_json
+        or not SAVE_PATH.exists()
+    ):
+        cache.shards_json = shards_json
+        text = _index_text(cache, save_meta.journal_base)
+        _submit(_WriteOp("snapshot", SAVE_PATH, text, (db_path(),)))
+
+
+def _load_shard(save_meta: Save, world: World, year: int) -> None:
+    """Year loader installed by :func:`attach_world`."""
+
+    try:
+        with open(shard_path(year)) as fh:
+            data = json.load(fh)
+    except FileNotFoundError:
+        data = {}
+    ground = {
+        _tile_key(k): _parse_ground_tile(v) for k, v in data.get("ground", {}).items()
+    }
+    monsters: dict[TileKey, list[MonsterRec]] = {}
+    for k, v in data.get("monsters", {}).items():
+        lst = _parse_monster_tile(v)
+        if lst:
+            monsters[_tile_key(k)] = lst
+    world.absorb_year(ground, monsters)
+
+    # Keep the write cache complete so the next shard write includes these.
+    cache = save_meta._written
+    if cache is not None and cache.world() is world:
+        for key, items in ground.items():
+            cache.ground_json[_tile_str(key)] = _encode_ground_tile(items)
+        for key, lst in monsters.items():
+            cache.monster_json[_tile_str(key)] = _encode_monster_tile(lst)
+
+    # Daily top-ups skip centuries that are not loaded; catch up now.
+    done = save_meta.last_topup_date
+    topped = save_meta.shards.get(year, {}).get("topup")
+    if done and topped != done and year in world.seeded_years:
+        gen.daily_topup_year(
+            world, year, save_meta.global_seed, datetime.date.fromisoformat(done)
+        )
+
+
+def attach_world(world: World, save_meta: Save) -> None:
+    """Connect ``world`` to the century files of a sharded save.
+
+    In :data:`SHARD_MODE` centuries are read on first use; otherwise they are
+    all read now so the next save folds them back into a single document.
+    """
+
+    if not save_meta.shards:
+        return
+    for entry in save_meta.shards.values():
+        world.reserve_monster_ids(entry.get("ids", []))
+    world.set_year_loader(partial(_load_shard, save_meta), save_meta.shards)
+    if not SHARD_MODE:
+        for year in sorted(save_meta.shards):
+            world.load_year(year)
+        save_meta.shards.clear()
+
+
+# SQLite backend ----------------------------------------------------------------
+
+# When enabled, state is kept in ``save.db`` (see :mod:`save_sqlite`) and each
+# save upserts only the changed header fields, profiles and tiles in one
+# transaction.  A database next to ``SAVE_PATH`` takes precedence when loading;
+# the next file-based save removes it again.
+SQLITE_MODE = False
+
+
+def db_path() -> Path:
+    return SAVE_PATH.with_suffix(".db")
+
+
+def _write_sqlite(
+    cache: _WriteCache,
+    patch: dict[str, dict[str, str | None]] | None,
+    world: World,
+) -> None:
+    head = dict(cache.head)
+    head["last_upkeep_tick"] = _wall_upkeep_tick(cache)
+    if patch is None:
+        kind = "snapshot"
+        tiles = set(world.ground) | set(world.monsters)
+        profiles: Mapping[str, str | None] = cache.profile_json
+    else:
+        kind = "update"
+        tiles = {
+            _tile_key(name)
+            for section in ("ground", "monsters")
+            for name in patch.get(section, {})
+        }
+        profiles = patch.get("profiles", {})
+    ground_rows: list[save_sqlite.GroundRow] = []
+    monster_rows: list[save_sqlite.MonsterRow] = []
+    for key in sorted(tiles):
+        ground_rows += save_sqlite.ground_rows(key, world.ground.get(key, ()))
+        monster_rows += save_sqlite.monster_rows(key, world.monsters.get(key, ()))
+    meta: tuple[tuple[str, str], ...] = ()
+    if patch is None or "head" in patch:
+        meta = tuple((k, json.dumps(v)) for k, v in head.items())
+    _submit(
+        save_sqlite.Update(
+            kind,
+            db_path(),
+            meta=meta,
+            profiles=tuple(profiles.items()),
+            tiles=tuple(sorted(tiles)) if patch is not None else (),
+            ground=tuple(ground_rows),
+            monsters=tuple(monster_rows),
+        )
+    )
+
+
+# Background writer -------------------------------------------------------------
+
+# Errors of writes that did not reach the disk.  The next :func:`save` reports
+# them and writes everything again; :func:`stop_writer` reports what is left.
+_WRITE_ERRORS = (OSError, sqlite3.Error)
+_failed_writes: list[Exception] = []
+_failed_lock = threading.Lock()
+log = logging.getLogger(__name__)
+
+
+def _apply(op: _WriteOp | save_sqlite.Update) -> None:
+    try:
+        op.apply()
+    except _WRITE_ERRORS as exc:
+        with _failed_lock:
+            _failed_writes.append(exc)
+
+
+def _report_failed_writes() -> bool:
+    """Log the writes that failed since the last call; return whether any did."""
+
+    with _failed_lock:
+        errors = _failed_writes[:]
+        _failed_writes.clear()
+    for exc in errors:
+        log.error("save write failed: %s", exc)
+    return bool(errors)
+
+
+@dataclass(frozen=True)
+class _WriteOp:
+    """A single unit of save I/O, fully encoded on the calling thread."""
+
+    kind: str  # "snapshot" or "append"
+    path: Path
+    text: str | bytes
+    truncate: tuple[Path, ...] = ()  # files superseded by this snapshot
+    sync: bool = False  # fsync appends as well as snapshots
+
+    def apply(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.kind == "append":
+            with open(self.path, "a") as fh:
+                fh.write(str(self.text))
+                if self.sync:
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            return
+        _atomic_write(self.path, self.text)
+        for path in self.truncate:
+            path.unlink(missing_ok=True)
+
+
+class SaveWriter:
+    """Single background thread that performs save I/O off the input thread.
+
+    Operations queued while a write is in progress are merged: a snapshot
+    supersedes everything queued before it for the same files and consecutive
+    journal appends are written in one go.  An operation that fails does not
+    stop the rest of its batch; see :func:`_report_failed_writes`.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._pending: list[_WriteOp | save_sqlite.Update] = []
+        self._busy = False
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, op: _WriteOp | save_sqlite.Update) -> None:
+        with self._cond:
+            if op.kind == "snapshot":
+                self._pending = [
+                    q
+                    for q in self._pending
+                    if q.path != op.path and q.path not in op.truncate
+                ]
+            elif (
+                self._pending
+                and self._pending[-1].kind == "append"
+                and self._pending[-1].path == op.path
+            ):
+                last = cast(_WriteOp, self._pending[-1])
+                op = replace(
+                    last,
+                    text=last.text + cast(_WriteOp, op).text,
+                    sync=last.sync or cast(_WriteOp, op).sync,
+                )
+                self._pending.pop()
+            self._pending.append(op)
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, []
+                self._busy = True
+            try:
+                for op in batch:
+                    _apply(op)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Block until every submitted operation has been written."""
+
+        with self._cond:
+            while (self._pending or self._busy) and self._thread.is_alive():
+                self._cond.wait()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join()
+        self.flush()
+
+
+_writer: SaveWriter | None = None
+
+
+def start_writer() -> SaveWriter:
+    """Route subsequent save I/O through a background :class:`SaveWriter`."""
+
+    global _writer
+    if _writer is None:
+        _writer = SaveWriter()
+    return _writer
+
+
+def stop_writer() -> None:
+    """Drain and stop the background writer; later saves write inline."""
+
+    global _writer
+    writer, _writer = _writer, None
+    if writer is not None:
+        writer.stop()
+    _report_failed_writes()
+
+
+def _submit(op: _WriteOp | save_sqlite.Update) -> None:
+    if _writer is not None:
+        _writer.submit(op)
+    else:
+        _apply(op)
+
+
+def _journal_record(
+    cache: _WriteCache, journal_base: int, patch: dict[str, dict[str, str | None]]
+) -> str:
+    parts = [f'{{"base": {journal_base}']
+    if "head" in patch:
+        head = dict(cache.head)
+        head["last_upkeep_tick"] = _wall_upkeep_tick(cache)
+        parts.append(f', "head": {json.dumps(head)}')
+    if patch.get("profiles"):
+        parts.append(
+            ', "profiles": ' + _join_object(patch["profiles"], quote_keys=True)
+        )
+    for section in ("ground", "monsters"):
+        if patch.get(section):
+            parts.append(f', "{section}": ' + _join_object(patch[section]))
+    return "".join(parts) + "}\n"
+
+
+def _replay_journal(
+    data: dict[str, Any],
+    ground: dict[TileKey, ItemListMut],
+    monsters: dict[TileKey, list[MonsterRec]],
+) -> None:
+    """Apply journal records written on top of the snapshot just read."""
+
+    try:
+        lines = journal_path().read_bytes().splitlines()
+    except FileNotFoundError:
+        return
+    base = data.get("journal_base", 0)
+    for line in lines:
+        try:
+            rec = json.loads(line)
+        except ValueError:
+            break  # torn final record from an interrupted append
+        if rec.get("base") != base:
+            continue
+        data.update(rec.get("head", {}))
+        profiles = data.setdefault("profiles", {})
+        for k, v in rec.get("profiles", {}).items():
+            if v is None:
+                profiles.pop(k, None)
+            else:
+                profiles[k] = v
+        for k, v in rec.get("ground", {}).items():
+            if v is None:
+                ground.pop(_tile_key(k), None)
+            else:
+                ground[_tile_key(k)] = _parse_ground_tile(
+                    v, data.get("item_keys") != ITEM_KEYS_VERSION
+                )
+        for k, v in rec.get("monsters", {}).items():
+            if v is None:
+                monsters.pop(_tile_key(k), None)
+            else:
+                monsters[_tile_key(k)] = _parse_monster_tile(v)
+
+
+def _write_snapshot(cache: _WriteCache, save_meta: Save) -> None:
+    truncate: tuple[Path, ...] = (db_path(),)
+    if _journalled():
+        # A new base keeps records from the previous snapshot from being
+        # replayed if we stop between the replace and the truncate.
+        save_meta.journal_base += 1
+        truncate += (journal_path(),)
+        cache.journal_records = 0
+    world = cache.world()
+    if SAVE_CODEC == "binary" and world is not None:
+        head = dict(cache.head)
+        head["last_upkeep_tick"] = _wall_upkeep_tick(cache)
+        head["journal_base"] = save_meta.journal_base
+        text: str | bytes = save_codec.encode(
+            head, cache.profiles, world.ground, world.monsters
+        )
+    else:
+        text = _document_text(cache, save_meta.journal_base)
+    _submit(_WriteOp("snapshot", SAVE_PATH, text, truncate))
+
+
+def _refresh_cache(
+    player: Player, world: World, save_meta: Save
+) -> tuple[_WriteCache, dict[str, dict[str, str | None]] | None]:
+    """Bring ``save_meta``'s write cache up to date with the game state.
+
+    Returns the cache and the sections that changed since the previous write,
+    or ``None`` in place of the changes when the cache had to be rebuilt.
+    """
+
     # Ensure armour class fields are persisted consistently.
     player.recompute_ac()
     if player.clazz:
         k = class_key(player.clazz)
         save_meta.profiles[k] = profile_from_player(player)
+        save_meta.profile_index[k] = summarize_profile(save_meta.profiles[k])
         save_meta.last_class = k
-    with open(SAVE_PATH, "w") as fh:
-        data = {
-            "year": player.year,
-            "positions": {
-                str(y): {"x": x, "y": yy} for y, (x, yy) in player.positions.items()
-            },
-            "class": player.clazz,
-            "hp": player.hp,
-            "max_hp": player.max_hp,
-            "level": player.level,
-            "exp": player.exp,
-            "inventory": [_serialize_item(i) for i in player.inventory],
-            "ions": player.ions,
-            "riblets": getattr(player, "riblets", 0),
-            "strength": player.strength,
-            "intelligence": player.intelligence,
-            "wisdom": player.wisdom,
-            "dexterity": player.dexterity,
-            "constitution": player.constitution,
-            "charisma": player.charisma,
-            "ready_to_combat_id": player.ready_to_combat_id,
-            "ready_to_combat_name": player.ready_to_combat_name,
-            "profiles": {
-                k: profile_to_raw(v) if isinstance(v, CharacterProfile) else v
-                for k, v in save_meta.profiles.items()
-            },
-            "last_class": save_meta.last_class,
-            "last_upkeep_tick": (
-                time.time() - (time.monotonic() - save_meta.last_upkeep_tick)
+    head = _encode_head(player, world, save_meta)
+    baselines = None
+    if _delta_active():
+        head["baseline"] = gen.GEN_VERSION
+        base_world = _baseline(world.global_seed, world.config, world.seeded_years)
+        baselines = (base_world.ground, base_world.monsters)
+    profiles = {
+        k: profile_to_raw(v) if isinstance(v, CharacterProfile) else v
+        for k, v in save_meta.profiles.items()
+    }
+    cache = save_meta._written
+    stale = (
+        cache is None
+        or cache.path != SAVE_PATH
+        or cache.world() is not world
+        or cache.epoch != world._dirty_epoch
+    )
+    ground_tiles, monster_tiles, everything = world.take_dirty()
+    if cache is None or stale or everything:
+        if not _journalled():
+            journal_path().unlink(missing_ok=True)
+        cache = _WriteCache(
+            path=SAVE_PATH,
+            world=weakref.ref(world),
+            epoch=world._dirty_epoch,
+            head=head,
+            upkeep_tick=save_meta.last_upkeep_tick,
+            ground_json=_encode_tiles(
+                world.ground,
+                _encode_ground_tile,
+                baselines and baselines[0],
+                world.seeded_years,
             ),
-            "max_catchup_ticks": save_meta.max_catchup_ticks,
-            "ground": {
-                f"{y},{x},{yy}": (
-                    _serialize_item(items[0])
-                    if len(items) == 1
-                    else [_serialize_item(i) for i in items]
-                )
-                for (y, x, yy), items in world.ground.items()
-            },
-            "monsters": {
-                f"{y},{x},{yy}": (processed[0] if len(processed) == 1 else processed)
-                for (y, x, yy), lst in world.monsters.items()
-                for processed in [
-                    [
-                        {
-                            "key": m["key"],
-                            "hp": m["hp"],
-                            "name": m.get("name"),
-                            "aggro": m.get("aggro", False),
-                            "seen": m.get("seen", False),
-                            "yelled_once": m.get("yelled_once", False),
-                            "id": m.get("id"),
-                            "loot_ions": m.get("loot_ions", 0),
-                            "loot_riblets": m.get("loot_riblets", 0),
-                        }
-                        for m in lst
-                    ]
-                ]
-            },
-            "seeded_years": list(world.seeded_years),
-            "global_seed": save_meta.global_seed,
-            "last_topup_date": save_meta.last_topup_date,
-            "schema": save_meta.schema,
-            # no senses data; cues are never persisted
-        }
-        json.dump(data, fh)
+            monster_json=_encode_tiles(
+                world.monsters,
+                _encode_monster_tile,
+                baselines and baselines[1],
+                world.seeded_years,
+            ),
+        )
+        _update_profiles(cache, profiles)
+        save_meta._written = cache
+        return cache, None
+
+    patch: dict[str, dict[str, str | None]] = {}
+    changes = _update_tiles(
+        cache.ground_json,
+        world.ground,
+        ground_tiles,
+        _encode_ground_tile,
+        baselines and baselines[0],
+    )
+    if changes:
+        patch["ground"] = changes
+    changes = _update_tiles(
+        cache.monster_json,
+        world.monsters,
+        monster_tiles,
+        _encode_monster_tile,
+        baselines and baselines[1],
+    )
+    if changes:
+        patch["monsters"] = changes
+    changes = _update_profiles(cache, profiles)
+    if changes:
+        patch["profiles"] = changes
+    if head != cache.head or save_meta.last_upkeep_tick != cache.upkeep_tick:
+        patch["head"] = {}
+    cache.epoch = world._dirty_epoch
+    cache.head = head
+    cache.upkeep_tick = save_meta.last_upkeep_tick
+    return cache, patch
+
+
+# Durability -------------------------------------------------------------------
+
+# How eagerly :func:`save` reaches the disk:
+#
+# ``"always"``      every save is written and fsynced, journal appends included.
+# ``"turn-batch"``  saves are written once ``BATCH_TURNS`` have been deferred or
+#                   ``BATCH_SECONDS`` have passed since the last write.
+# ``"exit-only"``   only :func:`checkpoint` writes: on ``exit``, on a class
+#                   switch and when the game is stopped by SIGTERM/SIGHUP.
+#
+# A deferred save is skipped outright; the world keeps accumulating dirty tiles,
+# so the next write still picks up every change.
+DURABILITY_LEVELS = ("always", "turn-batch", "exit-only")
+DURABILITY = "always"
+BATCH_TURNS = 20
+BATCH_SECONDS = 5.0
+
+
+def _defer(save_meta: Save) -> bool:
+    if DURABILITY == "always":
+        return False
+    save_meta._deferred += 1
+    return DURABILITY == "exit-only" or (
+        save_meta._deferred < BATCH_TURNS
+        and time.monotonic() - save_meta._last_write < BATCH_SECONDS
+    )
+
+
+def save(player: Player, world: World, save_meta: Save, *, force: bool = False) -> None:
+    """Persist the game state, skipping the write when nothing changed.
+
+    Only tiles the world reports as dirty and profiles whose contents differ
+    from the previous write are re-encoded; everything else is reused from
+    ``save_meta``'s write cache.  In :data:`SQLITE_MODE` the changed rows are
+    upserted into the database.  In :data:`SHARD_MODE` only the centuries with
+    changed tiles are rewritten; otherwise in :data:`JOURNAL_MODE`, and for
+    binary snapshots, the changes are appended to the journal rather than
+    rewriting the snapshot.
+
+    Unless ``force`` is given, the save may be deferred according to
+    :data:`DURABILITY`.  If an earlier write failed, the error is logged and
+    everything is written again.
+    """
+
+    if not force and _defer(save_meta):
+        return
+    if _report_failed_writes():
+        save_meta._written = None  # what is on disk is unknown; rewrite it all
+    save_meta._deferred = 0
+    save_meta._last_write = time.monotonic()
+    cache, patch = _refresh_cache(player, world, save_meta)
+    if SQLITE_MODE:
+        if patch != {}:
+            _write_sqlite(cache, patch, world)
+        return
+    if SHARD_MODE:
+        _write_shards(cache, patch, world, save_meta)
+        return
+    if patch is None or not SAVE_PATH.exists():
+        _write_snapshot(cache, save_meta)
+        return
+    if not patch:
+        return
+    if not _journalled():
+        _write_snapshot(cache, save_meta)
+        return
+    record = _journal_record(cache, save_meta.journal_base, patch)
+    _submit(_WriteOp("append", journal_path(), record, sync=DURABILITY == "always"))
+    cache.journal_records += 1
+    if cache.journal_records >= JOURNAL_COMPACT_EVERY:
+        _write_snapshot(cache, save_meta)
+
+
+def checkpoint(player: Player, world: World, save_meta: Save) -> None:
+    """Save now and fold any pending journal records into the snapshot."""
+
+    save(player, world, save_meta, force=True)
+    cache = save_meta._written
+    if cache is not None and cache.journal_records:
+        _write_snapshot(cache, save_meta)
+
+
+def reset(save_meta: Save | None = None) -> bool:
+    """Delete the save and every file written next to it.
+
+    Pending writes are drained first so none of them recreates a file, and
+    ``save_meta``'s write cache is dropped so its next save is written in
+    full.  Returns whether there was anything to delete.
+    """
+
+    if _writer is not None:
+        _writer.flush()
+    save_sqlite.close(db_path())
+    found = False
+    for path in (SAVE_PATH, journal_path(), db_path(), *_shard_files()):
+        if path.exists():
+            path.unlink()
+            found = True
+    if save_meta is not None:
+        save_meta._written = None
+        save_meta.shards.clear()
+        save_meta._deferred = 0
+    return found
@@ -103,9 +103,9 @@ class Player:
             print("can't go that way.")
             return False
         d = cast(Direction, direction)
-        if world.is_open(self.year, x, y, d):
-            nx, ny = world.step(x, y, d)
-            self.positions[self.year] = (nx, ny)
+        nxt = world.neighbors(self.year, x, y).get(d)
+        if nxt is not None:
+            self.positions[self.year] = nxt
             return True
         self._last_move_struck_back = True
         print(red("You are struck back."))
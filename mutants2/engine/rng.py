@@ -1,19 +1,27 @@
-"""Deterministic helpers for monster AI.
+"""Deterministic randomness for generation and game events.
 
-The current movement logic no longer relies on randomness but
-historically used a random shuffle.  This module is kept as a placeholder
-so that imports remain stable and behaviour deterministic in tests.
+Everything random in the game derives from seed parts such as the world's
+global seed, a year and a tag.  :func:`stable_seed` turns the parts into a key
+that does not depend on ``PYTHONHASHSEED``, and :class:`KeyedRandom` draws from
+that key with a counter, so the same parts give the same values in every
+process.  Loops that need thousands of floats from one stream, such as maze
+carving, use :func:`fast_random` instead.
+
+:func:`shuffle` is kept for monster AI, which historically used a random
+shuffle and now keeps the original order.
 """
 
 from __future__ import annotations
 
-import random
-from typing import Sequence, TypeVar, List
+import hashlib
+import random as _random
+from collections.abc import Callable, Sequence
+from typing import TypeVar
 
 T = TypeVar("T")
 
 
-def shuffle(seq: Sequence[T]) -> List[T]:
+def shuffle(seq: Sequence[T]) -> list[T]:
     """Return a deterministically shuffled copy of *seq*.
 
     The implementation simply returns ``list(seq)`` – callers expecting a
@@ -24,11 +32,126 @@ def shuffle(seq: Sequence[T]) -> List[T]:
     return list(seq)
 
 
-def hrand(*parts) -> random.Random:
-    """Return a ``random.Random`` seeded from ``parts``.
+def stable_seed(*parts) -> int:
+    """Return a 64-bit seed derived from ``parts``.
+
+    Unlike ``hash()``, the result does not depend on ``PYTHONHASHSEED`` so the
+    same parts give the same seed in every process.
+    """
+
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+_MASK64 = (1 << 64) - 1
+_GAMMA = 0x9E3779B97F4A7C15
+_UNIT = 1.0 / (1 << 53)
+
+
+def mix64(z: int) -> int:
+    """Scramble a 64-bit integer (the splitmix64 finaliser)."""
+
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def draw(key: int, counter: int) -> int:
+    """Return the ``counter``-th 64-bit value of the stream keyed ``key``."""
+
+    return mix64((key + (counter + 1) * _GAMMA) & _MASK64)
+
+
+def unit(key: int, counter: int) -> float:
+    """Return the ``counter``-th float in ``[0, 1)`` of the stream ``key``."""
+
+    return (draw(key, counter) >> 11) * _UNIT
+
+
+class KeyedRandom:
+    """A counter-based stream: its ``n``-th value is ``draw(key, n)``.
+
+    Making one costs no more than storing its key, and any value can be worked
+    out again from ``(key, counter)``.  It offers the parts of
+    :class:`random.Random` the game uses, plus :meth:`batch`.
+    """
+
+    __slots__ = ("counter", "key")
+
+    def __init__(self, key: int, counter: int = 0):
+        self.key = key & _MASK64
+        self.counter = counter
+
+    def next64(self) -> int:
+        value = draw(self.key, self.counter)
+        self.counter += 1
+        return value
+
+    def batch(self, n: int) -> list[int]:
+        """Return the next ``n`` 64-bit values."""
+
+        start = self.counter
+        self.counter += n
+        key = self.key
+        return [draw(key, i) for i in range(start, start + n)]
+
+    def random(self) -> float:
+        return (self.next64() >> 11) * _UNIT
+
+    def _below(self, n: int) -> int:
+        if n <= 0:
+            raise ValueError("empty range")
+        # Reject the top partial block so every result is equally likely.
+        limit = (1 << 64) - (1 << 64) % n
+        while True:
+            value = self.next64()
+            if value < limit:
+                return value % n
+
+    def randrange(self, start: int, stop: int | None = None) -> int:
+        if stop is None:
+            start, stop = 0, start
+        return start + self._below(stop - start)
+
+    def randint(self, a: int, b: int) -> int:
+        return a + self._below(b - a + 1)
+
+    def choice(self, seq: Sequence[T]) -> T:
+        if not seq:
+            raise IndexError("cannot choose from an empty sequence")
+        return seq[self._below(len(seq))]
+
+    def shuffle(self, x: list[T]) -> None:
+        """Shuffle ``x`` in place (Fisher-Yates)."""
+
+        for i in range(len(x) - 1, 0, -1):
+            j = self._below(i + 1)
+            x[i], x[j] = x[j], x[i]
+
+    def sample(self, population: Sequence[T], k: int) -> list[T]:
+        """Return ``k`` distinct elements of ``population`` in selection order."""
+
+        pool = list(population)
+        n = len(pool)
+        if not 0 <= k <= n:
+            raise ValueError("sample larger than population")
+        for i in range(k):
+            j = i + self._below(n - i)
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+
+def hrand(*parts) -> KeyedRandom:
+    """Return a :class:`KeyedRandom` keyed by ``stable_seed(*parts)``."""
+
+    return KeyedRandom(stable_seed(*parts))
+
+
+def fast_random(key: int) -> Callable[[], float]:
+    """Return ``random()`` of a Mersenne Twister seeded with ``key``.
 
-    ``hash(parts)`` is used to derive a deterministic seed so that tests are
-    stable across runs.
+    Seeding from an integer gives the same stream in every process, and each
+    draw costs about a tenth of :meth:`KeyedRandom.random`.
     """
 
-    return random.Random(hash(parts))
+    return _random.Random(key).random
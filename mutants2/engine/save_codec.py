@@ -0,0 +1,244 @@
+"""Compact binary encoding for save snapshots.
+
+A binary save starts with :data:`MAGIC` and a format version so :func:`is_binary`
+can tell it apart from the JSON document.  The player/profile header stays JSON
+inside the blob; ground items and monsters are stored column-wise:
+
+* tile coordinates are stored as separate year, x and y columns, which load
+  straight into tuple keys,
+* item and monster keys are interned into a string table and stored as ids,
+* fields that match their defaults (default enchant, base hp, the derived
+  ``<Name>-<id>`` monster name, zero loot) are left out and only the rare
+  deviations are kept in a sparse side table.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Mapping
+from itertools import accumulate, pairwise
+from typing import Any
+
+from . import items as items_mod
+from . import monsters as monsters_mod
+from .items_resolver import resolve_key
+from .types import ItemListMut, MonsterRec, TileKey
+
+MAGIC = b"M2SAVE"
+VERSION = 2
+
+_HEADER = struct.Struct("<6sH")
+_LEN = struct.Struct("<I")
+
+# Monster flag bits.
+_AGGRO = 1
+_SEEN = 2
+_YELLED = 4
+
+
+def is_binary(blob: bytes) -> bool:
+    return blob[: len(MAGIC)] == MAGIC
+
+
+def _default_name(key: str, mid: object) -> str:
+    base = monsters_mod.REGISTRY[key].name
+    return f"{base}-{mid:04d}" if isinstance(mid, int) else base
+
+
+def _item_template(key: str) -> dict[str, Any]:
+    inst: dict[str, Any] = {"key": key}
+    idef = items_mod.REGISTRY.get(key)
+    if idef and idef.default_enchant_level:
+        inst["enchant"] = idef.default_enchant_level
+    return inst
+
+
+def _array_bytes(arr: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover - saves are little-endian
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return _LEN.pack(len(arr) * arr.itemsize) + arr.tobytes()
+
+
+def _read_array(typecode: str, blob: bytes, pos: int) -> tuple[array, int]:
+    (size,) = _LEN.unpack_from(blob, pos)
+    pos += _LEN.size
+    arr = array(typecode)
+    arr.frombytes(blob[pos : pos + size])
+    if sys.byteorder == "big":  # pragma: no cover
+        arr.byteswap()
+    return arr, pos + size
+
+
+class _Coords:
+    """Year, x and y columns of a list of tiles."""
+
+    def __init__(self) -> None:
+        self.columns = (array("i"), array("h"), array("h"))
+
+    def append(self, coord: TileKey) -> None:
+        for column, value in zip(self.columns, coord):
+            column.append(value)
+
+
+def _read_coords(blob: bytes, pos: int) -> tuple[Iterable[TileKey], int]:
+    years, pos = _read_array("i", blob, pos)
+    xs, pos = _read_array("h", blob, pos)
+    ys, pos = _read_array("h", blob, pos)
+    return zip(years, xs, ys), pos
+
+
+def _split(flat: list, counts: array) -> list[list]:
+    """Cut ``flat`` into consecutive runs of ``counts`` elements."""
+
+    if counts.count(1) == len(counts):  # one per tile, the common case
+        return list(map(list, zip(flat)))
+    return [flat[a:b] for a, b in pairwise(accumulate(counts, initial=0))]
+
+
+def encode(
+    head: Mapping[str, Any],
+    profiles: Mapping[str, Any],
+    ground: Mapping[TileKey, ItemListMut],
+    monsters: Mapping[TileKey, list[MonsterRec]],
+) -> bytes:
+    """Return the binary snapshot for the given save sections."""
+
+    strings: list[str] = []
+    interned: dict[str, int] = {}
+
+    def intern(s: str) -> int:
+        idx = interned.get(s)
+        if idx is None:
+            idx = interned[s] = len(strings)
+            strings.append(s)
+        return idx
+
+    g_coords = _Coords()
+    g_counts = array("H")
+    g_keys = array("H")
+    item_extra: dict[str, dict[str, Any]] = {}
+    for coord, items in ground.items():
+        g_coords.append(coord)
+        g_counts.append(len(items))
+        for inst in items:
+            key = inst["key"]
+            tmpl = _item_template(key)
+            extra = {k: v for k, v in inst.items() if k not in tmpl or tmpl[k] != v}
+            if extra:
+                item_extra[str(len(g_keys))] = extra
+            g_keys.append(intern(key))
+
+    m_coords = _Coords()
+    m_counts = array("H")
+    m_keys = array("H")
+    m_flags = array("B")
+    m_ids = array("i")
+    monster_extra: dict[str, dict[str, Any]] = {}
+    for coord, lst in monsters.items():
+        m_coords.append(coord)
+        m_counts.append(len(lst))
+        for m in lst:
+            key = str(m["key"])
+            mid = m.get("id")
+            extra: dict[str, Any] = {}
+            hp = m.get("hp")
+            if hp is not None and hp != monsters_mod.REGISTRY[key].base_hp:
+                extra["hp"] = hp
+            name = m.get("name")
+            if name and name != _default_name(key, mid):
+                extra["name"] = name
+            for loot in ("loot_ions", "loot_riblets"):
+                if m.get(loot, 0):
+                    extra[loot] = m.get(loot)
+            if extra:
+                monster_extra[str(len(m_keys))] = extra
+            m_keys.append(intern(key))
+            m_flags.append(
+                (_AGGRO if m.get("aggro") else 0)
+                | (_SEEN if m.get("seen") else 0)
+                | (_YELLED if m.get("yelled_once") else 0)
+            )
+            m_ids.append(int(mid) if isinstance(mid, int) else -1)
+
+    meta = json.dumps(
+        {
+            "head": head,
+            "profiles": profiles,
+            "strings": strings,
+            "item_extra": item_extra,
+            "monster_extra": monster_extra,
+        }
+    ).encode()
+    parts = [_HEADER.pack(MAGIC, VERSION), _LEN.pack(len(meta)), meta]
+    for arr in (
+        *g_coords.columns,
+        g_counts,
+        g_keys,
+        *m_coords.columns,
+        m_counts,
+        m_keys,
+        m_flags,
+        m_ids,
+    ):
+        parts.append(_array_bytes(arr))
+    return b"".join(parts)
+
+
+def decode(
+    blob: bytes,
+) -> tuple[dict[str, Any], dict[TileKey, ItemListMut], dict[TileKey, list[MonsterRec]]]:
+    """Decode a binary snapshot.
+
+    Returns the document header (including ``"profiles"``) and the ground and
+    monster maps in the same normalized form the JSON loader produces.
+    """
+
+    magic, version = _HEADER.unpack_from(blob)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"unsupported binary save version {version}")
+    pos = _HEADER.size
+    (size,) = _LEN.unpack_from(blob, pos)
+    pos += _LEN.size
+    meta = json.loads(blob[pos : pos + size])
+    pos += size
+    g_coords, pos = _read_coords(blob, pos)
+    g_counts, pos = _read_array("H", blob, pos)
+    g_keys, pos = _read_array("H", blob, pos)
+    m_coords, pos = _read_coords(blob, pos)
+    m_counts, pos = _read_array("H", blob, pos)
+    m_keys, pos = _read_array("H", blob, pos)
+    m_flags, pos = _read_array("B", blob, pos)
+    m_ids, pos = _read_array("i", blob, pos)
+
+    strings: list[str] = meta["strings"]
+    templates = [_item_template(resolve_key(s)) for s in strings]
+    flat_items = list(map(dict.copy, map(templates.__getitem__, g_keys)))
+    for idx, extra in meta["item_extra"].items():
+        flat_items[int(idx)].update(extra)
+    ground = dict(zip(g_coords, _split(flat_items, g_counts)))
+
+    extras = meta["monster_extra"]
+    flat_mons: list[MonsterRec] = []
+    for idx, (kid, flags, mid) in enumerate(zip(m_keys, m_flags, m_ids)):
+        key = strings[kid]
+        aggro = bool(flags & _AGGRO) and bool(flags & _SEEN)
+        m = monsters_mod.MonsterRecord(
+            key,
+            id=mid if mid >= 0 else None,
+            aggro=aggro,
+            seen=bool(flags & _SEEN),
+            yelled_once=aggro and bool(flags & _YELLED),
+        )
+        extra = extras.get(str(idx))
+        if extra:
+            m.update(extra)
+        flat_mons.append(m)
+    monsters = dict(zip(m_coords, _split(flat_mons, m_counts)))
+
+    data = dict(meta["head"])
+    data["profiles"] = meta["profiles"]
+    return data, ground, monsters
@@ -0,0 +1,233 @@
+"""SQLite storage for save state.
+
+The save header, character profiles, ground items and monsters live in
+``save.db`` next to the JSON save.  Each command only touches the rows of the
+tiles and profiles that changed, and the live save can be queried without the
+game, e.g. all tiles with more than six items::
+
+    SELECT year, x, y, COUNT(*) FROM ground
+    GROUP BY year, x, y HAVING COUNT(*) > 6;
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .types import MonsterRec, TileKey
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    class TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ground (
+    year INTEGER NOT NULL,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    slot INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (year, x, y, slot)
+);
+CREATE TABLE IF NOT EXISTS monsters (
+    id INTEGER PRIMARY KEY,
+    year INTEGER NOT NULL,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    slot INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    name TEXT,
+    hp INTEGER,
+    aggro INTEGER NOT NULL,
+    seen INTEGER NOT NULL,
+    yelled_once INTEGER NOT NULL,
+    loot_ions INTEGER NOT NULL,
+    loot_riblets INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS monsters_tile ON monsters (year, x, y);
+"""
+
+_MONSTER_COLUMNS = (
+    "id",
+    "year",
+    "x",
+    "y",
+    "slot",
+    "key",
+    "name",
+    "hp",
+    "aggro",
+    "seen",
+    "yelled_once",
+    "loot_ions",
+    "loot_riblets",
+)
+
+GroundRow = tuple[int, int, int, int, str, str]
+MonsterRow = tuple[Any, ...]
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+# Connections used by :meth:`Update.apply`, kept open between saves.  Saves
+# are applied by one thread at a time (the background writer, or the caller
+# when there is none).
+_connections: dict[Path, sqlite3.Connection] = {}
+
+
+def _writer_connection(path: Path) -> tuple[sqlite3.Connection, bool]:
+    """Return the open connection for ``path`` and whether it is new."""
+
+    conn = _connections.get(path)
+    if conn is not None and path.exists():
+        return conn, False
+    if conn is not None:
+        conn.close()  # the file was removed underneath us
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = _connections[path] = sqlite3.connect(path, check_same_thread=False)
+    return conn, True
+
+
+def close(path: Path | None = None) -> None:
+    """Close the kept connection to ``path``, or every one of them."""
+
+    paths = list(_connections) if path is None else [path]
+    for p in paths:
+        conn = _connections.pop(p, None)
+        if conn is not None:
+            conn.close()
+
+
+def ground_rows(key: TileKey, items: Iterable[Any]) -> list[GroundRow]:
+    year, x, y = key
+    return [
+        (year, x, y, slot, str(inst["key"]), json.dumps(dict(inst)))
+        for slot, inst in enumerate(items)
+    ]
+
+
+def monster_rows(key: TileKey, lst: Iterable[MonsterRec]) -> list[MonsterRow]:
+    year, x, y = key
+    return [
+        (
+            m.get("id"),
+            year,
+            x,
+            y,
+            slot,
+            m["key"],
+            m.get("name"),
+            m.get("hp"),
+            bool(m.get("aggro")),
+            bool(m.get("seen")),
+            bool(m.get("yelled_once")),
+            m.get("loot_ions", 0),
+            m.get("loot_riblets", 0),
+        )
+        for slot, m in enumerate(lst)
+    ]
+
+
+_UPSERT_MONSTER = (
+    f"INSERT INTO monsters ({', '.join(_MONSTER_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_MONSTER_COLUMNS))}) "
+    "ON CONFLICT (id) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in _MONSTER_COLUMNS[1:])
+)
+
+
+@dataclass(frozen=True)
+class Update:
+    """Rows for one save, built on the calling thread and applied atomically.
+
+    A ``"snapshot"`` replaces every table; an ``"update"`` rewrites only the
+    rows of ``tiles`` and upserts the given header fields and profiles.
+    """
+
+    kind: str
+    path: Path
+    meta: tuple[tuple[str, str], ...] = ()
+    profiles: tuple[tuple[str, str | None], ...] = ()
+    tiles: tuple[TileKey, ...] = ()
+    ground: tuple[GroundRow, ...] = ()
+    monsters: tuple[MonsterRow, ...] = ()
+    truncate: tuple[Path, ...] = ()
+
+    def apply(self) -> None:
+        conn, new = _writer_connection(self.path)
+        if new or self.kind == "snapshot":
+            conn.executescript(SCHEMA)
+        with conn:
+            if self.kind == "snapshot":
+                for table in ("meta", "profiles", "ground", "monsters"):
+                    conn.execute(f"DELETE FROM {table}")
+            else:
+                where = "WHERE year = ? AND x = ? AND y = ?"
+                conn.executemany(f"DELETE FROM ground {where}", self.tiles)
+                conn.executemany(f"DELETE FROM monsters {where}", self.tiles)
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                self.meta,
+            )
+            conn.executemany(
+                "DELETE FROM profiles WHERE class = ?",
+                [(k,) for k, v in self.profiles if v is None],
+            )
+            conn.executemany(
+                "INSERT INTO profiles (class, data) VALUES (?, ?) "
+                "ON CONFLICT (class) DO UPDATE SET data = excluded.data",
+                [(k, v) for k, v in self.profiles if v is not None],
+            )
+            conn.executemany(
+                "INSERT INTO ground VALUES (?, ?, ?, ?, ?, ?)", self.ground
+            )
+            conn.executemany(_UPSERT_MONSTER, self.monsters)
+        for path in self.truncate:
+            path.unlink(missing_ok=True)
+
+
+def read(
+    path: Path,
+) -> tuple[
+    dict[str, Any], dict[TileKey, list[dict[str, Any]]], dict[TileKey, list[dict]]
+]:
+    """Return the raw header (with ``"profiles"``), ground and monster maps."""
+
+    with closing(connect(path)) as conn:
+        data: dict[str, Any] = {
+            k: json.loads(v) for k, v in conn.execute("SELECT key, value FROM meta")
+        }
+        data["profiles"] = {
+            k: json.loads(v)
+            for k, v in conn.execute("SELECT class, data FROM profiles")
+        }
+        ground: dict[TileKey, list[dict[str, Any]]] = {}
+        for year, x, y, raw in conn.execute(
+            "SELECT year, x, y, data FROM ground ORDER BY year, x, y, slot"
+        ):
+            ground.setdefault((year, x, y), []).append(json.loads(raw))
+        monsters: dict[TileKey, list[dict]] = {}
+        for row in conn.execute(
+            f"SELECT {', '.join(_MONSTER_COLUMNS)} FROM monsters "
+            "ORDER BY year, x, y, slot"
+        ):
+            rec = dict(zip(_MONSTER_COLUMNS, row))
+            coord = (rec.pop("year"), rec.pop("x"), rec.pop("y"))
+            del rec["slot"]
+            monsters.setdefault(coord, []).append(rec)
+    return data, ground, monsters
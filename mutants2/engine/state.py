@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Tuple, TYPE_CHECKING
 
 from .types import ItemInstance
 from .items_util import coerce_item
@@ -47,6 +48,29 @@ class CharacterProfile:
     first_ion_grant_done: bool = False
 
 
+@dataclass(frozen=True)
+class ProfileSummary:
+    """The part of a profile shown in the class menu."""
+
+    level: int
+    year: int
+    x: int
+    y: int
+
+
+def summarize_profile(prof: CharacterProfile | Mapping[str, Any]) -> ProfileSummary:
+    """Summarize a decoded or still-raw profile without decoding it."""
+
+    if isinstance(prof, CharacterProfile):
+        x, y = prof.positions.get(prof.year, (0, 0))
+        return ProfileSummary(getattr(prof, "level", 1), prof.year, x, y)
+    year = int(prof.get("year", allowed_centuries()[0]))
+    pos = prof.get("positions", {}).get(str(year), {})
+    return ProfileSummary(
+        int(prof.get("level", 1)), year, int(pos.get("x", 0)), int(pos.get("y", 0))
+    )
+
+
 def profile_from_player(p: "Player") -> CharacterProfile:
     """Extract a :class:`CharacterProfile` from ``p``."""
 
@@ -1,18 +1,11 @@
 from __future__ import annotations
 
-import random
+import itertools
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
 from dataclasses import dataclass
-from typing import (
-    Dict,
-    Iterable,
-    Iterator,
-    Mapping,
-    MutableMapping,
-    Optional,
-    Set,
-    Tuple,
-    cast,
-)
+from types import MappingProxyType
+from typing import AbstractSet, Any, TypeVar, cast
 
 from .types import (
     Direction,
@@ -27,7 +20,7 @@ from . import monsters as monsters_mod, items as items_mod, rng as rng_mod
 from .ai import set_aggro
 from ..data.room_headers import ROOM_HEADERS
 
-Coordinate = Tuple[int, int]
+Coordinate = tuple[int, int]
 
 # ---------------------------------------------------------------------------
 # Grid topology helpers
@@ -57,7 +50,82 @@ def in_bounds(x: int, y: int) -> bool:
     return GRID_MIN <= x < GRID_MAX and GRID_MIN <= y < GRID_MAX
 
 
-DIR: Mapping[Direction, Tuple[int, int]] = {
+def grid_bounds(width: int, height: int) -> tuple[int, int, int, int]:
+    """``(x_min, y_min, x_max, y_max)`` of a map of this size centred on the origin.
+
+    The maxima are exclusive; the default size gives ``GRID_MIN``/``GRID_MAX``.
+    """
+
+    x_min, y_min = -(width // 2), -(height // 2)
+    return x_min, y_min, x_min + width, y_min + height
+
+
+# Aggro monsters further than this many tiles' worth of search from the player
+# do not chase; the default map is well within it.
+CHASE_MAX_TILES = 1 << 12
+
+
+@dataclass(frozen=True)
+class WorldConfig:
+    """Map size and number of centuries of a world, stored with its save.
+
+    Maps span the :func:`grid_bounds` of their size; centuries run from
+    ``LOWEST_CENTURY`` in steps of 100.
+    """
+
+    width: int = GRID_MAX - GRID_MIN
+    height: int = GRID_MAX - GRID_MIN
+    eras: int = len(ALLOWED_CENTURIES)
+
+    def __post_init__(self) -> None:
+        limit = 1 << (CELL_BITS - 1)
+        if not (1 <= self.width <= limit and 1 <= self.height <= limit):
+            raise ValueError(f"map size must be between 1 and {limit}")
+        if self.eras < 1:
+            raise ValueError("a world needs at least one century")
+
+    @property
+    def centuries(self) -> tuple[int, ...]:
+        return tuple(range(LOWEST_CENTURY, LOWEST_CENTURY + 100 * self.eras, 100))
+
+    @property
+    def last_century(self) -> int:
+        return LOWEST_CENTURY + 100 * (self.eras - 1)
+
+    def has_century(self, year: int) -> bool:
+        return LOWEST_CENTURY <= year <= self.last_century and year % 100 == 0
+
+    def to_raw(self) -> dict[str, int]:
+        return {"width": self.width, "height": self.height, "eras": self.eras}
+
+    @classmethod
+    def from_raw(cls, raw: Mapping[str, Any] | None) -> WorldConfig:
+        raw = raw or {}
+        default = cls()
+        return cls(
+            int(raw.get("width", default.width)),
+            int(raw.get("height", default.height)),
+            int(raw.get("eras", default.eras)),
+        )
+
+
+# Per-year tile buckets are keyed by packed ints rather than coordinate tuples:
+# a cell packs ``x`` and ``y`` into ``CELL_BITS`` bits each, so both must lie
+# within ``±2 ** (CELL_BITS - 1)``.
+CELL_BITS = 16
+_CELL_MASK = (1 << CELL_BITS) - 1
+_CELL_BIAS = 1 << (CELL_BITS - 1)
+
+
+def pack_cell(x: int, y: int) -> int:
+    return ((x + _CELL_BIAS) << CELL_BITS) | (y + _CELL_BIAS)
+
+
+def unpack_cell(cell: int) -> Coordinate:
+    return (cell >> CELL_BITS) - _CELL_BIAS, (cell & _CELL_MASK) - _CELL_BIAS
+
+
+DIR: Mapping[Direction, tuple[int, int]] = {
     "east": (1, 0),
     "west": (-1, 0),
     "north": (0, 1),
@@ -66,6 +134,15 @@ DIR: Mapping[Direction, Tuple[int, int]] = {
 
 ORDER: tuple[Direction, ...] = ("east", "west", "north", "south")
 
+# Bits of a cell's exit mask, see :class:`Grid`.
+EXIT_BITS: Mapping[Direction, int] = {"east": 1, "west": 2, "north": 4, "south": 8}
+OPPOSITE: Mapping[Direction, Direction] = {
+    "east": "west",
+    "west": "east",
+    "north": "south",
+    "south": "north",
+}
+
 
 def step(x: int, y: int, d: Direction) -> tuple[int, int]:
     dx, dy = DIR[d]
@@ -99,147 +176,584 @@ class Cell:
     y: int
 
 
+def open_exits(width: int, height: int) -> bytearray:
+    """Exit masks of a grid with every in-bounds step open."""
+
+    exits = bytearray(width * height)
+    for i in range(width * height):
+        row, col = divmod(i, width)
+        exits[i] = (
+            (EXIT_BITS["east"] if col < width - 1 else 0)
+            | (EXIT_BITS["west"] if col > 0 else 0)
+            | (EXIT_BITS["north"] if row < height - 1 else 0)
+            | (EXIT_BITS["south"] if row > 0 else 0)
+        )
+    return exits
+
+
 class Grid:
-    """A simple 4-neighbour grid with fully open connectivity."""
+    """A 4-neighbour grid whose passages are stored as one byte per cell.
+
+    The grid spans the :func:`grid_bounds` of its size.  ``exits`` holds an
+    :data:`EXIT_BITS` mask per cell, row by row starting at ``(x_min, y_min)``.
+    Without it every in-bounds step is open.
+    """
 
     def __init__(
-        self, width: int = GRID_MAX - GRID_MIN, height: int = GRID_MAX - GRID_MIN
+        self,
+        width: int = GRID_MAX - GRID_MIN,
+        height: int = GRID_MAX - GRID_MIN,
+        exits: bytearray | None = None,
     ):
         self.width = width
         self.height = height
+        self.x_min, self.y_min, self.x_max, self.y_max = grid_bounds(width, height)
+        self.exits = exits if exits is not None else open_exits(width, height)
+        # Exit tables of the cells asked about so far, by :meth:`index`.
+        self._adjacency: dict[int, Mapping[Direction, Coordinate]] = {}
+
+    def index(self, x: int, y: int) -> int:
+        return (y - self.y_min) * self.width + (x - self.x_min)
+
+    def contains(self, x: int, y: int) -> bool:
+        return self.x_min <= x < self.x_max and self.y_min <= y < self.y_max
 
     def is_walkable(self, x: int, y: int) -> bool:
-        return in_bounds(x, y)
+        return self.contains(x, y)
+
+    def exit_mask(self, x: int, y: int) -> int:
+        return self.exits[self.index(x, y)] if self.contains(x, y) else 0
+
+    def is_open(self, x: int, y: int, d: Direction) -> bool:
+        return bool(self.exit_mask(x, y) & EXIT_BITS[d])
 
     def neighbors(self, x: int, y: int) -> Mapping[Direction, Coordinate]:
-        result: dict[Direction, Coordinate] = {}
-        if not self.is_walkable(x, y):
-            return result
-        for name, (dx, dy) in DIR.items():
-            nx, ny = x + dx, y + dy
-            if in_bounds(nx, ny):
-                result[name] = (nx, ny)
-        return result
+        """Return the open exits of ``(x, y)`` in :data:`ORDER`.
+
+        Each cell's read-only table is built on first use and then shared by
+        every caller.
+        """
+
+        if not self.contains(x, y):
+            return _NO_EXITS
+        i = self.index(x, y)
+        table = self._adjacency.get(i)
+        if table is None:
+            mask = self.exits[i]
+            table = self._adjacency[i] = MappingProxyType(
+                {
+                    d: (x + DIR[d][0], y + DIR[d][1])
+                    for d in ORDER
+                    if mask & EXIT_BITS[d]
+                }
+            )
+        return table
+
+
+_NO_EXITS: Mapping[Direction, Coordinate] = MappingProxyType({})
 
 
 @dataclass
 class Year:
     value: int
     grid: Grid
+    # Room headers: ``headers[grid.index(x, y)]`` indexes ``ROOM_HEADERS``.
+    # Maps too large for a table work each one out from ``header_key``.
+    header_key: int = 0
+    headers: bytes | None = None
+
+
+def room_header_table(key: int, cells: int) -> bytes:
+    """``ROOM_HEADERS`` index of each of ``cells`` cells, one byte apiece.
+
+    Cell ``i`` gets ``rng.draw(key, i)`` modulo the number of headers.
+    """
+
+    n = len(ROOM_HEADERS)
+    return bytes(v % n for v in rng_mod.KeyedRandom(key).batch(cells))
 
 
 GroundMap = Mapping[TileKey, Iterable[ItemInstance]]
 
+T = TypeVar("T")
+
+
+class YearTiles(MutableMapping[TileKey, list[T]]):
+    """A ``(year, x, y)``-keyed tile map stored as one bucket per century.
+
+    It reads and writes like a plain dict, while :meth:`bucket` gives the tiles
+    of one century without scanning the others and :meth:`count` the total
+    length of its lists.  Counts follow ``__setitem__``/``__delitem__``; a list
+    grown or shrunk in place must be reported with :meth:`adjust`.
+
+    Buckets are keyed by :func:`pack_cell` ints; :meth:`at` reads a tile
+    without building a key tuple.
+    """
+
+    def __init__(self, tiles: Mapping[TileKey, list[T]] | None = None) -> None:
+        self._years: dict[int, dict[int, list[T]]] = {}
+        self._counts: dict[int, int] = {}
+        if tiles:
+            self.update(tiles)
+
+    def at(self, year: int, x: int, y: int) -> list[T] | None:
+        bucket = self._years.get(year)
+        return None if bucket is None else bucket.get(pack_cell(x, y))
+
+    def __getitem__(self, key: TileKey) -> list[T]:
+        found = self.at(*key)
+        if found is None:
+            raise KeyError(key)
+        return found
+
+    def __setitem__(self, key: TileKey, value: list[T]) -> None:
+        year, x, y = key
+        cell = pack_cell(x, y)
+        bucket = self._years.setdefault(year, {})
+        old = bucket.get(cell)
+        self._counts[year] = (
+            self._counts.get(year, 0) + len(value) - (len(old) if old else 0)
+        )
+        bucket[cell] = value
+
+    def __delitem__(self, key: TileKey) -> None:
+        year, x, y = key
+        cell = pack_cell(x, y)
+        bucket = self._years.get(year)
+        if bucket is None or cell not in bucket:
+            raise KeyError(key)
+        self._counts[year] -= len(bucket.pop(cell))
+        if not bucket:
+            del self._years[year]
+            del self._counts[year]
+
+    def __contains__(self, key: object) -> bool:
+        year, x, y = cast(TileKey, key)
+        return pack_cell(x, y) in self._years.get(year, ())
+
+    def __iter__(self) -> Iterator[TileKey]:
+        for year, bucket in self._years.items():
+            for cell in bucket:
+                yield (year, *unpack_cell(cell))
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._years.values())
+
+    def get(self, key: TileKey, default=None):  # type: ignore[override]
+        found = self.at(*key)
+        return default if found is None else found
+
+    def clear(self) -> None:
+        self._years.clear()
+        self._counts.clear()
+
+    def copy(self) -> dict[TileKey, list[T]]:
+        return dict(self)
+
+    def bucket(self, year: int) -> Mapping[int, list[T]]:
+        """Return the ``{pack_cell(x, y): list}`` tiles of ``year``."""
+
+        return self._years.get(year) or {}
+
+    def count(self, year: int) -> int:
+        """Total number of entries across the tiles of ``year``."""
+
+        return self._counts.get(year, 0)
+
+    def adjust(self, year: int, delta: int) -> None:
+        """Record that a list of ``year`` changed length in place."""
+
+        self._counts[year] += delta
+
+    def years(self) -> set[int]:
+        return set(self._years)
+
+
+class GroundTiles(YearTiles[ItemInstance]):
+    """:class:`YearTiles` of ground items, also indexed by item key.
+
+    Each century keeps ``{item key: {cell: copies}}`` so the tiles holding an
+    item are found without a scan.  Centuries passed to :meth:`track_empty`
+    also keep the set of their walkable cells that hold nothing.  Items added
+    to or taken from a list in place must be reported with :meth:`added` and
+    :meth:`removed` instead of :meth:`adjust`.
+    """
+
+    def __init__(self, tiles: Mapping[TileKey, list[ItemInstance]] | None = None):
+        self._keys: dict[int, dict[str, dict[int, int]]] = {}
+        self._walkable: dict[int, set[int]] = {}
+        self._empty: dict[int, set[int]] = {}
+        super().__init__(tiles)
+
+    def _index(
+        self, year: int, cell: int, items: Iterable[ItemInstance], delta: int
+    ) -> None:
+        keys = self._keys.setdefault(year, {})
+        for inst in items:
+            cells = keys.setdefault(inst["key"], {})
+            n = cells.get(cell, 0) + delta
+            if n > 0:
+                cells[cell] = n
+            else:
+                del cells[cell]
+                if not cells:
+                    del keys[inst["key"]]
+
+    def _occupied(self, year: int, cell: int, occupied: bool) -> None:
+        empty = self._empty.get(year)
+        if empty is None:
+            return
+        if occupied:
+            empty.discard(cell)
+        elif cell in self._walkable[year]:
+            empty.add(cell)
+
+    def __setitem__(self, key: TileKey, value: list[ItemInstance]) -> None:
+        year, x, y = key
+        cell = pack_cell(x, y)
+        old = self.at(year, x, y)
+        super().__setitem__(key, value)
+        if old:
+            self._index(year, cell, old, -1)
+        self._index(year, cell, value, 1)
+        self._occupied(year, cell, bool(value))
+
+    def __delitem__(self, key: TileKey) -> None:
+        year, x, y = key
+        cell = pack_cell(x, y)
+        old = self.at(year, x, y) or ()
+        super().__delitem__(key)
+        self._index(year, cell, old, -1)
+        self._occupied(year, cell, False)
+
+    def clear(self) -> None:
+        super().clear()
+        self._keys.clear()
+        self._empty = {yr: set(cells) for yr, cells in self._walkable.items()}
+
+    def added(self, key: TileKey, inst: ItemInstance) -> None:
+        """Record that ``inst`` was appended to the list at ``key``."""
+
+        year, x, y = key
+        cell = pack_cell(x, y)
+        self.adjust(year, 1)
+        self._index(year, cell, (inst,), 1)
+        self._occupied(year, cell, True)
+
+    def removed(self, key: TileKey, inst: ItemInstance) -> None:
+        """Record that ``inst`` was taken out of the list at ``key``."""
+
+        year, x, y = key
+        cell = pack_cell(x, y)
+        self.adjust(year, -1)
+        self._index(year, cell, (inst,), -1)
+        if not self.at(year, x, y):
+            self._occupied(year, cell, False)
+
+    def item_keys(self, year: int) -> Iterable[str]:
+        return self._keys.get(year, {}).keys()
+
+    def cells_with(self, year: int, item_key: str) -> Iterable[int]:
+        """Return the :func:`pack_cell` cells of ``year`` holding ``item_key``."""
+
+        return self._keys.get(year, {}).get(item_key, {}).keys()
+
+    def track_empty(self, year: int, walkable: Iterable[int]) -> None:
+        """Start keeping the empty cells among ``walkable`` for ``year``."""
+
+        cells = set(walkable)
+        self._walkable[year] = cells
+        self._empty[year] = cells.difference(
+            c for c, items in self.bucket(year).items() if items
+        )
+
+    def empty_cells(self, year: int) -> set[int] | None:
+        """Empty walkable cells of ``year``, if :meth:`track_empty` was called."""
+
+        return self._empty.get(year)
+
+
+class CellSet(AbstractSet[Coordinate]):
+    """Live read-only view of a set of :func:`pack_cell` cells as coordinates."""
+
+    __slots__ = ("_cells",)
+
+    def __init__(self, cells: set[int]):
+        self._cells = cells
+
+    def __contains__(self, tile: object) -> bool:
+        if not isinstance(tile, tuple) or len(tile) != 2:
+            return False
+        x, y = tile
+        if not (-_CELL_BIAS <= x < _CELL_BIAS and -_CELL_BIAS <= y < _CELL_BIAS):
+            return False
+        return pack_cell(x, y) in self._cells
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        return map(unpack_cell, self._cells)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
 
 class World:
     def __init__(
         self,
         ground: GroundMap | None = None,
-        seeded_years: Optional[Set[int]] = None,
+        seeded_years: set[int] | None = None,
         monsters: Mapping[TileKey, MonsterList] | None = None,
         *,
         seed_monsters: bool = False,
         global_seed: int | None = None,
         turn: int = 0,
+        normalized: bool = False,
+        config: WorldConfig | None = None,
     ):
-        self.years: Dict[int, Year] = {}
-        self.ground: MutableMapping[TileKey, list[ItemInstance]] = {}
-        if ground:
+        self.config = config or WorldConfig()
+        self.years: dict[int, Year] = {}
+        # Tiles whose ground items or monsters changed since the last
+        # :meth:`take_dirty`.  ``_dirty_all`` forces a full re-encode, e.g. for
+        # a fresh world or after one of the raw maps was replaced wholesale.
+        self._dirty_ground: set[TileKey] = set()
+        self._dirty_monsters: set[TileKey] = set()
+        self._dirty_all = True
+        self._dirty_epoch = 0
+        # Ground items and monsters are bucketed per century; see
+        # :class:`YearTiles`.
+        self._ground = GroundTiles()
+        # ``normalized`` maps (as returned by ``persistence.load``) already hold
+        # final records and are adopted as-is.
+        if ground and normalized:
+            self._ground.update(cast(Mapping[TileKey, list[ItemInstance]], ground))
+        elif ground:
             for coord, val in ground.items():
-                self.ground[coord] = [coerce_item(v) for v in val]
-        self.seeded_years: Set[int] = set(seeded_years or [])
-        if global_seed is None:
-            from . import gen
+                self._ground[coord] = [coerce_item(v) for v in val]
+        self.seeded_years: set[int] = set(seeded_years or [])
+        from . import gen
 
+        if global_seed is None:
             global_seed = gen.SEED
         self.global_seed = global_seed
+        # Each century owns this many ids for the monsters generation seeds
+        # there, so they do not depend on the order centuries are generated.
+        self._id_slots = gen.monster_quota(self.config)
+        reserved = self._id_slots * self.config.eras
+        # Ids widen past four digits when the reserved blocks, plus as many
+        # again for top-ups and spawns, would not fit.
         self._id_alloc = monsters_mod.MonsterIdAllocator(
-            rng_mod.hrand(self.global_seed, "mon_ids_v1")
+            rng_mod.hrand(self.global_seed, "mon_ids_v1"),
+            monsters_mod.id_digits(2 * reserved),
+            reserved=reserved,
         )
-        self._monsters: MutableMapping[TileKey, list[MonsterRec]] = {}
+        self._monster_map: YearTiles[MonsterRec] = YearTiles()
+        # Aggro monsters per year, maintained by the records themselves; see
+        # :class:`monsters.MonsterRecord`.
+        self._aggro: dict[int, dict[int, monsters_mod.MonsterRecord]] = {}
+        # Every placed monster with an id; its tile is the record's ``pos``.
+        self._by_id: dict[int, monsters_mod.MonsterRecord] = {}
         self._seed_monsters = seed_monsters
+        # Centuries kept in storage until first touched; see
+        # :meth:`set_year_loader`.
+        self._unloaded_years: set[int] = set()
+        self._year_loader: Callable[[World, int], None] | None = None
+        self._seed_on_load: set[int] = set()
         if monsters:
-            for coord, data in monsters.items():
-                lst: list[MonsterRec] = []
-                for entry in data:
-                    key_val = entry.get("key")
-                    if key_val is None:
-                        continue
-                    m_key = cast(str, key_val)
-                    hp_val = entry.get("hp")
-                    hp_int = int(cast(int, hp_val)) if hp_val is not None else None
-                    aggro = entry.get("aggro", False)
-                    seen = entry.get("seen", False)
-                    has_yelled = entry.get("yelled_once") or entry.get(
-                        "has_yelled_this_aggro", False
-                    )
-                    mid_val = entry.get("id")
-                    mid = int(cast(int, mid_val)) if mid_val is not None else None
-                    loot_i = entry.get("loot_ions", 0)
-                    loot_r = entry.get("loot_riblets", 0)
-                    base = monsters_mod.REGISTRY[m_key].base_hp
-                    if mid is None:
-                        mid = self._id_alloc.allocate()
-                    else:
-                        self._id_alloc.note_existing(mid)
-                    name = f"{monsters_mod.REGISTRY[m_key].name}-{mid:04d}"
-                    m: MutableMapping[str, object] = {
-                        "key": m_key,
-                        "hp": hp_int if hp_int is not None else base,
-                        "name": name,
-                        "aggro": bool(aggro),
-                        "seen": bool(seen),
-                        "yelled_once": bool(has_yelled),
-                        "id": int(mid),
-                        "loot_ions": int(cast(int, loot_i)),
-                        "loot_riblets": int(cast(int, loot_r)),
-                    }
-                    if m.get("aggro") and not m.get("seen"):
-                        m["aggro"] = False
-                        m["yelled_once"] = False
-                    lst.append(m)
-                if lst:
-                    self._monsters[coord] = lst
+            self._ingest_monsters(monsters, normalized=normalized)
         self._recent_monster_moves: list[tuple[int, int, int, int, int]] = []
         self.turn = turn
-        self._room_headers: Dict[Tuple[int, int, int], str] = {}
 
-    def ground_item(self, year: int, x: int, y: int) -> Optional[ItemInstance]:
-        items = self.ground.get((year, x, y))
+    # Change tracking ----------------------------------------------------------
+
+    @property
+    def ground(self) -> GroundTiles:
+        return self._ground
+
+    @ground.setter
+    def ground(self, value: Mapping[TileKey, list[ItemInstance]]) -> None:
+        self._ground = GroundTiles(value)
+        self._dirty_all = True
+
+    @property
+    def _monsters(self) -> YearTiles[MonsterRec]:
+        return self._monster_map
+
+    @_monsters.setter
+    def _monsters(self, value: Mapping[TileKey, list[MonsterRec]]) -> None:
+        self._monster_map = YearTiles(value)
+        self._aggro = {}
+        self._by_id = {}
+        for coord, lst in self._monster_map.items():
+            for i, m in enumerate(lst):
+                lst[i] = self._track(coord, m)
+        self._dirty_all = True
+
+    def _track(self, coord: TileKey, m: MonsterRec) -> monsters_mod.MonsterRecord:
+        """Bind ``m`` to ``coord``, its year's aggro index and the id index."""
+
+        if not isinstance(m, monsters_mod.MonsterRecord):
+            m = monsters_mod.MonsterRecord.from_mapping(m)
+        m.pos = coord
+        m.aggro_index = self._aggro.setdefault(coord[0], {})
+        if m.aggro:
+            m.aggro_index[id(m)] = m
+        if m.id is not None:
+            self._by_id[m.id] = m
+        return m
+
+    def _untrack(self, m: MonsterRec) -> None:
+        if isinstance(m, monsters_mod.MonsterRecord) and m.aggro_index is not None:
+            m.aggro_index.pop(id(m), None)
+            m.aggro_index = None
+            m.pos = None
+            if m.id is not None and self._by_id.get(m.id) is m:
+                del self._by_id[m.id]
+
+    def _touch_ground(self, key: TileKey) -> None:
+        self._dirty_ground.add(key)
+
+    def _touch_monsters(self, key: TileKey) -> None:
+        self._dirty_monsters.add(key)
+
+    def take_dirty(self) -> tuple[set[TileKey], set[TileKey], bool]:
+        """Return and reset ``(ground_tiles, monster_tiles, everything)``.
+
+        ``everything`` is ``True`` when the tile sets cannot be trusted and the
+        whole world has to be treated as changed.
+        """
+
+        out = (self._dirty_ground, self._dirty_monsters, self._dirty_all)
+        self._dirty_ground = set()
+        self._dirty_monsters = set()
+        self._dirty_all = False
+        self._dirty_epoch += 1
+        return out
+
+    def wipe(self) -> None:
+        """Remove every ground item, monster and seeded-year marker."""
+
+        self._ground.clear()
+        self._monster_map.clear()
+        self._aggro = {}
+        self._by_id = {}
+        self.seeded_years.clear()
+        self._unloaded_years.clear()
+        self._dirty_all = True
+
+    # Lazily loaded centuries ----------------------------------------------------
+
+    def set_year_loader(
+        self, loader: Callable[[World, int], None], years: Iterable[int]
+    ) -> None:
+        """Defer ``years`` until first touched by :meth:`year`.
+
+        ``loader(world, year)`` is then expected to fill the century in via
+        :meth:`absorb_year`.
+        """
+
+        self._year_loader = loader
+        self._unloaded_years.update(years)
+
+    def is_loaded(self, year: int) -> bool:
+        return year not in self._unloaded_years
+
+    def load_year(self, year: int) -> None:
+        if year in self._unloaded_years:
+            self._unloaded_years.discard(year)
+            if self._year_loader is not None:
+                self._year_loader(self, year)
+
+    def reserve_monster_ids(self, ids: Iterable[int]) -> None:
+        """Keep ``ids`` (used by monsters not loaded yet) from being allocated."""
+
+        for mid in ids:
+            self._id_alloc.note_existing(int(mid))
+
+    def absorb_year(
+        self,
+        ground: Mapping[TileKey, list[ItemInstance]],
+        monsters: Mapping[TileKey, list[MonsterRec]],
+    ) -> None:
+        """Merge tiles read from storage without marking them as changed."""
+
+        self._ground.update(ground)
+        for coord in self._ingest_monsters(monsters, normalized=True):
+            self._touch_monsters(coord)
+
+    def _ingest_monsters(
+        self, monsters: Mapping[TileKey, MonsterList], *, normalized: bool
+    ) -> set[TileKey]:
+        """Add stored monsters, registering their ids with the allocator.
+
+        Returns the tiles where monsters without an id were given one.
+        """
+
+        pending: list[tuple[TileKey, monsters_mod.MonsterRecord]] = []
+        for coord, data in monsters.items():
+            if normalized:
+                lst = cast(list[MonsterRec], data)
+            else:
+                lst = [r for r in map(monsters_mod.normalize, data) if r is not None]
+            for i, m in enumerate(lst):
+                lst[i] = mm = self._track(coord, m)
+                if mm.id is not None:
+                    self._id_alloc.note_existing(mm.id)
+                else:
+                    pending.append((coord, mm))
+            if lst:
+                self._monster_map[coord] = lst
+        # Allocate only once every stored id is known to be taken.
+        for coord, mm in pending:
+            mm.id = self._id_alloc.allocate()
+            self._by_id[mm.id] = mm
+        return {coord for coord, _ in pending}
+
+    def ground_item(self, year: int, x: int, y: int) -> ItemInstance | None:
+        items = self._ground.at(year, x, y)
         if items:
             return items[0]
         return None
 
-    def set_ground_item(
-        self, year: int, x: int, y: int, item_key: Optional[str]
-    ) -> None:
+    def set_ground_item(self, year: int, x: int, y: int, item_key: str | None) -> None:
         key = (year, x, y)
         if item_key is None:
-            self.ground.pop(key, None)
+            self._ground.pop(key, None)
         else:
-            self.ground[key] = [coerce_item(item_key)]
+            self._ground[key] = [coerce_item(item_key)]
+        self._touch_ground(key)
 
     def add_ground_item(
         self, year: int, x: int, y: int, item: ItemInstance | str
     ) -> None:
-        self.ground.setdefault((year, x, y), []).append(coerce_item(item))
+        key = (year, x, y)
+        inst = coerce_item(item)
+        self._ground.setdefault(key, []).append(inst)
+        self._ground.added(key, inst)
+        self._touch_ground(key)
 
     def remove_ground_item(
         self, year: int, x: int, y: int, item_key: str
     ) -> ItemInstance | None:
-        items = self.ground.get((year, x, y))
+        key = (year, x, y)
+        items = self._ground.get(key)
         if not items:
             return None
         for i, inst in enumerate(items):
             if inst["key"] == item_key:
                 removed = items.pop(i)
+                self._ground.removed(key, removed)
                 if not items:
-                    self.ground.pop((year, x, y), None)
+                    self._ground.pop(key, None)
+                self._touch_ground(key)
                 return removed
         return None
 
+    def clear_ground(self, year: int, x: int, y: int) -> None:
+        key = (year, x, y)
+        if self._ground.pop(key, None) is not None:
+            self._touch_ground(key)
+
     def items_here(self, year: int, x: int, y: int) -> list[str]:
-        vals = self.ground.get((year, x, y), [])
+        vals = self._ground.at(year, x, y) or []
         names: list[str] = []
         for v in vals:
             idef = get_item_def_by_key(v["key"])
@@ -247,7 +761,7 @@ class World:
         return names
 
     def items_on_ground(self, year: int, x: int, y: int) -> list[items_mod.ItemDef]:
-        vals = self.ground.get((year, x, y), [])
+        vals = self._ground.at(year, x, y) or []
         out: list[items_mod.ItemDef] = []
         for v in vals:
             idef = get_item_def_by_key(v["key"])
@@ -256,30 +770,82 @@ class World:
         return out
 
     def room_description(self, year: int, x: int, y: int) -> str:
-        """Return the room header for the given tile, generating on demand."""
-        key = (year, x, y)
-        header = self._room_headers.get(key)
-        if header is None:
-            rng = random.Random(hash((self.global_seed, year, x, y, "room_header_v1")))
-            header = rng.choice(ROOM_HEADERS)
-            self._room_headers[key] = header
-        return header
+        """Return the room header for the given tile.
+
+        Headers are looked up in the century's table; see :class:`Year`.
+        """
+
+        yr = self.years.get(year) or self.year(year)
+        i = yr.grid.index(x, y)
+        if yr.headers is not None and yr.grid.contains(x, y):
+            return ROOM_HEADERS[yr.headers[i]]
+        return ROOM_HEADERS[rng_mod.draw(yr.header_key, i) % len(ROOM_HEADERS)]
 
     # Helpers for daily top-up -------------------------------------------------
 
     def known_years(self) -> list[int]:
-        yrs = (
-            set(self.years.keys())
-            | {y for (y, _, _) in self.ground.keys()}
-            | set(self.seeded_years)
-        )
+        yrs = set(self.years.keys()) | self._ground.years() | set(self.seeded_years)
         return sorted(yrs)
 
-    def walkable_coords(self, year: int) -> Iterable[Tuple[int, int]]:
-        for y in range(GRID_MIN, GRID_MAX):
-            for x in range(GRID_MIN, GRID_MAX):
+    def walkable_coords(self, year: int) -> Iterable[tuple[int, int]]:
+        x_min, y_min, x_max, y_max = grid_bounds(self.config.width, self.config.height)
+        for y in range(y_min, y_max):
+            for x in range(x_min, x_max):
                 yield (x, y)
 
+    def walkable_count(self, year: int) -> int:
+        return self.config.width * self.config.height
+
+    def empty_walkables(self, year: int) -> CellSet:
+        """Walkable tiles of ``year`` without ground items, in no set order.
+
+        The ground index keeps the empty cells up to date from the first call
+        on and the result is a live view of it, so do not change the ground
+        while iterating.  Callers that need an order sort what they pick.
+        """
+
+        empty = self._ground.empty_cells(year)
+        if empty is None:
+            x_min, y_min, x_max, y_max = grid_bounds(
+                self.config.width, self.config.height
+            )
+            # A column's cells are consecutive packed ints.
+            columns = (
+                range(pack_cell(x, y_min), pack_cell(x, y_max - 1) + 1)
+                for x in range(x_min, x_max)
+            )
+            self._ground.track_empty(year, itertools.chain.from_iterable(columns))
+            empty = cast(set[int], self._ground.empty_cells(year))
+        return CellSet(empty)
+
+    def item_tiles(self, year: int, item_key: str) -> list[Coordinate]:
+        """Tiles of ``year`` holding at least one ``item_key``."""
+
+        return [unpack_cell(c) for c in self._ground.cells_with(year, item_key)]
+
+    def nearest_items(
+        self, year: int, x: int, y: int, item_keys: Iterable[str], limit: int = 5
+    ) -> list[tuple[int, int, int, str]]:
+        """Up to ``limit`` ``(x, y, dist, key)`` hits for ``item_keys``, nearest first.
+
+        Distance is the walk through the maze from ``(x, y)`` (see
+        :meth:`distance_field`), ties broken by row, column and key.  Tiles
+        out of reach are left out.
+        """
+
+        tiles: dict[Coordinate, list[str]] = {}
+        for key in item_keys:
+            for tile in self.item_tiles(year, key):
+                tiles.setdefault(tile, []).append(key)
+        field = self.distance_field(year, x, y, tiles)
+        hits = sorted(
+            (field[(ix, iy)], iy, ix, key)
+            for (ix, iy), keys in tiles.items()
+            if (ix, iy) in field
+            for key in keys
+        )
+        return [(ix, iy, d, key) for d, iy, ix, key in hits[:limit]]
+
     def item_at(self, year: int, x: int, y: int) -> ItemInstance | None:
         return self.ground_item(year, x, y)
 
@@ -287,7 +853,7 @@ class World:
         self.add_ground_item(year, x, y, item_key)
 
     def ground_items_count(self, year: int) -> int:
-        return sum(len(v) for (yr, _, _), v in self.ground.items() if yr == year)
+        return self._ground.count(year)
 
     # convenience aliases used in tests
     def count_monsters_for_year(self, year: int) -> int:
@@ -297,33 +863,32 @@ class World:
         return self.ground_items_count(year)
 
     @property
-    def monsters(self) -> MutableMapping[TileKey, list[MonsterRec]]:
+    def monsters(self) -> YearTiles[MonsterRec]:
         return self._monsters
 
     # Monsters -----------------------------------------------------------------
 
     def monsters_in_year(self, year: int) -> dict[tuple[int, int], list[str]]:
-        out: dict[tuple[int, int], list[str]] = {}
-        for (yr, x, y), lst in self._monsters.items():
-            if yr == year:
-                out[(x, y)] = [cast(str, m["key"]) for m in lst]
-        return out
+        return {
+            unpack_cell(cell): [cast(str, m["key"]) for m in lst]
+            for cell, lst in self._monsters.bucket(year).items()
+        }
 
     def monster_positions(self, year: int) -> Iterator[tuple[int, int, MonsterRec]]:
-        for (yr, x, y), lst in self._monsters.items():
-            if yr == year:
-                for m in lst:
-                    yield (x, y, m)
+        for cell, lst in self._monsters.bucket(year).items():
+            x, y = unpack_cell(cell)
+            for m in lst:
+                yield (x, y, m)
 
     def has_monster(self, year: int, x: int, y: int) -> bool:
-        return bool(self._monsters.get((year, x, y)))
+        return bool(self._monsters.at(year, x, y))
 
     def monster_here(self, year: int, x: int, y: int) -> MonsterRec | None:
-        lst = self._monsters.get((year, x, y))
+        lst = self._monsters.at(year, x, y)
         return lst[0] if lst else None
 
     def monsters_here(self, year: int, x: int, y: int) -> list[MonsterRec]:
-        return list(self._monsters.get((year, x, y), []))
+        return list(self._monsters.at(year, x, y) or ())
 
     def on_entry_aggro_check(
         self, year: int, x: int, y: int, player, seed_parts=()
@@ -333,88 +898,151 @@ class World:
         from .rng import hrand
 
         yells: list[str] = []
-        base = hrand(*seed_parts, year, x, y, "aggro_enter")
-        for m in self.monsters_here(year, x, y):
+        rolls = hrand(*seed_parts, year, x, y, "aggro_enter")
+        here = self.monsters_here(year, x, y)
+        if here:
+            self._touch_monsters((year, x, y))
+        for m in here:
             mm = cast(MutableMapping[str, object], m)
             if not mm.get("seen"):
                 mm["seen"] = True
             if mm.get("aggro"):
                 continue
-            if hrand(base.random(), mm.get("id"), "mroll").random() < 0.5:
+            if rolls.random() < 0.5:
                 msg = set_aggro(mm)
                 if msg:
                     yells.append(msg)
         return yells
 
     def reset_all_aggro(self) -> None:
-        for lst in self._monsters.values():
-            for m in lst:
-                mm = cast(MutableMapping[str, object], m)
-                mm["aggro"] = False
-                mm["yelled_once"] = False
+        for year in list(self._aggro):
+            self.reset_aggro_in_year(year)
 
     def reset_aggro_in_year(self, year: int) -> None:
-        for _, _, m in self.monster_positions(year):
-            mm = cast(MutableMapping[str, object], m)
-            mm["aggro"] = False
-            mm["yelled_once"] = False
+        # ``yelled_once`` is only ever set together with ``aggro``, so the
+        # aggro index covers every monster that needs resetting.
+        for m in list(self._aggro.get(year, {}).values()):
+            m.aggro = False
+            m.yelled_once = False
+            self._touch_monsters(cast(TileKey, m.pos))
+
+    def place_monster(
+        self, year: int, x: int, y: int, key: str, *, slot: int | None = None
+    ) -> bool:
+        """Place a new ``key`` monster at ``(x, y)``.
+
+        Generation passes ``slot``, the monster's place in the century's
+        seeding order, to give it the id reserved for it.
+        """
 
-    def place_monster(self, year: int, x: int, y: int, key: str) -> bool:
         coord = (year, x, y)
-        mid = self._id_alloc.allocate()
-        self._monsters.setdefault(coord, []).append(monsters_mod.spawn(key, mid))
+        if slot is not None and slot < self._id_slots:
+            century = (year - LOWEST_CENTURY) // 100
+            mid = self._id_alloc.claim(century * self._id_slots + slot)
+        else:
+            mid = self._id_alloc.allocate()
+        m = self._track(coord, monsters_mod.spawn(key, mid))
+        self._monsters.setdefault(coord, []).append(m)
+        self._monsters.adjust(year, 1)
+        self._touch_monsters(coord)
         return True
 
     def ensure_monster(self, year: int, x: int, y: int, key: str) -> None:
-        mid = self._id_alloc.allocate()
-        self._monsters.setdefault((year, x, y), []).append(monsters_mod.spawn(key, mid))
+        self.place_monster(year, x, y, key)
 
-    def damage_monster(self, year: int, x: int, y: int, dmg: int, player=None) -> bool:
-        coord = (year, x, y)
-        lst = self._monsters.get(coord)
-        if not lst:
-            return False
-        m = cast(MutableMapping[str, object], lst[0])
-        mid = int(cast(int, m["id"]))
-        hp_val = int(cast(int, m["hp"]))
-        m["hp"] = max(0, hp_val - max(0, dmg))
-        if int(cast(int, m["hp"])) <= 0:
-            lst.pop(0)
-            self._id_alloc.release(mid)
-            if not lst:
-                self._monsters.pop(coord, None)
-            if player is not None and getattr(
-                player, "ready_to_combat_id", None
-            ) == str(mid):
-                player.ready_to_combat_id = None
-                player.ready_to_combat_name = None
-            return True
-        return False
+    def monster_by_id(
+        self, mid: int | str
+    ) -> tuple[TileKey, monsters_mod.MonsterRecord] | None:
+        """Return the tile and record of the placed monster numbered ``mid``.
+
+        String ids, as kept in ``ready_to_combat_id``, are accepted too.
+        """
+
+        try:
+            m = self._by_id.get(int(mid))
+        except ValueError:
+            return None
+        if m is None or m.pos is None:
+            return None
+        return m.pos, m
+
+    def _monster_index(self, coord: TileKey, mid: int | None) -> int | None:
+        """Index in ``coord``'s list of monster ``mid``, or of the first one."""
 
-    def remove_monster(self, year: int, x: int, y: int, player=None) -> bool:
-        coord = (year, x, y)
         lst = self._monsters.get(coord)
         if not lst:
-            return False
-        m = lst.pop(0)
-        mid = int(cast(int, m.get("id", 0)))
-        self._id_alloc.release(mid)
+            return None
+        if mid is None:
+            return 0
+        hit = self.monster_by_id(mid)
+        if hit is None or hit[0] != coord:
+            return None
+        for i, m in enumerate(lst):
+            if m is hit[1]:
+                return i
+        return None
+
+    def _drop_monster(self, coord: TileKey, i: int, player) -> None:
+        lst = self._monsters[coord]
+        m = cast(monsters_mod.MonsterRecord, lst.pop(i))
+        self._untrack(m)
+        self._monsters.adjust(coord[0], -1)
+        self._touch_monsters(coord)
         if not lst:
             self._monsters.pop(coord, None)
+        if m.id is None:
+            return
+        self._id_alloc.release(m.id)
         if player is not None and getattr(player, "ready_to_combat_id", None) == str(
-            mid
+            m.id
         ):
             player.ready_to_combat_id = None
             player.ready_to_combat_name = None
+
+    def damage_monster(
+        self,
+        year: int,
+        x: int,
+        y: int,
+        dmg: int,
+        player=None,
+        *,
+        mid: int | None = None,
+    ) -> bool:
+        """Damage monster ``mid`` on the tile, or the first one there.
+
+        Returns ``True`` when the monster dies and is removed.
+        """
+
+        coord = (year, x, y)
+        i = self._monster_index(coord, mid)
+        if i is None:
+            return False
+        m = cast(monsters_mod.MonsterRecord, self._monsters[coord][i])
+        self._touch_monsters(coord)
+        m.hp = max(0, m.hp - max(0, dmg))
+        if m.hp <= 0:
+            self._drop_monster(coord, i, player)
+            return True
+        return False
+
+    def remove_monster(
+        self, year: int, x: int, y: int, player=None, *, mid: int | None = None
+    ) -> bool:
+        coord = (year, x, y)
+        i = self._monster_index(coord, mid)
+        if i is None:
+            return False
+        self._drop_monster(coord, i, player)
         return True
 
     def monster_count(self, year: int) -> int:
-        return sum(len(v) for (yr, _, _), v in self._monsters.items() if yr == year)
+        return self._monsters.count(year)
 
     # Movement ---------------------------------------------------------------
 
     def any_aggro_in_year(self, year: int) -> bool:
-        return any(m.get("aggro", False) for _, _, m in self.monster_positions(year))
+        return bool(self._aggro.get(year))
 
     def move_monsters_one_tick(
         self, year: int, player
@@ -424,7 +1052,7 @@ class World:
         Returns arrival info for monsters entering the player's tile as a list
         of ``(id, name, direction)`` and a footsteps event of the form
         ``("faint"|"loud", dir)`` or ``None`` if no monster movement produced
-        audible footsteps.
+        audible footsteps.  Monsters move in ``(x, y)`` order of their tiles.
         """
 
         if not self.any_aggro_in_year(year):
@@ -435,52 +1063,46 @@ class World:
 
         px, py = player.x, player.y
 
-        for x, y, m in list(self.monster_positions(year)):
-            if not m.get("aggro", False):
-                continue  # passive monsters never move
-
-            base_d = abs(px - x) + abs(py - y)
+        # Passive monsters never move, so only the aggro index is visited.
+        # Chasers move in tile order, whenever they turned aggro, so footsteps
+        # and arrivals are reported in the same order on every run.
+        chasers = sorted(self._aggro[year].values(), key=lambda m: m.pos)
+        field = self.distance_field(
+            year, px, py, {cast(TileKey, m.pos)[1:] for m in chasers}
+        )
+        for m in chasers:
+            _yr, x, y = cast(TileKey, m.pos)
             pre_dir = _dir_from(px, py, x, y)
 
-            best: tuple[str, int, int, int] | None = None
-            for d in ORDER:
-                if not self.is_open(year, x, y, d):
-                    continue
-                nx, ny = x + DIR[d][0], y + DIR[d][1]
-                new_d = abs(px - nx) + abs(py - ny)
-                if new_d < base_d:
-                    cand = (d, nx, ny, new_d)
-                    if (
-                        best is None
-                        or cand[3] < best[3]
-                        or (
-                            cand[3] == best[3] and ORDER.index(d) < ORDER.index(best[0])
-                        )
-                    ):
-                        best = cand
-
-            if best is None:
-                continue  # no progress toward player
-
-            d, nx, ny, ndist = best
+            # Step downhill; every lower neighbour is exactly one closer, so
+            # the first one in ORDER wins ties.
+            here = field.get((x, y))
+            if not here:
+                continue  # unreachable, or already on the player's tile
+            for nx, ny in self.neighbors(year, x, y).values():
+                if field.get((nx, ny)) == here - 1:
+                    break
+            else:
+                continue
+            ndist = abs(px - nx) + abs(py - ny)
 
             # Commit move
             lst = self._monsters.get((year, x, y)) or []
             try:
                 lst.remove(m)
+                self._monsters.adjust(year, -1)
             except ValueError:
                 pass
             if not lst:
                 self._monsters.pop((year, x, y), None)
-            else:
-                self._monsters[(year, x, y)] = lst
             self._monsters.setdefault((year, nx, ny), []).append(m)
+            self._monsters.adjust(year, 1)
+            m.pos = (year, nx, ny)
+            self._touch_monsters((year, x, y))
+            self._touch_monsters((year, nx, ny))
 
             if (nx, ny) == (px, py):
-                mm2 = cast(MutableMapping[str, object], m)
-                arrivals.append(
-                    (int(cast(int, mm2["id"])), cast(str, mm2["name"]), pre_dir)
-                )
+                arrivals.append((cast(int, m.id), m.name, pre_dir))
 
             if footsteps_event is None:
                 post_dx, post_dy = nx - px, ny - py
@@ -491,28 +1113,51 @@ class World:
 
         return arrivals, footsteps_event
 
+    def distance_field(
+        self, year: int, x: int, y: int, targets: Iterable[Coordinate] = ()
+    ) -> dict[Coordinate, int]:
+        """Return walking distances from ``(x, y)`` to the tiles of ``year``.
+
+        A breadth-first search over the grid's exits.  When ``targets`` is
+        given the search stops once all of them have been reached, or once
+        :data:`CHASE_MAX_TILES` tiles are known; tiles left out of the result
+        are further away than every target or out of reach of a chase.
+        """
+
+        neighbors = self._grid(year).neighbors
+        field: dict[Coordinate, int] = {(x, y): 0}
+        pending = set(targets)
+        exhaustive = not pending
+        pending.discard((x, y))
+        queue = deque([(x, y)])
+        while queue and (exhaustive or (pending and len(field) < CHASE_MAX_TILES)):
+            here = queue.popleft()
+            dist = field[here] + 1
+            for nxt in neighbors(*here).values():
+                if nxt not in field:
+                    field[nxt] = dist
+                    pending.discard(nxt)
+                    queue.append(nxt)
+        return field
+
     def shadow_dirs(self, year: int, x: int, y: int) -> list[Direction]:
-        dirs: list[Direction] = []
-        for d in ORDER:
-            if self.is_open(year, x, y, d):
-                nx, ny = x + DIR[d][0], y + DIR[d][1]
-                if self.has_monster(year, nx, ny):
-                    dirs.append(d)
-        return dirs
+        return [
+            d
+            for d, (nx, ny) in self.neighbors(year, x, y).items()
+            if self.has_monster(year, nx, ny)
+        ]
 
     def adjacent_monster_names(
         self, year: int, x: int, y: int
     ) -> list[tuple[str, str]]:
         results: list[tuple[str, str]] = []
-        for d in ("east", "west", "north", "south"):
-            if self.is_open(year, x, y, d):
-                ax, ay = self.step(x, y, d)
-                m = self.monster_here(year, ax, ay)
-                if m:
-                    mm = cast(Mapping[str, object], m)
-                    key = cast(str, mm["key"])
-                    name = monsters_mod.REGISTRY[key].name
-                    results.append((name, key))
+        for ax, ay in self.neighbors(year, x, y).values():
+            m = self.monster_here(year, ax, ay)
+            if m:
+                mm = cast(Mapping[str, object], m)
+                key = cast(str, mm["key"])
+                name = monsters_mod.REGISTRY[key].name
+                results.append((name, key))
         return results
 
     def resolve_monster_prefix_nearby(
@@ -552,10 +1197,16 @@ class World:
     def force_monster_move_within4(self, year: int = 2000) -> None:
         self._recent_monster_moves.append((year, 1, 0, 1, 1))
 
+    def _grid(self, year: int) -> Grid:
+        return (self.years.get(year) or self.year(year)).grid
+
     def is_open(self, year: int, x: int, y: int, direction: Direction) -> bool:
-        """Return ``True`` if moving from ``(x, y)`` in ``direction`` stays in bounds."""
-        nx, ny = step(x, y, direction)
-        return in_bounds(nx, ny)
+        """Return ``True`` if there is no wall ``direction`` of ``(x, y)``."""
+        return self._grid(year).is_open(x, y, direction)
+
+    def neighbors(self, year: int, x: int, y: int) -> Mapping[Direction, Coordinate]:
+        """Return the open exits of ``(x, y)``; see :meth:`Grid.neighbors`."""
+        return self._grid(year).neighbors(x, y)
 
     def step(self, x: int, y: int, direction: Direction) -> tuple[int, int]:
         """Return coordinates stepped one tile in ``direction`` from ``(x, y)``."""
@@ -565,9 +1216,8 @@ class World:
         self, year: int, x: int, y: int, max_dist: int = 4
     ) -> tuple[int, int, int] | None:
         hit: tuple[int, int, int] | None = None
-        for (yr, mx, my), _data in self._monsters.items():
-            if yr != year:
-                continue
+        for cell in self._monsters.bucket(year):
+            mx, my = unpack_cell(cell)
             dist = abs(mx - x) + abs(my - y)
             if dist > max_dist:
                 continue
@@ -577,19 +1227,31 @@ class World:
 
     def year(self, value: int) -> Year:
         """Return the :class:`Year` for ``value`` generating it if needed."""
-        if value not in ALLOWED_CENTURIES:
+        if not self.config.has_century(value):
             raise ValueError("Year must be one of the allowed centuries.")
+        self.load_year(value)
         if value not in self.years:
             from . import gen
 
-            grid = gen.generate(seed=value)
+            grid = gen.generate(
+                self.config.width,
+                self.config.height,
+                seed=rng_mod.stable_seed(self.global_seed, value, "maze_v1"),
+            )
             # Ensure starting location is always open
             if not grid.is_walkable(0, 0):
                 raise ValueError("start tile (0,0) must be open")
-            self.years[value] = Year(value, grid)
+            key = rng_mod.stable_seed(self.global_seed, value, "room_header_v2")
+            cells = grid.width * grid.height
+            headers = (
+                room_header_table(key, cells) if cells <= gen.TABLE_MAX_CELLS else None
+            )
+            self.years[value] = Year(value, grid, key, headers)
+            fresh = value not in self.seeded_years
             gen.seed_items(self, value, grid)
             had_start = self.has_monster(value, 0, 0)
-            if self._seed_monsters:
+            if fresh and (self._seed_monsters or value in self._seed_on_load):
+                self._seed_on_load.discard(value)
                 gen.seed_monsters_for_year(self, value, self.global_seed)
             # Ensure starting tile is clear unless a monster was explicitly placed
             if not had_start:
@@ -54,8 +54,9 @@ def render_room_at(
     out.append(compass_line(f"Compass: ({cx} : {cy})"))
 
     # (c) exits
+    exits = world.neighbors(year, x, y)
     for d in ("north", "south", "east", "west"):
-        if world.is_open(year, x, y, d):
+        if d in exits:
             # Pad direction labels to align the separator across lines.
             out.append(render_single_exit(d, "area continues."))
 
@@ -81,11 +82,7 @@ def render_room_at(
             context._pre_shadow_lines = []
         if not shadow_lines:
             dirs = set(shadow_dirs_extra)
-            for d in ("east", "west", "north", "south"):
-                if world.is_open(year, x, y, d):
-                    ax, ay = world.step(x, y, d)
-                    if world.has_monster(year, ax, ay):
-                        dirs.add(d)
+            dirs.update(world.shadow_dirs(year, x, y))
             if dirs:
                 shadow_lines = [
                     shadows_line(f"You see shadows to the {', '.join(sorted(dirs))}.")
@@ -0,0 +1,53 @@
+"""Compare JSON and binary save codecs on the default CLI world.
+
+Run with ``PYTHONPATH=. python scripts/bench_save_codec.py``.  Timings are
+machine dependent, so this lives outside the test suite.
+"""
+
+import tempfile
+import timeit
+from pathlib import Path
+
+from mutants2.engine import gen, persistence, save_codec
+from mutants2.engine.player import Player
+from mutants2.engine.world import World
+
+
+def _best_of(fn, number=5, repeat=5):
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def main():
+    w = World(global_seed=gen.SEED)
+    gen.seed_for_cli(w)
+    for year in w.config.centuries:
+        w.year(year)
+    p = Player(year=2000, clazz="Warrior")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+        for codec in ("json", "binary"):
+            persistence.SAVE_CODEC = codec
+            persistence.SAVE_PATH = paths[codec] = Path(tmp) / codec / "save.json"
+            persistence.save(p, w, persistence.Save())
+
+        for codec, path in paths.items():
+            persistence.SAVE_CODEC = codec
+            persistence.SAVE_PATH = path
+            print(f"load {codec:6}  {_best_of(persistence.load) * 1000:8.2f} ms")
+
+        save = persistence.Save()
+        persistence.save(p, w, save)
+        tiles = iter(range(-100, 100))
+
+        def one_tile_save():
+            w.add_ground_item(2000, next(tiles), 2, "nuclear_rock")
+            persistence.save(p, w, save)
+
+        one_tile = _best_of(one_tile_save, number=4)
+        snapshot = _best_of(lambda: save_codec.encode({}, {}, w.ground, w.monsters))
+        print(f"one-tile save  {one_tile * 1000:8.2f} ms")
+        print(f"snapshot       {snapshot * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -170,6 +170,56 @@ def test_debug_item_and_mon_count():
     assert lines2[-1] == f"Monsters in year {p2.year}: 2"
 
 
+def test_debug_find_item_lists_nearest_first():
+    def setup(w, p):
+        w.ground = {k: v for k, v in w.ground.items() if k[0] != p.year}
+        w.add_ground_item(p.year, 5, 0, "nuclear_rock")
+        w.add_ground_item(p.year, 0, 2, "nuclear_rock")
+        w.add_ground_item(p.year, 1, 0, "ion_decay")
+
+    out, w, p = run_debug("debug find item nuc", setup=setup)
+    lines = [line for line in out.splitlines() if line]
+    assert lines[-2:] == [
+        "Nuclear-Rock at (0, 2), 2 away.",
+        "Nuclear-Rock at (5, 0), 5 away.",
+    ]
+    assert (0, 0) in w.empty_walkables(p.year)
+    assert (1, 0) not in w.empty_walkables(p.year)
+    w.remove_ground_item(p.year, 1, 0, "ion_decay")
+    assert (1, 0) in w.empty_walkables(p.year)
+    assert w.item_tiles(p.year, "ion_decay") == []
+
+    empty = w.empty_walkables(p.year)
+    count = len(empty)
+    w.add_ground_item(p.year, 3, 3, "ion_decay")
+    assert (3, 3) not in empty and len(empty) == count - 1
+    assert set(empty) == set(w.walkable_coords(p.year)) - {
+        (x, y) for yr, x, y in w.ground if yr == p.year
+    }
+
+
+def test_debug_find_item_searches_every_match_by_walking_distance():
+    def setup(w, p):
+        grid = world_mod.Grid()
+        # A wall between x=1 and x=2 everywhere except at y=3.
+        for y in range(world_mod.GRID_MIN, world_mod.GRID_MAX):
+            if y != 3:
+                grid.exits[grid.index(1, y)] &= ~world_mod.EXIT_BITS["east"]
+                grid.exits[grid.index(2, y)] &= ~world_mod.EXIT_BITS["west"]
+        w.years[p.year] = world_mod.Year(p.year, grid)
+        w.ground = {k: v for k, v in w.ground.items() if k[0] != p.year}
+        w.add_ground_item(p.year, 2, 0, "nuclear_rock")
+        w.add_ground_item(p.year, 0, 4, "nuclear_waste")
+        w.add_ground_item(p.year, 0, 1, "ion_decay")
+
+    out, _w, _p = run_debug("debug find item nuc", setup=setup)
+    lines = [line for line in out.splitlines() if line]
+    assert lines[-2:] == [
+        "Nuclear-Waste at (0, 4), 4 away.",
+        "Nuclear-Rock at (2, 0), 8 away.",
+    ]
+
+
 def test_debug_set_ion():
     out, w, p = run_debug("debug set ion 123")
     lines = [line for line in out.splitlines() if line]
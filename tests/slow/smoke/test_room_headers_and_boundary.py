@@ -40,3 +40,35 @@ def test_struck_back_boundary():
     assert (p.x, p.y) == (GRID_MIN, 0)
     assert len(out) == 1
     assert "struck back" in out[0].lower()
+
+
+def test_headers_come_from_one_fixed_table_per_century():
+    import tracemalloc
+
+    from mutants2.engine.world import WorldConfig, room_header_table
+
+    w = World(global_seed=123)
+    yr = w.year(2000)
+    assert isinstance(yr.headers, bytes) and len(yr.headers) == 30 * 30
+    grid = yr.grid
+    tiles = [(x, y) for y in range(-15, 15) for x in range(-15, 15)]
+    first = [None] * len(tiles)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i, (x, y) in enumerate(tiles):
+        first[i] = w.room_description(2000, x, y)
+    grown = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert grown < 1024  # nothing is kept per visited tile
+
+    assert first == [ROOM_HEADERS[yr.headers[grid.index(x, y)]] for x, y in tiles]
+    assert len(set(first)) > 1
+    assert World(global_seed=123).room_description(2000, 3, 4) == first[19 * 30 + 18]
+
+    big = World(global_seed=123, config=WorldConfig(400, 400))
+    yr = big.year(2000)
+    assert yr.headers is None
+    row = room_header_table(yr.header_key, 5)
+    assert [big.room_description(2000, x, -200) for x in range(-200, -195)] == [
+        ROOM_HEADERS[i] for i in row
+    ]
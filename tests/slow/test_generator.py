@@ -10,3 +10,74 @@ def test_generator_basics():
     assert exits
     for nx, ny in exits.values():
         assert GRID_MIN <= nx < GRID_MAX and GRID_MIN <= ny < GRID_MAX
+
+
+def test_placement_sampling_is_seeded_and_fills_crowded_maps():
+    from mutants2.engine.rng import hrand
+    from mutants2.engine.world import World
+
+    w = World()
+    w.year(2000)
+    free = gen._item_free(w, 2000)
+    picks = gen._sample_tiles(w, 2000, 50, hrand(1, "pick"), free)
+    assert picks == gen._sample_tiles(w, 2000, 50, hrand(1, "pick"), free)
+    assert len(set(picks)) == 50 and all(free(x, y) for x, y in picks)
+
+    empty = sorted(w.empty_walkables(2000))
+    assert len(empty) > 50
+    for x, y in empty[50:]:
+        w.add_ground_item(2000, x, y, "ion_decay")
+    rest = gen._sample_tiles(w, 2000, 80, hrand(2, "pick"), gen._item_free(w, 2000))
+    assert sorted(rest) == empty[:50] == sorted(w.empty_walkables(2000))
+
+
+def test_sampling_fills_crowded_maps_larger_than_the_tables():
+    from mutants2.engine.rng import hrand
+    from mutants2.engine.world import World, WorldConfig
+
+    config = WorldConfig(300, 300)
+    assert config.width * config.height > gen.TABLE_MAX_CELLS
+    w = World(config=config)
+    gen.seed_for_cli(w)
+    w.year(2000)
+    assert w.monster_count(2000) == gen.monster_quota(config)
+    assert gen.ground_count(w, 2000) > 0
+
+    def free(x, y):
+        return x == 0 and w.item_at(2000, x, y) is None
+
+    # Random draws hit one column in 300; the rest must come from the scan.
+    picks = gen._sample_tiles(w, 2000, 200, hrand(3, "pick"), free)
+    assert picks == gen._sample_tiles(w, 2000, 200, hrand(3, "pick"), free)
+    assert len(set(picks)) == 200 and all(free(x, y) for x, y in picks)
+
+
+def test_startup_generates_only_the_current_century():
+    from mutants2.engine.player import Player
+    from mutants2.engine.world import World
+
+    w = World(global_seed=gen.SEED)
+    gen.seed_for_cli(w)
+    p = Player(year=2300)
+    w.year(p.year)
+    assert set(w.years) == {2300}
+    assert w.seeded_years == {2300}
+    assert {yr for yr, _x, _y in w.monsters} == {2300}
+
+
+def test_lazy_centuries_match_whatever_order_they_are_visited_in():
+    from mutants2.engine.world import ALLOWED_CENTURIES, World
+
+    def contents(order):
+        w = World(global_seed=7)
+        gen.seed_for_cli(w)
+        for year in order:
+            w.year(year)
+        return dict(w.ground), {k: [dict(m) for m in v] for k, v in w.monsters.items()}
+
+    eager = contents(ALLOWED_CENTURIES)
+    assert contents(reversed(ALLOWED_CENTURIES)) == eager
+    assert contents([2500, 2000, 3000, 2100]) == (
+        {k: v for k, v in eager[0].items() if k[0] in (2000, 2100, 2500, 3000)},
+        {k: v for k, v in eager[1].items() if k[0] in (2000, 2100, 2500, 3000)},
+    )
@@ -0,0 +1,126 @@
+import time
+
+from mutants2.engine import gen, rng
+from mutants2.engine.world import (
+    GRID_MAX,
+    GRID_MIN,
+    OPPOSITE,
+    ORDER,
+    World,
+    WorldConfig,
+    step,
+)
+
+
+def test_plaza_has_four_exits():
+    world = World()
+    assert all(world.is_open(2000, 0, 0, d) for d in ORDER)
+
+
+def test_edges_block_out_of_bounds():
+    world = World()
+    for y in range(GRID_MIN, GRID_MAX):
+        assert not world.is_open(2000, GRID_MAX - 1, y, "east")
+        assert not world.is_open(2000, GRID_MIN, y, "west")
+
+
+def test_corners_have_at_most_two_exits():
+    world = World()
+    for x, y in [(GRID_MIN, GRID_MIN), (GRID_MAX - 1, GRID_MAX - 1)]:
+        allowed = sum(world.is_open(2000, x, y, d) for d in ORDER)
+        assert 1 <= allowed <= 2
+
+
+def test_walls_are_symmetric_and_every_room_is_reachable():
+    world = World()
+    grid = world.year(2100).grid
+    seen = {(0, 0)}
+    todo = [(0, 0)]
+    while todo:
+        x, y = todo.pop()
+        for d, (nx, ny) in grid.neighbors(x, y).items():
+            assert (nx, ny) == step(x, y, d)
+            assert grid.is_open(nx, ny, OPPOSITE[d])
+            if (nx, ny) not in seen:
+                seen.add((nx, ny))
+                todo.append((nx, ny))
+    assert len(seen) == 30 * 30
+    assert sum(m.bit_count() for m in grid.exits) < 4 * 30 * 30 - 4 * 30
+
+
+def test_maze_is_deterministic_per_seed_and_year():
+    def exits(seed, year):
+        return World(global_seed=seed).year(year).grid.exits
+
+    assert exits(1, 2000) == exits(1, 2000)
+    assert exits(1, 2000) != exits(1, 2100)
+    assert exits(1, 2000) != exits(2, 2000)
+
+
+def test_walkable_coords_count():
+    world = World()
+    assert len(list(world.walkable_coords(2000))) == 30 * 30
+
+
+def test_neighbor_tables_are_shared_and_match_exit_bits():
+    world = World()
+    grid = world.year(2000).grid
+    assert world.neighbors(2000, 5, 5) is grid.neighbors(5, 5)
+    for x in range(GRID_MIN, GRID_MAX):
+        for y in range(GRID_MIN, GRID_MAX):
+            exits = grid.neighbors(x, y)
+            assert [d for d in ORDER if grid.is_open(x, y, d)] == list(exits)
+    assert grid.neighbors(GRID_MAX, 0) == {}
+
+
+def test_large_mazes_are_carved_in_connected_chunks():
+    width, height = 300, 260
+    assert width * height > gen.TABLE_MAX_CELLS
+    world = World(config=WorldConfig(width, height))
+    grid = world.year(2000).grid
+    assert isinstance(grid.exits, gen._ChunkedExits)
+    assert not grid.exits._chunks
+    assert all(grid.is_open(0, 0, d) for d in ORDER)
+    assert grid.is_walkable(-150, -130) and grid.is_walkable(149, 129)
+    assert not grid.is_walkable(150, 0) and not grid.is_walkable(0, -131)
+
+    seen = {(0, 0)}
+    todo = [(0, 0)]
+    while todo:
+        x, y = todo.pop()
+        for d, (nx, ny) in grid.neighbors(x, y).items():
+            assert grid.contains(nx, ny)
+            assert grid.is_open(nx, ny, OPPOSITE[d])
+            if (nx, ny) not in seen:
+                seen.add((nx, ny))
+                todo.append((nx, ny))
+    assert len(seen) == width * height
+
+    again = gen.generate(width, height, seed=world.year(2000).grid.exits.seed)
+    assert [again.exit_mask(x, 40) for x in range(-150, 150)] == [
+        grid.exit_mask(x, 40) for x in range(-150, 150)
+    ]
+
+
+def test_mazes_for_every_century_build_within_budget(monkeypatch):
+    # Carving draws from one fast stream per maze, not the keyed generator.
+    draws = []
+    real = rng.KeyedRandom.next64
+
+    def counted(self):
+        draws.append(1)
+        return real(self)
+
+    monkeypatch.setattr(rng.KeyedRandom, "next64", counted)
+    gen.generate(seed=7)
+    assert draws == []
+    monkeypatch.undo()
+
+    centuries = WorldConfig().centuries
+    best = float("inf")
+    for _ in range(5):
+        start = time.process_time()
+        for year in centuries:
+            gen.generate(seed=year)
+        best = min(best, time.process_time() - start)
+    assert best < 0.050  # all centuries at startup; measured at about 25 ms
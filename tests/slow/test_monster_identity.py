@@ -1,3 +1,5 @@
+import pytest
+
 from mutants2.engine.world import World
 
 
@@ -26,3 +28,108 @@ def test_monster_ids_unique_and_reusable():
     m3 = w.monster_here(2000, 2, 0)
     assert m3["id"] == n1
     assert m3["name"] == f"Kraken-{n1:04d}"
+
+
+def test_stored_ids_are_never_reallocated():
+    ids = list(range(1000, 9990))
+    monsters = {
+        (2000, 1, i): [{"key": "mutant", "id": mid}] for i, mid in enumerate(ids)
+    }
+    monsters[(2000, 2, 0)] = [{"key": "kraken"}]
+    w = World(monsters=monsters)
+    fresh = w.monster_here(2000, 2, 0)
+    assert fresh["id"] not in ids
+    assert fresh["name"] == f"Kraken-{fresh['id']:04d}"
+    for _ in range(9):
+        w.place_monster(2000, 3, 0, "mutant")
+    taken = {m["id"] for _x, _y, m in w.monster_positions(2000)}
+    assert len(taken) == len(ids) + 10
+
+
+def test_monster_record_is_slotted_and_reads_like_a_dict():
+    from mutants2.engine.monsters import MonsterRecord, spawn
+
+    m = spawn("kraken", 1234)
+    assert not hasattr(m, "__dict__")
+    assert m.name == m["name"] == "Kraken-1234"
+    assert dict(m)["hp"] == m.hp == 3 and m.get("nope") is None
+
+    m["hp"] = 1
+    assert m.hp == 1
+    del m["id"]
+    assert "id" not in m and m.name == "Kraken"
+    assert MonsterRecord.from_mapping(dict(m)) == m
+
+
+def test_id_allocator_is_seeded_and_grows_past_four_digits():
+    import random
+
+    from mutants2.engine.monsters import MonsterIdAllocator
+
+    a = MonsterIdAllocator(random.Random(7), max_digits=5)
+    b = MonsterIdAllocator(random.Random(7), max_digits=5)
+    first = [a.allocate() for _ in range(9000)]
+    assert first == [b.allocate() for _ in range(9000)]
+    assert sorted(first) == list(range(1000, 10000))
+    assert 10000 <= a.allocate() <= 99999
+
+    a.release(first[5])
+    a.release(first[9])
+    assert [a.allocate(), a.allocate()] == [first[9], first[5]]
+
+
+def test_reserved_ids_are_claimed_by_step_and_used_up_last():
+    import random
+
+    from mutants2.engine.monsters import MonsterIdAllocator
+
+    walk = MonsterIdAllocator(random.Random(3))
+    order = [walk.allocate() for _ in range(9000)]
+    a = MonsterIdAllocator(random.Random(3), reserved=10)
+    assert a.claim(4) == order[4]
+    assert a.allocate() == order[10]
+    assert [a.allocate() for _ in range(8989)] == order[11:]
+    rest = [a.allocate() for _ in range(9)]
+    assert rest == [order[i] for i in (0, 1, 2, 3, 5, 6, 7, 8, 9)]
+    with pytest.raises(RuntimeError):
+        a.allocate()
+
+
+def test_worlds_needing_more_than_9000_ids_get_wider_ids():
+    from mutants2.engine import gen
+    from mutants2.engine.world import WorldConfig
+
+    assert World()._id_alloc._max_digits == 4
+    config = WorldConfig(eras=400)
+    quota = gen.monster_quota(config)
+    assert quota * config.eras > 9000
+    w = World(config=config)
+    gen.seed_for_cli(w)
+    late = config.centuries[-3:]
+    for year in late:
+        w.year(year)
+    ids = [m["id"] for year in late for _x, _y, m in w.monster_positions(year)]
+    assert len(set(ids)) == len(ids) == 3 * quota
+    assert max(ids) >= 10000
+    fresh = [w._id_alloc.allocate() for _ in range(9000)]
+    assert len(set(fresh) | set(ids)) == 9000 + len(ids)
+
+
+def test_monster_by_id_follows_moves_and_removal():
+    w = World()
+    w.place_monster(2000, 4, 0, "mutant")
+    w.place_monster(2000, 4, 0, "gargoyle")
+    first, second = w.monsters_here(2000, 4, 0)
+    assert w.monster_by_id(second["id"]) == ((2000, 4, 0), second)
+    assert w.monster_by_id(str(first["id"]))[1] is first
+
+    second["aggro"] = True
+    from mutants2.engine.player import Player
+
+    w.move_monsters_one_tick(2000, Player())
+    assert w.monster_by_id(second["id"])[0] == (2000, 3, 0)
+
+    assert w.damage_monster(2000, 4, 0, 99, mid=second["id"]) is False
+    assert w.remove_monster(2000, 3, 0, mid=second["id"])
+    assert w.monster_by_id(second["id"]) is None
+    assert w.monster_here(2000, 4, 0) is first
@@ -58,3 +58,61 @@ def test_tick_skipped_when_no_aggro(cli, world_cross_year):
     after = list(world_cross_year.monster_positions(2100))[0][:2]
     assert before == after
     assert "footsteps" not in out.lower()
+
+
+def test_aggro_index_tracks_flag_moves_and_deaths():
+    w = world_mod.World()
+    w.place_monster(2000, 3, 0, "mutant")
+    w.place_monster(2000, -5, 5, "mutant")
+    m = w.monster_here(2000, 3, 0)
+    assert not w.any_aggro_in_year(2000)
+
+    m["aggro"] = True
+    assert w.any_aggro_in_year(2000) and not w.any_aggro_in_year(2100)
+    p = Player()
+    w.move_monsters_one_tick(2000, p)
+    assert w.monster_here(2000, 2, 0) is m
+    assert w.monster_here(2000, -5, 5) is not None  # passive, never visited
+
+    w.reset_aggro_in_year(2000)
+    assert not w.any_aggro_in_year(2000) and not m["yelled_once"]
+    m["aggro"] = True
+    w.damage_monster(2000, 2, 0, 99)
+    assert not w.any_aggro_in_year(2000)
+
+
+def test_chasers_path_around_walls():
+    w = world_mod.World()
+    grid = world_mod.Grid()
+    # A wall between x=1 and x=2 everywhere except at y=3.
+    for y in range(world_mod.GRID_MIN, world_mod.GRID_MAX):
+        if y != 3:
+            grid.exits[grid.index(1, y)] &= ~world_mod.EXIT_BITS["east"]
+            grid.exits[grid.index(2, y)] &= ~world_mod.EXIT_BITS["west"]
+    w.years[2000] = world_mod.Year(2000, grid)
+    w.place_monster(2000, 2, 0, "mutant")
+    m = w.monster_here(2000, 2, 0)
+    m["aggro"] = True
+    p = Player()
+    assert w.distance_field(2000, 0, 0)[(2, 0)] == 8
+    w.move_monsters_one_tick(2000, p)
+    assert m.pos == (2000, 2, 1)
+
+
+def test_chasers_move_in_tile_order_not_aggro_order():
+    w = world_mod.World()
+    w.years[2000] = world_mod.Year(2000, world_mod.Grid())
+    tiles = [(-3, 0), (0, -3), (0, 3), (3, 0)]  # sorted (x, y) order
+    for x, y in tiles:
+        w.place_monster(2000, x, y, "mutant")
+    ids = [w.monster_here(2000, x, y)["id"] for x, y in tiles]
+    # Turn them aggro in the reverse of tile order.
+    for x, y in reversed(tiles):
+        w.monster_here(2000, x, y)["aggro"] = True
+    p = Player()
+    arrivals, steps = w.move_monsters_one_tick(2000, p)
+    assert arrivals == []
+    assert steps == ("loud", "west")  # heard from the first chaser, at (-2, 0)
+    w.move_monsters_one_tick(2000, p)
+    arrivals, _ = w.move_monsters_one_tick(2000, p)
+    assert [mid for mid, _name, _dir in arrivals] == ids
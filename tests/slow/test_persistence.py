@@ -1,4 +1,6 @@
-from mutants2.engine.world import World
+import json
+
+from mutants2.engine.world import World, WorldConfig
 from mutants2.engine.player import Player
 from mutants2.engine import persistence
 
@@ -18,3 +20,385 @@ def test_save_load(tmp_path, monkeypatch):
     w2 = World(ground, seeded, monsters)
     p2.travel(w2, 2000)
     assert (p2.x, p2.y) == (0, 0)
+
+
+def test_world_config_is_stored_with_the_save(tmp_path, monkeypatch):
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    config = WorldConfig(120, 80, eras=3)
+    monkeypatch.setattr(persistence, "NEW_WORLD", config)
+    save = persistence.Save()
+    w = World(config=save.world)
+    p = Player()
+    p.travel(w, 2200)
+    persistence.save(p, w, save)
+    assert json.loads(persistence.SAVE_PATH.read_text())["world"] == {
+        "width": 120,
+        "height": 80,
+        "eras": 3,
+    }
+
+    monkeypatch.setattr(persistence, "NEW_WORLD", WorldConfig())
+    p2, _ground, _monsters, _seeded, save2 = persistence.load()
+    assert save2.world == config
+    assert WorldConfig.from_raw(config.to_raw()) == config
+    assert WorldConfig.from_raw(None) == WorldConfig()
+    assert p2.year == 2200
+
+
+def test_save_skips_write_when_nothing_changed(tmp_path):
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = World()
+    w.year(2000)
+    p = Player()
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    persistence.SAVE_PATH.write_text("untouched")
+    persistence.save(p, w, save)
+    assert persistence.SAVE_PATH.read_text() == "untouched"
+
+    p.ions += 5
+    persistence.save(p, w, save)
+    assert persistence.SAVE_PATH.read_text() != "untouched"
+
+
+def test_incremental_save_matches_full_save(tmp_path):
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = World()
+    w.year(2000)
+    p = Player()
+    save = persistence.Save()
+    persistence.save(p, w, save)
+
+    w.add_ground_item(2000, 3, 3, "ion_decay")
+    w.clear_ground(2000, 0, 1)
+    w.place_monster(2000, 2, 2, "mutant")
+    w.damage_monster(2000, 2, 2, 1)
+    persistence.save(p, w, save)
+    incremental = json.loads(persistence.SAVE_PATH.read_text())
+
+    persistence.save(p, w, persistence.Save())
+    full = json.loads(persistence.SAVE_PATH.read_text())
+    incremental.pop("last_upkeep_tick")
+    full.pop("last_upkeep_tick")
+    assert incremental == full
+    assert full["ground"]["2000,3,3"]
+    assert full["monsters"]["2000,2,2"]["hp"] == 2
+
+
+def test_journal_appends_and_replays(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "JOURNAL_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = World()
+    w.year(2000)
+    p = Player()
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    snapshot = persistence.SAVE_PATH.read_text()
+
+    w.add_ground_item(2000, 4, 4, "ion_decay")
+    p.ions = 1234
+    persistence.save(p, w, save)
+    assert persistence.SAVE_PATH.read_text() == snapshot
+    lines = persistence.journal_path().read_text().splitlines()
+    assert len(lines) == 1
+
+    # A torn trailing record is ignored on replay.
+    with open(persistence.journal_path(), "a") as fh:
+        fh.write('{"base": 1, "ground": {"2000,5')
+    p2, ground, _monsters, _seeded, _ = persistence.load()
+    assert p2.ions == 1234
+    assert any(it["key"] == "ion_decay" for it in ground[(2000, 4, 4)])
+
+    persistence.checkpoint(p, w, save)
+    assert not persistence.journal_path().exists()
+    p3, ground3, _monsters, _seeded, _ = persistence.load()
+    assert p3.ions == 1234
+    assert ground3 == ground
+
+
+def test_save_writer_coalesces_snapshots(tmp_path, monkeypatch):
+    import threading
+
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    release = threading.Event()
+    writes: list[str] = []
+    real_write = persistence._atomic_write
+
+    def slow_write(path, text):
+        writes.append(text)
+        release.wait(5)
+        real_write(path, text)
+
+    monkeypatch.setattr(persistence, "_atomic_write", slow_write)
+    w = World()
+    w.year(2000)
+    p = Player()
+    save = persistence.Save()
+    persistence.start_writer()
+    try:
+        persistence.save(p, w, save)
+        for ions in range(1, 20):
+            p.ions = ions
+            persistence.save(p, w, save)
+        release.set()
+    finally:
+        persistence.stop_writer()
+    assert len(writes) <= 3
+    p2, *_ = persistence.load()
+    assert p2.ions == 19
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_failed_writes_skip_nothing_else_and_are_rewritten(
+    tmp_path, monkeypatch, caplog
+):
+    monkeypatch.setattr(persistence, "JOURNAL_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = World()
+    w.year(2000)
+    p = Player()
+    save = persistence.Save()
+    persistence.save(p, w, save)
+
+    # A failing op does not stop the ops queued behind it.
+    blocked = tmp_path / "file"
+    blocked.write_text("")
+    writer = persistence.start_writer()
+    try:
+        with writer._cond:  # hold the writer so both ops land in one batch
+            writer.submit(persistence._WriteOp("snapshot", blocked / "x", "{}"))
+            p.ions = 1234
+            persistence.save(p, w, save)
+        writer.flush()
+        assert persistence.load()[0].ions == 1234
+
+        # The next save reports the failure and writes everything again.
+        real_write = persistence._atomic_write
+        full_disk = [True]
+
+        def flaky_write(path, text):
+            if full_disk[0]:
+                raise OSError(f"disk full writing {path.name}")
+            real_write(path, text)
+
+        monkeypatch.setattr(persistence, "_atomic_write", flaky_write)
+        p.ions = 99
+        persistence.save(p, w, save)
+        writer.flush()
+        full_disk[0] = False
+        persistence.save(p, w, save)
+        assert caplog.text.count("save write failed") == 2
+    finally:
+        persistence.stop_writer()
+    assert not persistence.journal_path().exists()
+    assert persistence.load()[0].ions == 99
+
+
+def _debug_reset(p, w, save):
+    import contextlib
+    import io
+
+    from mutants2.cli.shell import make_context
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        make_context(p, w, save, dev=True).dispatch_line("debug reset")
+    return buf.getvalue()
+
+
+def test_debug_reset_removes_the_journal(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "JOURNAL_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = World()
+    w.year(2000)
+    p = Player()
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    p.ions = 1234
+    persistence.save(p, w, save)
+    assert persistence.journal_path().exists()
+
+    # The command's own save then starts over with a full snapshot.
+    assert "OK: save reset." in _debug_reset(p, w, save)
+    assert not persistence.journal_path().exists()
+    assert persistence.load()[0].ions == 1234
+
+    p.ions = 99
+    persistence.save(p, w, save)
+    assert persistence.reset(save)
+    assert list(tmp_path.iterdir()) == [] and save._written is None
+    assert not persistence.reset(save)
+
+
+def _sharded_world():
+    w = World()
+    w.year(2000)
+    w.year(2100)
+    w.add_ground_item(2100, 3, 3, "ion_decay")
+    w.place_monster(2100, 5, 5, "mutant")
+    return w
+
+
+def test_sharded_save_loads_centuries_on_first_visit(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "SHARD_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = _sharded_world()
+    mid = w.monster_here(2100, 5, 5)["id"]
+    persistence.save(Player(), w, persistence.Save())
+    assert persistence.shard_path(2100).exists()
+
+    p, ground, monsters, seeded, save = persistence.load()
+    assert ground == {} and monsters == {}
+    w2 = World(ground, seeded, monsters)
+    persistence.attach_world(w2, save)
+    assert not w2.is_loaded(2100)
+    assert mid in w2._id_alloc._taken
+
+    p.travel(w2, 2100)
+    assert w2.is_loaded(2100)
+    assert w2.ground[(2100, 3, 3)] == w.ground[(2100, 3, 3)]
+    assert w2.monster_here(2100, 5, 5)["id"] == mid
+
+
+def test_sharded_save_rewrites_only_changed_centuries(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "SHARD_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = _sharded_world()
+    p = Player()
+    save = persistence.Save()
+    persistence.save(p, w, save)
+
+    writes: list = []
+    real_write = persistence._atomic_write
+
+    def record(path, text):
+        writes.append(path)
+        real_write(path, text)
+
+    monkeypatch.setattr(persistence, "_atomic_write", record)
+    w.add_ground_item(2100, 4, 4, "nuclear_rock")
+    persistence.save(p, w, save)
+    assert writes == [persistence.shard_path(2100)]
+
+
+def test_sharded_save_folds_back_without_shard_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "SHARD_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = _sharded_world()
+    persistence.save(Player(), w, persistence.Save())
+
+    monkeypatch.setattr(persistence, "SHARD_MODE", False)
+    p, ground, monsters, seeded, save = persistence.load()
+    w2 = World(ground, seeded, monsters)
+    persistence.attach_world(w2, save)
+    assert w2.is_loaded(2100)
+    persistence.save(p, w2, save)
+    _p3, ground3, monsters3, *_ = persistence.load()
+    assert ground3[(2100, 3, 3)] == w.ground[(2100, 3, 3)]
+    assert (2100, 5, 5) in monsters3
+
+
+def test_reset_removes_every_century_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "SHARD_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = _sharded_world()
+    p = Player()
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    persistence.shard_path(1900).write_text("{}")  # from another era setting
+    (tmp_path / "save.notes.json").write_text("kept")
+
+    assert "OK: save reset." in _debug_reset(p, w, save)
+    assert not persistence.shard_path(1900).exists()
+    assert persistence.reset(save)
+    assert [f.name for f in tmp_path.iterdir()] == ["save.notes.json"]
+    assert save.shards == {}
+
+
+def test_delta_save_stores_only_changed_tiles(tmp_path, monkeypatch):
+    from mutants2.engine import gen
+
+    monkeypatch.setattr(persistence, "DELTA_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = World(global_seed=gen.SEED)
+    gen.seed_for_cli(w)
+    w.year(2000)
+    w.year(2100)
+    p = Player()
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    data = json.loads(persistence.SAVE_PATH.read_text())
+    assert data["ground"] == {} and data["monsters"] == {}
+
+    (yr, x, y), _items = next(iter(w.ground.items()))
+    w.clear_ground(yr, x, y)
+    w.add_ground_item(2000, 0, 0, "nuclear_rock")
+    mx, my, _m = next(w.monster_positions(2100))
+    w.damage_monster(2100, mx, my, 1)
+    persistence.save(p, w, save)
+    data = json.loads(persistence.SAVE_PATH.read_text())
+    assert data["ground"][f"{yr},{x},{y}"] == []
+    assert len(data["ground"]) <= 2 and len(data["monsters"]) == 1
+
+    _p, ground, monsters, *_ = persistence.load()
+    assert ground == dict(w.ground)
+    assert monsters == dict(w.monsters)
+
+
+def test_load_decodes_only_the_active_profile(tmp_path):
+    from mutants2.engine.state import CharacterProfile, ProfileSummary
+
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = World()
+    w.year(2000)
+    p = Player(clazz="thief")
+    p.level = 4
+    p.travel(w, 2100)
+    assert p.move("east", w)
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    p.clazz = "priest"
+    p.travel(w, 2000)
+    persistence.save(p, w, save)
+
+    data = json.loads(persistence.SAVE_PATH.read_text())
+    assert data["profile_index"]["thief"] == [4, 2100, 1, 0]
+    _p, *_rest, save2 = persistence.load()
+    assert isinstance(save2.profiles["priest"], CharacterProfile)
+    assert isinstance(save2.profiles["thief"], dict)
+    assert save2.profile_index["thief"] == ProfileSummary(4, 2100, 1, 0)
+
+
+def test_turn_batch_durability_defers_saves(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "DURABILITY", "turn-batch")
+    monkeypatch.setattr(persistence, "BATCH_TURNS", 3)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = World()
+    w.year(2000)
+    p = Player()
+    save = persistence.Save()
+    persistence.checkpoint(p, w, save)
+    for ions in (1, 2):
+        p.ions = ions
+        persistence.save(p, w, save)
+    assert persistence.load()[0].ions == 0
+    w.add_ground_item(2000, 4, 4, "ion_decay")
+    p.ions = 3
+    persistence.save(p, w, save)
+    p2, ground, *_ = persistence.load()
+    assert p2.ions == 3
+    assert (2000, 4, 4) in ground
+
+
+def test_exit_only_durability_writes_on_checkpoint(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "DURABILITY", "exit-only")
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = World()
+    w.year(2000)
+    p = Player()
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    assert not persistence.SAVE_PATH.exists()
+    p.ions = 7
+    persistence.checkpoint(p, w, save)
+    assert persistence.load()[0].ions == 7
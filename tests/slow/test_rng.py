@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+
+from mutants2.engine.rng import KeyedRandom, draw, hrand, unit
+
+
+def test_keyed_random_is_a_pure_function_of_key_and_counter():
+    a = hrand(42, 2000, "tag")
+    b = hrand(42, 2000, "tag")
+    assert [a.next64() for _ in range(5)] == b.batch(5)
+    assert a.counter == b.counter == 5
+    assert draw(a.key, 7) == KeyedRandom(a.key, 7).next64()
+    assert unit(a.key, 7) == KeyedRandom(a.key, 7).random()
+    assert hrand(42, 2000, "tag").next64() != hrand(42, 2100, "tag").next64()
+
+
+def test_keyed_random_helpers():
+    rng = hrand("helpers")
+    rolls = [rng.randrange(3, 9) for _ in range(500)]
+    assert set(rolls) == set(range(3, 9))
+    assert all(0.0 <= rng.random() < 1.0 for _ in range(100))
+    assert rng.randint(4, 4) == 4
+    items = list(range(50))
+    rng.shuffle(items)
+    assert sorted(items) == list(range(50)) and items != list(range(50))
+    picked = rng.sample(range(50), 10)
+    assert len(set(picked)) == 10
+    assert rng.choice("xyz") in "xyz"
+
+
+_PROBE = """
+import json
+from mutants2.engine import gen
+from mutants2.engine.rng import hrand
+from mutants2.engine.world import World
+
+w = World(global_seed=5)
+gen.seed_for_cli(w)
+w.year(2000)
+print(json.dumps({
+    "draws": hrand(5, "probe").batch(3),
+    "headers": [w.room_description(2000, x, 0) for x in range(-5, 5)],
+    "exits": list(w.year(2000).grid.exits),
+    "ground": sorted(f"{k}:{[i['key'] for i in v]}" for k, v in w.ground.items()),
+    "monsters": sorted(f"{k}:{[m['id'] for m in v]}" for k, v in w.monsters.items()),
+}))
+"""
+
+
+def test_results_do_not_depend_on_the_hash_seed():
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    outputs = []
+    for hash_seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed, PYTHONPATH=root)
+        proc = subprocess.run(
+            [sys.executable, "-c", _PROBE],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        outputs.append(json.loads(proc.stdout))
+    assert outputs[0] == outputs[1]
+    assert len(set(outputs[0]["headers"])) > 1
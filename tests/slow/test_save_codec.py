@@ -0,0 +1,102 @@
+from mutants2.engine import gen, persistence, save_codec
+from mutants2.engine.player import Player
+from mutants2.engine.world import World
+
+
+def _populated_world():
+    w = World()
+    w.year(2000)
+    w.add_ground_item(2000, 1, 1, "ion_decay")
+    w.add_ground_item(2000, 1, 1, "nuclear_rock")
+    w.add_ground_item(2000, -3, 7, "skull")
+    w.ground[(2000, -3, 7)][0]["monster_type"] = "mutant"
+    w.add_ground_item(2100, 2, 2, "ion_decay")
+    w.ground[(2100, 2, 2)][0]["enchant"] = 3
+    w.place_monster(2000, 4, 4, "mutant")
+    w.place_monster(2000, 4, 4, "mutant")
+    mon = w.monster_here(2000, 4, 4)
+    assert mon is not None
+    mon["hp"] = 1
+    mon["aggro"] = True
+    mon["seen"] = True
+    mon["loot_ions"] = 25
+    return w
+
+
+def _save_and_load(tmp_path, codec, monkeypatch):
+    monkeypatch.setattr(persistence, "SAVE_CODEC", codec)
+    persistence.SAVE_PATH = tmp_path / codec / "save.json"
+    w = _populated_world()
+    p = Player(year=2000, clazz="Warrior")
+    p.ions = 77
+    persistence.save(p, w, persistence.Save())
+    return persistence.SAVE_PATH.read_bytes(), persistence.load()
+
+
+def test_coordinates_round_trip():
+    keys = [(2000, 0, 0), (3000, -15, 14), (2100, 32767, -32768)]
+    ground = {key: [{"key": "ion_decay"}] for key in keys}
+    _head, decoded, _monsters = save_codec.decode(save_codec.encode({}, {}, ground, {}))
+    assert list(decoded) == keys
+
+
+def test_binary_snapshot_loads_like_json(tmp_path, monkeypatch):
+    json_blob, from_json = _save_and_load(tmp_path, "json", monkeypatch)
+    bin_blob, from_bin = _save_and_load(tmp_path, "binary", monkeypatch)
+
+    assert save_codec.is_binary(bin_blob)
+    assert not save_codec.is_binary(json_blob)
+    assert len(bin_blob) < len(json_blob)
+
+    p_json, ground_json, monsters_json, seeded_json, _ = from_json
+    p_bin, ground_bin, monsters_bin, seeded_bin, _ = from_bin
+    assert ground_bin == ground_json
+    assert monsters_bin == monsters_json
+    assert seeded_bin == seeded_json
+    assert p_bin.ions == p_json.ions == 77
+    assert p_bin.clazz == p_json.clazz
+
+
+def test_binary_saves_journal_changes_until_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "SAVE_CODEC", "binary")
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = _populated_world()
+    p = Player(year=2000, clazz="Warrior")
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    snapshot = persistence.SAVE_PATH.read_bytes()
+
+    w.add_ground_item(2000, 6, 6, "skull")
+    persistence.save(p, w, save)
+    assert persistence.SAVE_PATH.read_bytes() == snapshot
+    assert len(persistence.journal_path().read_text().splitlines()) == 1
+    assert persistence.load()[1][(2000, 6, 6)] == w.ground[(2000, 6, 6)]
+
+    persistence.checkpoint(p, w, save)
+    assert not persistence.journal_path().exists()
+    assert save_codec.is_binary(persistence.SAVE_PATH.read_bytes())
+    assert persistence.load()[1] == dict(w.ground)
+
+
+def test_binary_one_tile_saves_only_grow_the_journal(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "SAVE_CODEC", "binary")
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = World(global_seed=gen.SEED)
+    gen.seed_for_cli(w)
+    for year in w.config.centuries:
+        w.year(year)
+    p = Player(year=2000, clazz="Warrior")
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    snapshot = persistence.SAVE_PATH.read_bytes()
+
+    sizes = []
+    for x in range(-3, 3):
+        w.add_ground_item(2000, x, 2, "nuclear_rock")
+        persistence.save(p, w, save)
+        assert persistence.SAVE_PATH.read_bytes() == snapshot
+        sizes.append(persistence.journal_path().stat().st_size)
+    assert sizes == sorted(sizes) and len(set(sizes)) == len(sizes)
+    # Each entry holds only the changed tile, never the whole world.
+    assert max(b - a for a, b in zip([0, *sizes], sizes)) < len(snapshot) // 10
+    assert persistence.load()[1] == dict(w.ground)
@@ -0,0 +1,124 @@
+import sqlite3
+
+from mutants2.engine import persistence
+from mutants2.engine.player import Player
+from mutants2.engine.world import World
+
+
+def _world():
+    w = World()
+    w.year(2000)
+    for _ in range(7):
+        w.add_ground_item(2000, 2, 2, "ion_decay")
+    w.add_ground_item(2000, 3, 3, "skull")
+    w.ground[(2000, 3, 3)][0]["monster_type"] = "mutant"
+    w.place_monster(2000, 4, 4, "mutant")
+    return w
+
+
+def test_sqlite_round_trip_matches_world(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "SQLITE_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = _world()
+    p = Player(year=2000, clazz="Warrior")
+    p.ions = 42
+    persistence.save(p, w, persistence.Save())
+
+    assert not persistence.SAVE_PATH.exists()
+    with sqlite3.connect(persistence.db_path()) as conn:
+        crowded = conn.execute(
+            "SELECT year, x, y FROM ground GROUP BY year, x, y HAVING COUNT(*) > 6"
+        ).fetchall()
+    assert crowded == [(2000, 2, 2)]
+
+    p2, ground, monsters, *_ = persistence.load()
+    assert p2.ions == 42
+    assert ground == dict(w.ground)
+    assert monsters == dict(w.monsters)
+
+
+def test_sqlite_save_updates_changed_tiles(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "SQLITE_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = _world()
+    p = Player(year=2000, clazz="Warrior")
+    save = persistence.Save()
+    persistence.save(p, w, save)
+
+    w.clear_ground(2000, 2, 2)
+    w.add_ground_item(2000, 5, 5, "nuclear_rock")
+    w.damage_monster(2000, 4, 4, 1)
+    ops: list = []
+    real_submit = persistence._submit
+
+    def record(op):
+        ops.append(op)
+        real_submit(op)
+
+    monkeypatch.setattr(persistence, "_submit", record)
+    persistence.save(p, w, save)
+
+    assert [op.kind for op in ops] == ["update"]
+    assert set(ops[0].tiles) == {(2000, 2, 2), (2000, 5, 5), (2000, 4, 4)}
+    _p, ground, monsters, *_ = persistence.load()
+    assert ground == dict(w.ground)
+    assert monsters == dict(w.monsters)
+
+
+def test_sqlite_updates_reuse_one_connection(tmp_path, monkeypatch):
+    from mutants2.engine import save_sqlite
+
+    monkeypatch.setattr(persistence, "SQLITE_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = _world()
+    p = Player(year=2000, clazz="Warrior")
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    conn = save_sqlite._connections[persistence.db_path()]
+    statements: list[str] = []
+    conn.set_trace_callback(statements.append)
+
+    for n in range(3):
+        w.add_ground_item(2000, n, 5, "nuclear_rock")
+        persistence.save(p, w, save)
+    assert save_sqlite._connections[persistence.db_path()] is conn
+    assert statements and not any("CREATE" in s for s in statements)
+
+    persistence.reset(save)
+    assert persistence.db_path() not in save_sqlite._connections
+
+
+def test_file_save_replaces_sqlite_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "SQLITE_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = _world()
+    persistence.save(Player(year=2000, clazz="Warrior"), w, persistence.Save())
+
+    monkeypatch.setattr(persistence, "SQLITE_MODE", False)
+    p, ground, monsters, seeded, save = persistence.load()
+    persistence.save(p, World(ground, seeded, monsters), save)
+    assert persistence.SAVE_PATH.exists()
+    assert not persistence.db_path().exists()
+    assert persistence.load()[1] == dict(w.ground)
+
+
+def test_debug_reset_removes_the_database(tmp_path, monkeypatch):
+    import contextlib
+    import io
+
+    from mutants2.cli.shell import make_context
+
+    monkeypatch.setattr(persistence, "SQLITE_MODE", True)
+    persistence.SAVE_PATH = tmp_path / "save.json"
+    w = _world()
+    p = Player(year=2000, clazz="Warrior")
+    save = persistence.Save()
+    persistence.save(p, w, save)
+    assert not persistence.SAVE_PATH.exists()
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        make_context(p, w, save, dev=True).dispatch_line("debug reset")
+    assert "OK: save reset." in buf.getvalue()
+    assert persistence.reset(save)
+    assert list(tmp_path.iterdir()) == []
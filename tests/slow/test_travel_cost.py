@@ -5,7 +5,7 @@ from io import StringIO
 
 from mutants2.cli.shell import make_context
 from mutants2.engine import persistence
-from mutants2.engine.world import World
+from mutants2.engine.world import World, WorldConfig
 from mutants2.engine.player import Player
 from mutants2.ui.theme import yellow
 
@@ -16,8 +16,9 @@ def run(
     ions: int = 0,
     start_year: int = 2000,
     start_pos: tuple[int, int] = (0, 0),
+    config: WorldConfig | None = None,
 ):
-    w = World()
+    w = World(config=config)
     w.year(start_year)
     p = Player(year=start_year, ions=ions)
     p.positions[start_year] = start_pos
@@ -55,3 +56,14 @@ def test_same_century_travel_free_and_resets_position():
     assert yellow("ZAAAAPPPPP!! You've been sent to the year 2700 A.D.") in out
     assert p.ions == 5_000
     assert p.positions[2700] == (0, 0)
+
+
+def test_travel_bounds_follow_the_world_config():
+    config = WorldConfig(eras=3)
+    out, p = run(["travel 2300"], ions=20_000, config=config)
+    assert "You can only travel from year 2000 to 2200!" in out
+    assert p.year == 2000 and p.ions == 20_000
+
+    out, p = run(["travel 2150"], ions=20_000, config=config)
+    assert yellow("ZAAAAPPPPP!! You've been sent to the year 2100 A.D.") in out
+    assert p.year == 2100
@@ -12,3 +12,36 @@ def test_world_maps_have_origin_and_exits():
         assert neighbors
         for nx, ny in neighbors.values():
             assert GRID_MIN <= nx < GRID_MAX and GRID_MIN <= ny < GRID_MAX
+
+
+def test_year_counters_follow_mutations():
+    w = World()
+    w.add_ground_item(2000, 1, 1, "ion_decay")
+    w.add_ground_item(2000, 1, 1, "nuclear_rock")
+    w.add_ground_item(2100, 2, 2, "ion_decay")
+    w.place_monster(2000, 3, 3, "mutant")
+    w.place_monster(2000, 3, 3, "mutant")
+    w.place_monster(2100, 4, 4, "mutant")
+    w.remove_ground_item(2000, 1, 1, "ion_decay")
+    w.remove_monster(2000, 3, 3)
+    w.clear_ground(2100, 2, 2)
+
+    for year in (2000, 2100):
+        assert w.ground_items_count(year) == sum(
+            len(v) for (yr, _, _), v in w.ground.items() if yr == year
+        )
+        assert w.monster_count(year) == sum(
+            len(v) for (yr, _, _), v in w.monsters.items() if yr == year
+        )
+    assert w.ground_items_count(2000) == 1 and w.ground_items_count(2100) == 0
+    assert w.monster_count(2000) == 1 and w.monster_count(2100) == 1
+    assert list(w.monster_positions(2100)) == [(4, 4, w.monster_here(2100, 4, 4))]
+    assert w.known_years() == [2000]
+
+
+def test_packed_cell_keys_round_trip():
+    from mutants2.engine.world import pack_cell, unpack_cell
+
+    for cell in [(0, 0), (GRID_MIN, GRID_MAX - 1), (-9000, 9000)]:
+        assert unpack_cell(pack_cell(*cell)) == cell
+    assert len({pack_cell(x, y) for x in range(-3, 3) for y in range(-3, 3)}) == 36